@@ -0,0 +1,101 @@
+'''
+[COLLISION BENCHMARK]:
+This script compares - for boards of increasing dimensions (so borders of
+increasing length) and increasing numbers of players - the time spent per tick
+moving the players and reverting the movements which collide:
+
+    1) "linear" => the previous approach: each player gets tested against the
+                   list of its blocking colliders (every side tile of the borders
+                   and every other player) with "Entity.check_collisions".
+    2) "hash"   => each player gets tested against the colliders in the cells
+                   of its hitbox ("SpatialHash.collides_any"), and it updates its
+                   cells in the spatial hash when it moves (what the simulation
+                   does).
+
+The players move randomly (as in "GameSimulation.update_players_movement"),
+and both approaches get checked to end up with the players in the same
+positions. It has to be run from the "game_logic" folder:
+
+    python -m benchmarks.collision_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The benchmark can run headless
+
+import random
+import time
+import pygame
+from modules.scripts import common_definitions as cmndef
+from modules.game_simulation import GameSimulation
+from modules.entities.player import Player
+from modules.enumerations.direction import Direction
+
+# [DIMENSIONS OF THE BENCHMARKED BOARDS, AND NUMBERS OF PLAYERS]
+BOARD_SIZES = [8, 16, 32, 64]
+PLAYERS_NUMS = [4, 16, 64, 255]
+
+# [NUMBER OF TICKS TIMED FOR EACH COMBINATION]
+TICKS_NUM = 200
+
+
+# [Function which plays the ticks with one of the two approaches => average time per tick (in microseconds), final positions]
+def benchmark(board_size, players_num, approach):
+    random.seed(0)
+    board_dimensions = (board_size, board_size)
+    simulation = GameSimulation(board_dimensions, cmndef.get_board_grid_position(board_dimensions), players_num=players_num,
+                                detects_players=False)
+
+    for player_idx in range(players_num):
+        simulation.players.append(Player(simulation.starting_positions[player_idx], player_idx + 1, None))
+    simulation.update_game_phase()      # The players get inserted in the spatial hash
+
+    # The movements are given by the benchmark => the threads which dequeue the
+    # gyroscope readings get stopped (they'd wake up 60 times a second each)
+    for player in simulation.players:
+        player.receiver_stop_event.set()
+        player.dequeueing_thread.join()
+
+    players = simulation.players
+    if approach == "linear":
+        side_tiles = [side_tile for direction in [Direction.UP, Direction.RIGHT, Direction.DOWN, Direction.LEFT]
+                      for side_tile in simulation.pogo_board.board_borders['side_tiles'][direction.value]]
+        blocking_colliders = {player: side_tiles + [p for p in players if p != player] for player in players}
+        for player in players:
+            player.spatial_hash = None
+
+    elapsed_time = 0
+    for _ in range(TICKS_NUM):
+        movements = [(random.uniform(-7.5, 7.5), random.uniform(-7.5, 7.5)) for _ in players]
+
+        start_time = time.perf_counter()
+        for player, movement in zip(players, movements):
+            player.update_position(movement)
+
+        for player, movement in zip(players, movements):
+            if approach == "linear":
+                collides = player.check_collisions(blocking_colliders[player])
+            else:
+                collides = simulation.colliders_hash.collides_any(player.hitbox, player)
+
+            if collides:
+                player.update_position((-movement[0], -movement[1]))
+        elapsed_time += time.perf_counter() - start_time
+
+    return elapsed_time / TICKS_NUM * 1e6, [player.screen_position for player in players]
+
+
+if __name__ == "__main__":
+    print(f"{'BOARD':<10}{'PLAYERS':>8}{'LINEAR (us)':>14}{'HASH (us)':>12}{'SPEEDUP':>10}")
+    for board_size in BOARD_SIZES:
+        for players_num in PLAYERS_NUMS:
+            if players_num > board_size * board_size:
+                continue    # The players don't fit on the board
+
+            linear_time, linear_positions = benchmark(board_size, players_num, "linear")
+            hash_time, hash_positions = benchmark(board_size, players_num, "hash")
+            assert linear_positions == hash_positions, "the two approaches moved the players differently"
+
+            print(f"{f'{board_size}x{board_size}':<10}{players_num:>8}{linear_time:>14.1f}{hash_time:>12.1f}{linear_time / hash_time:>9.1f}x")
+
+    pygame.quit()
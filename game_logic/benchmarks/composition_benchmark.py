@@ -0,0 +1,111 @@
+'''
+[COMPOSITION BENCHMARK]:
+This script measures the time spent composing the off-screen layers at the end
+of a game loop iteration, serially and in parallel (with the "LayerCompositor"),
+in the worst case in which all of them have to be composed again at the same
+time:
+
+    1) The four scorers' panels and "power up" slots (their scores change).
+    2) The board's surface (some tiles get acquired).
+    3) The timer (a new string - not memoized - gets composed).
+
+It also checks that the two compositions produce the very same surfaces (the
+output mustn't depend on how the lanes get scheduled).
+
+The speedup depends on the number of CPUs (with a single CPU, the parallel
+composition can only be slower, given the overhead of the pool): it has to be
+run from the "game_logic" folder:
+
+    python -m benchmarks.composition_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The benchmark can run headless
+
+import random
+import time
+import pygame
+from modules import assets
+from modules import sprite_registry
+from modules import numeric_renderer
+from modules.scripts import common_definitions as cmndef
+from modules.pogo_board import PogoBoard
+from modules.static_layer import StaticLayer
+from modules.player_scorer import PlayerScorer
+from modules.layer_compositor import LayerCompositor
+from modules.entities.player import Player
+
+FRAMES_NUM = 200
+ACQUIRED_TILES_PER_FRAME = 4
+WORKERS_NUM = 3
+
+
+# [Stand-in for the players (the scorers only read these attributes)]
+class ScoredPlayer():
+    SCORE_THRESHOLDS = Player.SCORE_THRESHOLDS
+
+    def __init__(self, player_id):
+        self.player_id = player_id
+        self.score = 0
+        self.active_leds_num = 0
+        self.has_power_up = True
+        self.power_up_validity = 15
+
+
+# [Function which composes "FRAMES_NUM" frames => it returns the average time per
+#  frame (in ms) and the bytes of the composed surfaces (to compare the outputs)]
+def benchmark(layer_compositor):
+    random.seed(0)
+
+    pogo_board = PogoBoard((8,8), (9,5))
+    pogo_board.attach_static_layer(StaticLayer(pogo_board))
+
+    players = [ScoredPlayer(player_id) for player_id in range(1, 5)]
+    scorers = [PlayerScorer(player) for player in players]
+    timer_font = numeric_renderer.get_timer_font()
+
+    elapsed_time = 0
+    for frame_idx in range(FRAMES_NUM):
+        # Every layer changes
+        for player in players:
+            player.score = (player.score + random.randint(1, 9)) % 50
+            player.power_up_validity = 15 - frame_idx % 16
+        for _ in range(ACQUIRED_TILES_PER_FRAME):
+            pogo_board.pogo_tiles[random.randint(0,7)][random.randint(0,7)].change_acquisition(random.randint(0,4))
+        timer_string = numeric_renderer.get_timer_string(frame_idx % 121)
+
+        hud_lane = []
+        for scorer in scorers:
+            hud_lane += [scorer.compute_surface, scorer.compute_power_up_surface]
+
+        start_time = time.perf_counter()
+        results = layer_compositor.compose([hud_lane,
+                                            [pogo_board.compute_surfaces],
+                                            [lambda: timer_font.compose(timer_string)]])
+        elapsed_time += time.perf_counter() - start_time
+
+    composed_surfaces = [pogo_board.surface, results[2][0]]
+    composed_surfaces += [scorer.surface for scorer in scorers] + [scorer.power_up_surface for scorer in scorers]
+    return elapsed_time / FRAMES_NUM * 1000, [pygame.image.tobytes(surface, "RGBA") for surface in composed_surfaces]
+
+
+if __name__ == "__main__":
+    pygame.display.init()
+    pygame.display.set_mode(cmndef.base_game_size)
+    assets.convert_loaded_images()
+    sprite_registry.reload_sprite_tables()
+
+    serial_time, serial_output = benchmark(LayerCompositor(parallel=False))
+
+    parallel_compositor = LayerCompositor(parallel=True, max_workers=WORKERS_NUM)
+    parallel_time, parallel_output = benchmark(parallel_compositor)
+    parallel_compositor.shutdown()
+
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'COMPOSITION':<24}{'TIME/FRAME (ms)':>16}")
+    print(f"{'serial':<24}{serial_time:>16.3f}")
+    print(f"{f'parallel ({WORKERS_NUM} threads)':<24}{parallel_time:>16.3f}")
+    print(f"Speedup: {serial_time / parallel_time:.2f}x - identical output: {serial_output == parallel_output}")
+
+    pygame.quit()
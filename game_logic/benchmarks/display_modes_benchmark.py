@@ -0,0 +1,116 @@
+'''
+[DISPLAY MODES BENCHMARK]:
+This script measures the time spent pushing the frames to the display (by the
+"DirtyRectRenderer") in each of the display modes of the game:
+
+    1) "windowed"          => 640x360 window (no scaling)
+    2) "scaled"            => 640x360 window with the "SCALED" flag (SDL scales it)
+    3) "fullscreen"        => 1280x720 fullscreen (2x integer scaling by the game)
+    4) "fullscreen scaled" => 640x360 fullscreen with the "SCALED" flag
+    5) "non-integer"       => 1366x768 window (non-integer scaling by the game)
+
+The workload emulates the game session: four player-sized sprites and the timer
+change at every frame, and the whole frame gets pushed once every 60 frames. For
+the modes in which the game scales the frames, the time of the previous scaling
+strategy ("pygame.transform.scale" allocating a new surface for every scaled
+area) gets reported too.
+
+It has to be run from the "game_logic" folder (with "SDL_VIDEODRIVER=dummy",
+the modes can be benchmarked headless - but the "SCALED" modes will fall
+back to a software renderer):
+
+    python -m benchmarks.display_modes_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+import random
+import time
+from modules.scripts import common_definitions as cmndef
+from modules.dirty_rect_renderer import DirtyRectRenderer
+
+# [BENCHMARKED MODES] => (name, display size, flags)
+DISPLAY_MODES = [("windowed", cmndef.base_game_size, 0),
+                 ("scaled", cmndef.base_game_size, pygame.SCALED),
+                 ("fullscreen", cmndef.fullscreen_game_size, pygame.FULLSCREEN),
+                 ("fullscreen scaled", cmndef.base_game_size, pygame.FULLSCREEN | pygame.SCALED),
+                 ("non-integer", (1366, 768), 0)]
+
+FRAMES_NUM = 600
+FULL_UPDATE_PERIOD = 60
+
+
+# [Function which presents the frame with the previous scaling strategy]
+def legacy_present(renderer, game_surface, screen, dirty_rects, full_update):
+    if full_update:
+        screen.blit(pygame.transform.scale(game_surface, screen.get_size()), (0,0))
+        pygame.display.flip()
+    else:
+        display_rects = []
+        for rect in dirty_rects:
+            display_rect = renderer.to_display_rect(rect, screen.get_size())
+            screen.blit(pygame.transform.scale(game_surface.subsurface(rect), display_rect.size), display_rect.topleft)
+            display_rects.append(display_rect)
+        pygame.display.update(display_rects)
+
+
+# [Function which returns the dirty rects of a frame (four players and the timer)]
+def get_frame_rects(frame_idx):
+    rects = [pygame.Rect(200 + 40*i + (frame_idx*3 + 17*i) % 120, 100 + (frame_idx*2 + 31*i) % 150, 38, 50) for i in range(4)]
+    rects.append(pygame.Rect(222, 20, 176, 100))
+    return rects
+
+
+# [Function which benchmarks a display mode => it returns the average and the 95th percentile (in ms)]
+def benchmark_mode(display_size, flags, use_legacy_strategy):
+    screen = pygame.display.set_mode(display_size, flags)
+
+    game_surface = pygame.Surface(cmndef.base_game_size).convert()
+    for _ in range(200):
+        game_surface.fill([random.randint(0,255) for _ in range(3)],
+                          (random.randint(0,600), random.randint(0,330), random.randint(8,80), random.randint(8,80)))
+
+    renderer = DirtyRectRenderer(cmndef.base_game_size)
+
+    frame_times = []
+    for frame_idx in range(FRAMES_NUM):
+        full_update = frame_idx % FULL_UPDATE_PERIOD == 0
+        dirty_rects = get_frame_rects(frame_idx)
+
+        start_time = time.perf_counter()
+        if use_legacy_strategy:
+            legacy_present(renderer, game_surface, screen, DirtyRectRenderer.merge_rects(dirty_rects), full_update)
+        else:
+            if full_update:
+                renderer.request_full_update()
+            renderer.add_rects(dirty_rects)
+            renderer.present(game_surface, screen)
+        frame_times.append(time.perf_counter() - start_time)
+
+        pygame.event.pump()
+
+    frame_times.sort()
+    return (sum(frame_times) / len(frame_times) * 1000, frame_times[int(len(frame_times) * 0.95)] * 1000)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    random.seed(0)
+
+    print(f"{'MODE':<20}{'DISPLAY':>12}{'AVG (ms)':>10}{'P95 (ms)':>10}{'LEGACY AVG':>12}{'LEGACY P95':>12}")
+    for name, display_size, flags in DISPLAY_MODES:
+        try:
+            average, p95 = benchmark_mode(display_size, flags, False)
+        except pygame.error as error:
+            print(f"{name:<20}{'unavailable':>12} ({error})")
+            continue
+
+        display_size = pygame.display.get_surface().get_size()
+        legacy = ""
+        if display_size != cmndef.base_game_size:
+            legacy_average, legacy_p95 = benchmark_mode(display_size, flags, True)
+            legacy = f"{legacy_average:>12.3f}{legacy_p95:>12.3f}"
+
+        print(f"{name:<20}{f'{display_size[0]}x{display_size[1]}':>12}{average:>10.3f}{p95:>10.3f}{legacy}")
+
+    pygame.quit()
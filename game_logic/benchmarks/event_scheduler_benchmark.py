@@ -0,0 +1,78 @@
+'''
+[EVENT SCHEDULER BENCHMARK]:
+This script compares - for increasing numbers of pending timers (from the few
+ones of a match, up to thousands of them) - the time spent per tick on the
+timers of the power ups:
+
+    1) "polling"   => the previous approach: at every tick, the time left of each
+                      timer gets computed again, and the ones which have run out
+                      get handled.
+    2) "scheduler" => the timers are events of an "EventScheduler", and each tick
+                      only calls the callbacks of the events which are due (what
+                      the simulation does).
+
+Each timer lasts between 1 and 15 seconds, and it starts again as soon as it
+runs out (as the spawns of the power ups and the countdowns of the power ups
+held by the players do), and both approaches get checked to handle the same
+number of timers. It has to be run from the "game_logic" folder:
+
+    python -m benchmarks.event_scheduler_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import random
+import time
+from modules.event_scheduler import EventScheduler
+
+# [NUMBERS OF PENDING TIMERS]
+TIMERS_NUMS = [4, 64, 1024, 16384]
+
+# [NUMBER OF TICKS TIMED (60 seconds at 60 ticks per second)]
+TICKS_NUM = 3600
+TICK_DURATION = 1000 / 60
+
+
+# [Function which plays the ticks with one of the two approaches => average time per tick (in microseconds), handled timers]
+def benchmark(timers_num, approach):
+    random.seed(0)
+    durations = [random.randint(1000, 15000) for _ in range(timers_num)]
+    handled_timers = [0]
+
+    if approach == "polling":
+        # "[start time, duration]" of each timer
+        timers = [[0, duration] for duration in durations]
+    else:
+        scheduler = EventScheduler()
+
+        def restart_timer(due_time, duration):
+            handled_timers[0] += 1
+            scheduler.schedule(due_time + duration, restart_timer, due_time + duration, duration)
+
+        for duration in durations:
+            scheduler.schedule(duration, restart_timer, duration, duration)
+
+    start_time = time.perf_counter()
+    for tick in range(1, TICKS_NUM + 1):
+        current_time = tick * TICK_DURATION
+        if approach == "polling":
+            for timer in timers:
+                time_left = timer[1] - (current_time - timer[0])
+                if time_left <= 0:
+                    handled_timers[0] += 1
+                    timer[0] += timer[1]
+        else:
+            scheduler.run_due_events(current_time)
+    elapsed_time = time.perf_counter() - start_time
+
+    return elapsed_time / TICKS_NUM * 1e6, handled_timers[0]
+
+
+if __name__ == "__main__":
+    print(f"{'TIMERS':<10}{'DUE/TICK':>10}{'POLLING (us)':>15}{'SCHEDULER (us)':>17}{'SPEEDUP':>10}")
+    for timers_num in TIMERS_NUMS:
+        polling_time, polling_handled = benchmark(timers_num, "polling")
+        scheduler_time, scheduler_handled = benchmark(timers_num, "scheduler")
+        assert polling_handled == scheduler_handled, "the two approaches handled different timers"
+
+        print(f"{timers_num:<10}{scheduler_handled / TICKS_NUM:>10.2f}{polling_time:>15.1f}{scheduler_time:>17.1f}"
+              f"{polling_time / scheduler_time:>9.1f}x")
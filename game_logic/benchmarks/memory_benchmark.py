@@ -0,0 +1,111 @@
+'''
+[MEMORY BENCHMARK]:
+This script measures the memory held by the entities of "pogo boards" of
+increasing size (from 8x8 up to 128x128 tiles), and reports - for each board:
+
+    1) The number of entities (tiles and borders) and the number of objects
+       tracked by the garbage collector which have been created by the board.
+    2) The bytes allocated by the Python interpreter to build the board
+       (measured with "tracemalloc") and the bytes per entity.
+    3) The RSS (resident set size) of the process after the board has been
+       built ("n/a" on the platforms where it can't be read).
+    4) The number of distinct surfaces referenced by the entities, which -
+       thanks to the shared sprite tables - doesn't depend on the board size.
+
+It has to be run from the "game_logic" folder:
+
+    python -m benchmarks.memory_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The benchmark can run headless
+
+import gc
+import tracemalloc
+import pygame
+from modules import assets
+from modules import sprite_registry
+from modules.scripts import common_definitions as cmndef
+from modules.pogo_board import PogoBoard
+from modules.entities.entity import Entity
+
+# [SIZES OF THE BENCHMARKED BOARDS]
+BOARD_SIZES = [8, 16, 32, 64, 128]
+
+
+# [Function which returns the RSS of the process (in bytes), or "None" if it can't be read]
+def get_rss_bytes():
+    # [LINUX] => current RSS
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    # [OTHER UNIX SYSTEMS] => peak RSS (in kilobytes on Linux, in bytes on macOS)
+    try:
+        import resource
+        import sys
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+    except ImportError:
+        return None
+
+
+# [Function which returns all the entities of a board]
+def get_board_entities(pogo_board):
+    entities = [tile for tile_row in pogo_board.pogo_tiles for tile in tile_row]
+    entities += [side_tile for tile_row in pogo_board.board_borders['side_tiles'] for side_tile in tile_row]
+    entities += pogo_board.board_borders['angle_blocks']
+    return entities
+
+
+# [Function which builds a board and measures the memory it holds]
+def measure_board(board_size):
+    '''
+    [RETURN]:
+    "measures" : dictionary with the measures described at the top of this module
+    '''
+    gc.collect()
+    objects_before = len(gc.get_objects())
+
+    tracemalloc.start()
+    pogo_board = PogoBoard((board_size, board_size), (9,5))
+    allocated_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    gc.collect()
+    entities = get_board_entities(pogo_board)
+
+    return {"board"     : f"{board_size}x{board_size}",
+            "entities"  : len(entities),
+            "objects"   : len(gc.get_objects()) - objects_before,
+            "allocated" : allocated_bytes,
+            "per_entity": allocated_bytes / len(entities),
+            "rss"       : get_rss_bytes(),
+            "surfaces"  : len({id(entity.surface) for entity in entities}),
+            "has_dict"  : any(hasattr(entity, "__dict__") for entity in entities)}
+
+
+if __name__ == "__main__":
+    pygame.display.set_mode(cmndef.base_game_size)
+    assets.convert_loaded_images()
+    sprite_registry.reload_sprite_tables()
+
+    # The sprite tables get loaded before the measures, so that
+    # the (one-off) decoding of the images doesn't get counted
+    PogoBoard((8,8), (9,5))
+    gc.collect()
+
+    print(f"Entity slots: {Entity.__slots__}")
+    print(f"{'BOARD':>9}{'ENTITIES':>10}{'GC OBJECTS':>12}{'ALLOCATED':>12}{'B/ENTITY':>10}{'RSS (MB)':>10}{'SURFACES':>10}{'__dict__':>10}")
+
+    for board_size in BOARD_SIZES:
+        measures = measure_board(board_size)
+        rss = f"{measures['rss'] / 2**20:.1f}" if measures['rss'] != None else "n/a"
+
+        print(f"{measures['board']:>9}{measures['entities']:>10}{measures['objects']:>12}{measures['allocated']:>12}"
+              f"{measures['per_entity']:>10.0f}{rss:>10}{measures['surfaces']:>10}{str(measures['has_dict']):>10}")
+
+    print(f"Surfaces held by the assets manager: {len(assets.LOADED_SURFACES) + len(assets.ROTATED_SURFACES)}")
@@ -0,0 +1,112 @@
+'''
+[PIPELINE BENCHMARK]:
+This script compares the time spent per frame by the game loop when the ticks
+of the simulation are executed:
+
+    1) "serial"    => on the main thread, right before the frame gets drawn (as
+                      the game did before the "SimulationPipeline").
+    2) "pipelined" => on the thread of the "SimulationPipeline", while the frame
+                      of the previous tick gets drawn by the main thread.
+
+Four players (without a controller: their gyroscope readings are random) move
+on the board and acquire its tiles, and each frame gets drawn from the snapshot
+of its tick by the software backend (board, players and dirty rects). The
+frames are spaced by a tick, so that one tick gets simulated per frame.
+
+The gain depends on the number of CPUs (the simulation and the render stage
+only run at the same time while pygame blits, with the GIL released): it has
+to be run from the "game_logic" folder:
+
+    python -m benchmarks.pipeline_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The benchmark can run headless
+
+import random
+import time
+import pygame
+from modules import assets
+from modules import sprite_registry
+from modules.scripts import common_definitions as cmndef
+from modules.pogo_board import PogoBoard
+from modules.static_layer import StaticLayer
+from modules.render_list import RenderList
+from modules.game_simulation import GameSimulation
+from modules.simulation_pipeline import SimulationPipeline
+from modules.fixed_timestep import FixedTimestep
+from modules.render_backends.software_backend import SoftwareBackend
+from modules.enumerations.render_layer import RenderLayer
+from modules.entities.player import Player
+
+FRAMES_NUM = 600
+
+
+# [Function which instantiates a simulation with four players without a controller]
+def create_simulation():
+    # No controller gets detected
+    simulation = GameSimulation((8,8), (9,5), detects_players=False)
+
+    for player_idx in range(4):
+        simulation.players.append(Player(simulation.starting_positions[player_idx], player_idx + 1, None))
+    return simulation
+
+
+# [Function which runs "FRAMES_NUM" frames => average time per frame (in ms)]
+def benchmark(render_backend, pipelined):
+    random.seed(0)
+
+    simulation = create_simulation()
+    timestep = FixedTimestep()
+    simulation_pipeline = SimulationPipeline(simulation, timestep, pipelined)
+
+    pogo_board = PogoBoard((8,8), (9,5))
+    pogo_board.attach_static_layer(StaticLayer(pogo_board))
+    render_list = RenderList()
+    render_backend.request_full_update()
+
+    elapsed_time = 0
+    for frame_idx in range(FRAMES_NUM):
+        # The gyroscope readings change
+        for player in simulation.players:
+            player.gyro_buffer = (random.uniform(-1, 1), random.uniform(-1, 1))
+
+        start_time = time.perf_counter()
+        _, snapshot, _ = simulation_pipeline.next_frame(frame_idx * timestep.tick_duration)
+
+        pogo_board.apply_tile_owners(snapshot.tile_owners)
+        if len(pogo_board.dirty_tiles) > 0:
+            render_backend.add_rects(pogo_board.compute_surfaces())
+        render_backend.draw_board(pogo_board)
+
+        for player in snapshot.players:
+            render_list.update(("player", player.player_id), RenderLayer.PLAYERS, player.surface, player.screen_position, player.screen_position[1])
+        render_list.draw(render_backend, RenderList.WORLD_LAYERS)
+        render_backend.add_rects(render_list.pop_dirty_rects())
+        render_backend.present()
+        elapsed_time += time.perf_counter() - start_time
+
+    simulation_pipeline.shutdown()
+    for player in simulation.players:
+        player.receiver_stop_event.set()
+        player.dequeueing_thread.join()
+
+    return elapsed_time / FRAMES_NUM * 1000
+
+
+if __name__ == "__main__":
+    render_backend = SoftwareBackend(cmndef.base_game_size)
+    assets.convert_loaded_images()
+    sprite_registry.reload_sprite_tables()
+
+    serial_time = benchmark(render_backend, pipelined=False)
+    pipelined_time = benchmark(render_backend, pipelined=True)
+
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'SIMULATION':<16}{'TIME/FRAME (ms)':>16}")
+    print(f"{'serial':<16}{serial_time:>16.3f}")
+    print(f"{'pipelined':<16}{pipelined_time:>16.3f}")
+    print(f"Speedup: {serial_time / pipelined_time:.2f}x")
+
+    pygame.quit()
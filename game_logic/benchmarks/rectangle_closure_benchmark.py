@@ -0,0 +1,94 @@
+'''
+[RECTANGLE CLOSURE BENCHMARK]:
+This script compares - for boards of increasing dimensions (from the 8x8 board
+of a match up to a 64x64 board) - the time spent checking if the capture of a
+cell has closed a rectangle:
+
+    1) "matrix"   => the previous approach: "find_smallest_rectangle" tests every
+                     rectangle of the matrix of the player, cell by cell.
+    2) "bitboard" => "RectangleClosure.find_smallest_rectangle" tests every
+                     rectangle of the bitboard of the player, with a mask each.
+    3) "through"  => "RectangleClosure.find_smallest_rectangle_through" only tests
+                     the rectangles whose perimeter includes the captured cell
+                     (what the simulation does).
+
+The captures are random, as in a game: a player captures a cell (a fifth of the
+times, another player takes it away), and a closed rectangle gets reset right
+away. The checks get timed on a sample of the captures of said game (fewer on
+the bigger boards, where "find_smallest_rectangle" takes seconds), and the three
+approaches get checked to find the same rectangles. It has to be run from the
+"game_logic" folder:
+
+    python -m benchmarks.rectangle_closure_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import random
+import time
+from modules.scripts.find_smallest_rectangle import find_smallest_rectangle
+from modules.scripts.rectangle_closure import RectangleClosure
+
+# [DIMENSIONS OF THE BENCHMARKED BOARDS, AND NUMBER OF CAPTURES TIMED ON EACH OF THEM]
+BOARD_SIZES = {8: 200, 16: 100, 32: 10, 64: 3}
+
+# [NUMBER OF CAPTURES OF THE GAME PLAYED ON EACH BOARD (for each cell of the board)]
+CAPTURES_PER_CELL = 4
+
+
+# [Function which plays a random game on a board => sample of "(matrix, owned, cell)" captures]
+def play_game(rectangle_closure, board_size, samples_num):
+    matrix = [[0] * board_size for _ in range(board_size)]
+    owned = 0
+
+    captures_num = CAPTURES_PER_CELL * board_size * board_size
+    sampled_captures = set(random.sample(range(captures_num), samples_num))
+
+    samples = []
+    for capture_idx in range(captures_num):
+        cell = (random.randrange(board_size), random.randrange(board_size))
+        if random.random() < 0.2:
+            # The cell gets captured by another player
+            matrix[cell[0]][cell[1]] = 0
+            owned &= ~rectangle_closure.get_cell_bit(cell)
+            continue
+
+        matrix[cell[0]][cell[1]] = 1
+        owned |= rectangle_closure.get_cell_bit(cell)
+
+        if capture_idx in sampled_captures:
+            samples.append(([row[:] for row in matrix], owned, cell))
+
+        closed_rectangle = rectangle_closure.find_smallest_rectangle_through(owned, cell)
+        if closed_rectangle[0] != (-1,-1):
+            for i, j in closed_rectangle[3]:
+                matrix[i][j] = 0
+            owned &= ~rectangle_closure.get_mask(*closed_rectangle[:3])
+
+    return samples
+
+
+# [Function which benchmarks a board => average time per check (in microseconds) of the three approaches]
+def benchmark(board_size, samples_num):
+    random.seed(0)
+    rectangle_closure = RectangleClosure((board_size, board_size), (3,3))
+    samples = play_game(rectangle_closure, board_size, samples_num)
+
+    times = {}
+    results = {}
+    for approach, check in [("matrix", lambda matrix, owned, cell: find_smallest_rectangle(matrix, (3,3))),
+                            ("bitboard", lambda matrix, owned, cell: rectangle_closure.find_smallest_rectangle(owned)),
+                            ("through", lambda matrix, owned, cell: rectangle_closure.find_smallest_rectangle_through(owned, cell))]:
+        start_time = time.perf_counter()
+        results[approach] = [check(*sample) for sample in samples]
+        times[approach] = (time.perf_counter() - start_time) / len(samples) * 1e6
+
+    assert results["matrix"] == results["bitboard"] == results["through"], "the approaches found different rectangles"
+    return times, len(samples)
+
+
+if __name__ == "__main__":
+    print(f"{'BOARD':<10}{'CHECKS':>8}{'MATRIX (us)':>16}{'BITBOARD (us)':>16}{'THROUGH (us)':>16}{'SPEEDUP':>10}")
+    for board_size, samples_num in BOARD_SIZES.items():
+        times, checks_num = benchmark(board_size, samples_num)
+        print(f"{f'{board_size}x{board_size}':<10}{checks_num:>8}{times['matrix']:>16.1f}{times['bitboard']:>16.1f}"
+              f"{times['through']:>16.1f}{times['matrix'] / times['through']:>9.0f}x")
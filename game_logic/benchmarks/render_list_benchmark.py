@@ -0,0 +1,163 @@
+'''
+[RENDER LIST BENCHMARK]:
+This script compares - for an increasing number of sprites (from the 4 players
+of a match up to 1024 sprites) - the time spent per frame by the two ways of
+drawing the sprites on top of the board:
+
+    1) "immediate"   => the previous approach: the sprites get sorted by their
+                        "Y" coordinate at every frame, and each of them gets
+                        blitted (and tracked by the dirty rect renderer) with
+                        its own call.
+    2) "render list" => the sprites are held by a "RenderList": only the ones
+                        which have changed get updated, the layer only gets
+                        sorted again when a sprite moves, and the whole layer
+                        gets blitted with a single "fblits" call.
+
+At every frame, only a portion of the sprites (the "MOVING_RATIO") moves, as
+it happens during a match (most of the elements - power ups, HUD panels - only
+change once in a while).
+
+It has to be run from the "game_logic" folder:
+
+    python -m benchmarks.render_list_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The benchmark can run headless
+
+import random
+import time
+import pygame
+from modules.scripts import common_definitions as cmndef
+from modules.dirty_rect_renderer import DirtyRectRenderer
+from modules.render_backends.render_backend import RenderBackend
+from modules.render_list import RenderList
+from modules.enumerations.render_layer import RenderLayer
+
+# [NUMBERS OF BENCHMARKED SPRITES]
+SPRITES_NUMS = [4, 16, 64, 256, 1024]
+
+# [Portion of the sprites which moves at every frame]
+MOVING_RATIO = 0.25
+
+FRAMES_NUM = 300
+
+
+class Sprite():
+    __slots__ = ("surface", "screen_position")
+
+    def __init__(self, surface, screen_position):
+        self.surface = surface
+        self.screen_position = screen_position
+
+
+# [Minimal backend which blits the layers on a surface (as the software backend does)]
+class SurfaceBackend(RenderBackend):
+    def __init__(self, surface):
+        super().__init__(surface.get_size())
+        self.surface = surface
+
+    def set_display_mode(self, fullscreen, scaled):
+        return False
+
+    def set_low_resolution(self, low_resolution):
+        return False
+
+    def set_caption(self, title, icon_surface):
+        pass
+
+    def draw_board(self, pogo_board):
+        pass
+
+    def draw(self, surface, position=(0,0)):
+        self.surface.blit(surface, position)
+
+    def draw_sequence(self, blit_sequence, surface_states):
+        self.surface.fblits(blit_sequence)
+
+    def draw_overlays(self, overlay_compositor):
+        pass
+
+    def add_rects(self, rects):
+        pass
+
+    def request_full_update(self):
+        pass
+
+    def present(self):
+        pass
+
+
+# [Function which moves a portion of the sprites]
+def move_sprites(sprites, frame_idx):
+    moving_num = max(1, int(len(sprites) * MOVING_RATIO))
+    for i in range(moving_num):
+        sprite = sprites[(frame_idx * moving_num + i) % len(sprites)]
+        sprite.screen_position = ((sprite.screen_position[0] + 7.5) % 600, (sprite.screen_position[1] + 7.5) % 320)
+
+
+# [Function which benchmarks the immediate drawing => average time per frame (in ms)]
+def benchmark_immediate(sprites, game_surface):
+    display_renderer = DirtyRectRenderer(cmndef.base_game_size)
+
+    elapsed_time = 0
+    for frame_idx in range(FRAMES_NUM):
+        move_sprites(sprites, frame_idx)
+
+        start_time = time.perf_counter()
+        for sprite in sorted(sprites, key=lambda s: s.screen_position[1]):
+            game_surface.blit(sprite.surface, sprite.screen_position)
+            display_renderer.track(sprite, (sprite.screen_position, sprite.surface.get_size()), sprite.surface)
+        display_renderer.present(game_surface, game_surface)
+        elapsed_time += time.perf_counter() - start_time
+
+    return elapsed_time / FRAMES_NUM * 1000
+
+
+# [Function which benchmarks the render list => average time per frame (in ms)]
+def benchmark_render_list(sprites, game_surface):
+    display_renderer = DirtyRectRenderer(cmndef.base_game_size)
+    render_backend = SurfaceBackend(game_surface)
+    render_list = RenderList()
+
+    for sprite in sprites:
+        render_list.update(sprite, RenderLayer.PLAYERS, sprite.surface, sprite.screen_position, sprite.screen_position[1])
+
+    moving_num = max(1, int(len(sprites) * MOVING_RATIO))
+
+    elapsed_time = 0
+    for frame_idx in range(FRAMES_NUM):
+        move_sprites(sprites, frame_idx)
+
+        start_time = time.perf_counter()
+        # Only the sprites which have moved get updated
+        for i in range(moving_num):
+            sprite = sprites[(frame_idx * moving_num + i) % len(sprites)]
+            render_list.update(sprite, RenderLayer.PLAYERS, sprite.surface, sprite.screen_position, sprite.screen_position[1])
+        render_list.draw(render_backend, [RenderLayer.PLAYERS])
+        display_renderer.add_rects(render_list.pop_dirty_rects())
+        display_renderer.present(game_surface, game_surface)
+        elapsed_time += time.perf_counter() - start_time
+
+    return elapsed_time / FRAMES_NUM * 1000
+
+
+if __name__ == "__main__":
+    pygame.display.init()
+    pygame.display.set_mode(cmndef.base_game_size)
+    random.seed(0)
+
+    game_surface = pygame.Surface(cmndef.base_game_size).convert()
+    sprite_surface = pygame.Surface((38, 50), pygame.SRCALPHA).convert_alpha()
+    sprite_surface.fill((200, 40, 40, 255), (4, 4, 30, 42))
+
+    print(f"{'SPRITES':>8}{'IMMEDIATE (ms)':>16}{'RENDER LIST (ms)':>18}")
+    for sprites_num in SPRITES_NUMS:
+        positions = [(random.uniform(0, 600), random.uniform(0, 320)) for _ in range(sprites_num)]
+
+        immediate = benchmark_immediate([Sprite(sprite_surface, position) for position in positions], game_surface)
+        retained = benchmark_render_list([Sprite(sprite_surface, position) for position in positions], game_surface)
+        print(f"{sprites_num:>8}{immediate:>16.3f}{retained:>18.3f}")
+
+    pygame.quit()
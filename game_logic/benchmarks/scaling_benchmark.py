@@ -0,0 +1,127 @@
+'''
+[SCALING BENCHMARK]:
+This script sweeps the dimensions of the board (from the 8x8 board of a match
+up to a 64x64 board) and the number of players (from the 4 players of a match
+up to the 255 players which the owner grid can hold), and it reports - for each
+combination - the time spent per tick by:
+
+    1) "simulation" => "GameSimulation.advance" (movements and collisions of the
+                       players, acquisition of the tiles, closed rectangles,
+                       power ups and timer).
+    2) "render"     => the render stage of a frame drawn from the snapshot of
+                       the tick by the software backend (tiles which have changed
+                       owner, board, players and dirty rects).
+
+The players don't have a controller (their gyroscope readings are random), and
+a frame gets drawn for each tick, as at 60 ticks per second: the combinations
+whose total exceeds the duration of a frame ("16.7 ms") can't hold 60 FPS (on
+a single core). The boards bigger than the screen get drawn clipped, as the
+game would, and the combinations with more players than the board can hold get
+skipped. It has to be run from the "game_logic" folder:
+
+    python -m benchmarks.scaling_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The benchmark can run headless
+
+import random
+import time
+import pygame
+from modules import assets
+from modules import sprite_registry
+from modules.scripts import common_definitions as cmndef
+from modules.pogo_board import PogoBoard
+from modules.static_layer import StaticLayer
+from modules.render_list import RenderList
+from modules.game_simulation import GameSimulation
+from modules.render_backends.software_backend import SoftwareBackend
+from modules.enumerations.render_layer import RenderLayer
+from modules.entities.player import Player
+
+# [DIMENSIONS OF THE BENCHMARKED BOARDS, AND NUMBERS OF PLAYERS]
+BOARD_SIZES = [8, 16, 32, 64]
+PLAYERS_NUMS = [4, 16, 64, 255]
+
+# [NUMBER OF TICKS TIMED FOR EACH COMBINATION]
+TICKS_NUM = 300
+
+# [DURATION OF A FRAME AT 60 FPS (in ms)]
+FRAME_BUDGET = 1000 / 60
+
+
+# [Function which instantiates a simulation with players without a controller]
+def create_simulation(board_dimensions, players_num):
+    # No controller gets detected
+    simulation = GameSimulation(board_dimensions, cmndef.get_board_grid_position(board_dimensions), players_num=players_num,
+                                detects_players=False)
+
+    for player_idx in range(players_num):
+        simulation.players.append(Player(simulation.starting_positions[player_idx], player_idx + 1, None))
+    return simulation
+
+
+# [Function which benchmarks a combination => average times per tick (in ms) of the simulation and of the render stage]
+def benchmark(render_backend, board_size, players_num):
+    random.seed(0)
+    board_dimensions = (board_size, board_size)
+
+    simulation = create_simulation(board_dimensions, players_num)
+
+    pogo_board = PogoBoard(board_dimensions, cmndef.get_board_grid_position(board_dimensions))
+    pogo_board.attach_static_layer(StaticLayer(pogo_board))
+    render_list = RenderList()
+    render_backend.request_full_update()
+
+    # The first tick starts the game session (all the players have spawned)
+    simulation.advance(1)
+
+    simulation_time, render_time = 0, 0
+    for _ in range(TICKS_NUM):
+        # The gyroscope readings change
+        for player in simulation.players:
+            player.gyro_buffer = (random.uniform(-1, 1), random.uniform(-1, 1))
+
+        start_time = time.perf_counter()
+        _, snapshot = simulation.advance(1)
+        simulation_time += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        pogo_board.apply_tile_owners(snapshot.tile_owners)
+        if len(pogo_board.dirty_tiles) > 0:
+            render_backend.add_rects(pogo_board.compute_surfaces())
+        render_backend.draw_board(pogo_board)
+
+        for player in snapshot.players:
+            render_list.update(("player", player.player_id), RenderLayer.PLAYERS, player.surface, player.screen_position, player.screen_position[1])
+        render_list.draw(render_backend, RenderList.WORLD_LAYERS)
+        render_backend.add_rects(render_list.pop_dirty_rects())
+        render_backend.present()
+        render_time += time.perf_counter() - start_time
+
+    for player in simulation.players:
+        player.receiver_stop_event.set()
+        player.dequeueing_thread.join()
+
+    return simulation_time / TICKS_NUM * 1000, render_time / TICKS_NUM * 1000
+
+
+if __name__ == "__main__":
+    render_backend = SoftwareBackend(cmndef.base_game_size)
+    assets.convert_loaded_images()
+    sprite_registry.reload_sprite_tables()
+
+    print(f"{'BOARD':<10}{'PLAYERS':>8}{'SIMULATION (ms)':>18}{'RENDER (ms)':>14}{'TOTAL (ms)':>13}{'60 FPS':>9}")
+    for board_size in BOARD_SIZES:
+        for players_num in PLAYERS_NUMS:
+            if players_num > board_size * board_size:
+                print(f"{f'{board_size}x{board_size}':<10}{players_num:>8}{'-':>18}{'-':>14}{'-':>13}{'-':>9}")
+                continue
+
+            simulation_time, render_time = benchmark(render_backend, board_size, players_num)
+            total_time = simulation_time + render_time
+            print(f"{f'{board_size}x{board_size}':<10}{players_num:>8}{simulation_time:>18.3f}{render_time:>14.3f}"
+                  f"{total_time:>13.3f}{'yes' if total_time <= FRAME_BUDGET else 'NO':>9}")
+
+    pygame.quit()
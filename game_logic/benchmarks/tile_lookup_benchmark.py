@@ -0,0 +1,79 @@
+'''
+[TILE LOOKUP BENCHMARK]:
+This script compares - for boards of increasing dimensions (from the 8x8 board
+of a match up to a 64x64 board) - the time spent finding the tiles under a
+player's hitbox (which the simulation does for every player at every tick, to
+acquire the tiles and the power ups):
+
+    1) "scan"   => the previous approach: the hitbox of the player gets tested
+                   against the hitbox of every tile of the board.
+    2) "lookup" => the tiles get computed from the position of the hitbox on
+                   the grid ("PogoBoard.get_tile_idxs_under").
+
+Both approaches get checked to find the same tiles. It has to be run from the
+"game_logic" folder:
+
+    python -m benchmarks.tile_lookup_benchmark
+'''
+
+# [IMPORT OF LIBRARIES]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The benchmark can run headless
+
+import random
+import time
+import pygame
+from modules.scripts import common_definitions as cmndef
+from modules.pogo_board import PogoBoard
+from modules.entities.player import Player
+
+# [DIMENSIONS OF THE BENCHMARKED BOARDS]
+BOARD_SIZES = [8, 16, 32, 64]
+
+# [NUMBER OF HITBOXES LOOKED UP ON EACH BOARD]
+LOOKUPS_NUM = 2000
+
+
+# [Function which returns the tiles under a hitbox by testing every tile (the previous approach)]
+def scan_tiles(pogo_board, player):
+    tile_idxs = []
+    for i in range(len(pogo_board.pogo_tiles)):
+        for j in range(len(pogo_board.pogo_tiles[0])):
+            if player.check_collisions([pogo_board.pogo_tiles[i][j]]):
+                tile_idxs.append((i, j))
+    return tile_idxs
+
+
+# [Function which benchmarks a board => average time per lookup (in microseconds) of the two approaches]
+def benchmark(board_size):
+    random.seed(0)
+    pogo_board = PogoBoard((board_size, board_size), (1, 1))
+    player = Player((1, 1), 1, None)
+    player.receiver_stop_event.set()
+
+    # The hitboxes get positioned anywhere on the board
+    board_extent = board_size * cmndef.GRID_CELL_SIZE
+    hitbox_positions = [(random.randint(0, board_extent), random.randint(0, board_extent)) for _ in range(LOOKUPS_NUM)]
+
+    times = {}
+    results = {}
+    for approach, find_tiles in [("scan", lambda: scan_tiles(pogo_board, player)),
+                                 ("lookup", lambda: pogo_board.get_tile_idxs_under(player.hitbox))]:
+        results[approach] = []
+        start_time = time.perf_counter()
+        for hitbox_position in hitbox_positions:
+            player.hitbox.topleft = hitbox_position
+            results[approach].append(find_tiles())
+        times[approach] = (time.perf_counter() - start_time) / LOOKUPS_NUM * 1e6
+
+    assert results["scan"] == results["lookup"], "the two approaches found different tiles"
+    return times
+
+
+if __name__ == "__main__":
+    print(f"{'BOARD':<12}{'SCAN (us)':>14}{'LOOKUP (us)':>14}{'SPEEDUP':>10}")
+    for board_size in BOARD_SIZES:
+        times = benchmark(board_size)
+        print(f"{f'{board_size}x{board_size}':<12}{times['scan']:>14.2f}{times['lookup']:>14.2f}{times['scan'] / times['lookup']:>9.1f}x")
+
+    pygame.quit()
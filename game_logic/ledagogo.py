@@ -1,84 +1,230 @@
+from modules import startup_report      # It has to be imported first (it measures the time spent by the imports)
 import pygame
-import os
+import argparse
 
+from modules import assets
+from modules.assets_preloader import AssetsPreloader
+from modules import sprite_registry
+from modules import numeric_renderer
 from modules.scripts import common_definitions as cmndef
-from modules.entities.power_up import PowerUp
 from modules.pogo_board import PogoBoard
-from modules.enumerations.direction import Direction
+from modules.player_scorer import PlayerScorer
+from modules.static_layer import StaticLayer
+from modules.render_backends.software_backend import SoftwareBackend
+from modules.render_backends.texture_backend import TextureBackend, RENDERER_ERRORS
+from modules.overlay_compositor import OverlayCompositor
+from modules.layer_compositor import LayerCompositor
+from modules.render_list import RenderList
+from modules.game_simulation import GameSimulation
+from modules.simulation_pipeline import SimulationPipeline
+from modules.fixed_timestep import FixedTimestep
+from modules.game_state import get_interpolated_positions
+from modules.quality_governor import QualityGovernor
+from modules.idle_throttle import IdleThrottle
+from modules import cpu_usage_report
 from modules.enumerations.game_phase import GamePhase
-from modules.scripts.find_smallest_rectangle import find_smallest_rectangle
+from modules.enumerations.render_layer import RenderLayer
+from modules.enumerations.quality_tier import QualityTier
 from modules.scripts.serial_communication import serial_communication as sercom
 from modules.scripts.serial_communication import spawn_players as spwpl
-import random
-import threading
-
-
-screen = pygame.display.set_mode(cmndef.base_game_size)
-
-# [GAME PHASE]
-# 0 -> Player spawning phase
-# 1 -> Game session
-game_phase = GamePhase.PLAYER_SPAWNING  # Before the game session can start, the players have
-                                        # to spawn first (which happens by connecting with the
-                                        # several STM32F3DISCOVERY boards).
-
-# The "game_surface" is the surface on which all of the game graphics will be
-# rendered on. It gets used in place of the "screen" Surface object, for it
-# will be properly resized according to the window size at every game loop cycle.
-game_surface = pygame.Surface(cmndef.base_game_size)
-
-# The "playing_surface is the surface underneath the player surface (and other
-# "dynamic" surfaces - that is, surfaces upon which several animation frames
-# will be drawn).
-playing_surface = pygame.Surface(cmndef.base_game_size)
+import time
+from functools import partial
+
+startup_report.mark("Imports")
+
+#  /----------------------\
+# | COMMAND-LINE ARGUMENTS |
+#  \----------------------/
+# [Function which parses the dimensions of the board ("<columns>x<rows>", e.g. "8x8")]
+def parse_board_size(value):
+    try:
+        board_dimensions = tuple(int(dimension) for dimension in value.lower().split("x"))
+    except ValueError:
+        board_dimensions = ()
+
+    if len(board_dimensions) != 2 or min(board_dimensions) < 3:
+        raise argparse.ArgumentTypeError(f"invalid board size \"{value}\" (it has to be \"<columns>x<rows>\", both at least 3)")
+    return board_dimensions
+
+argument_parser = argparse.ArgumentParser(description="LED-A-Gogo (APC Project - A.A. 2024/2025)")
+argument_parser.add_argument("--assets-report", action="store_true",
+                             help="print a report on the loaded images (load counts and bytes held) when the game gets closed")
+argument_parser.add_argument("--no-assets-bundle", action="store_true",
+                             help="decode every image from its PNG, even if the assets bundle is up to date")
+argument_parser.add_argument("--fullscreen-mode", choices=["software", "scaled"], default="software",
+                             help="\"software\": the frames get scaled by the game (integer 2x scaling at 1280x720); "
+                                  "\"scaled\": the frames get scaled by SDL (with the GPU, where available)")
+argument_parser.add_argument("--render-backend", choices=["software", "texture"], default="software",
+                             help="\"software\": the frames get built by blitting surfaces (default); "
+                                  "\"texture\": the frames get built with SDL textures (on the GPU, where available)")
+argument_parser.add_argument("--quality-tier", choices=["auto"] + [tier.name.lower() for tier in QualityTier], default="auto",
+                             help="\"auto\": the quality of the frames adapts to the measured frame times (default); "
+                                  "any other value pins the quality to said tier")
+argument_parser.add_argument("--quality-report", action="store_true",
+                             help="print a report on the quality tiers (time spent in each of them) when the game gets closed")
+argument_parser.add_argument("--serial-composition", action="store_true",
+                             help="compose the off-screen layers (board, scorers, timer) one after the other on the main thread")
+argument_parser.add_argument("--serial-simulation", action="store_true",
+                             help="simulate each tick on the main thread, right before drawing it (instead of simulating it while the previous frame gets drawn)")
+argument_parser.add_argument("--tick-rate", type=int, default=FixedTimestep.DEFAULT_TICK_RATE,
+                             help="number of ticks of the simulation per second (independent from the frame rate; "
+                                  f"default: {FixedTimestep.DEFAULT_TICK_RATE})")
+argument_parser.add_argument("--board-size", type=parse_board_size, default=cmndef.DEFAULT_BOARD_DIMENSIONS,
+                             help="dimensions of the pogo board, as \"<columns>x<rows>\" (default: "
+                                  f"{cmndef.DEFAULT_BOARD_DIMENSIONS[0]}x{cmndef.DEFAULT_BOARD_DIMENSIONS[1]}); "
+                                  "the board gets centered where the default one is")
+argument_parser.add_argument("--players", type=int, default=spwpl.MAX_PLAYERS_NUM,
+                             help="number of players of the game session, which starts as soon as all of them have "
+                                  f"connected (default: {spwpl.MAX_PLAYERS_NUM}); only the first four get a scorer on the HUD")
+argument_parser.add_argument("--no-idle-throttle", action="store_true",
+                             help="keep drawing every frame at the full frame rate while waiting for players, after the game over "
+                                  "and while the window is minimized or unfocused")
+argument_parser.add_argument("--cpu-report", action="store_true",
+                             help="print a report on the CPU usage in each state of the game (waiting, game session, game over, idle...) when the game gets closed")
+argument_parser.add_argument("--startup-report", action="store_true",
+                             help="print a report on the startup times (imports, first frame, background loading) when the game gets closed")
+arguments = argument_parser.parse_args()
+
+if arguments.players < 1:
+    argument_parser.error("there has to be at least one player")
+
+assets.BUNDLE_ENABLED = not arguments.no_assets_bundle
+
+#  /------------------------------------------------------------------\
+# | RENDER BACKEND => The game loop draws every frame through it. If the |
+# | texture backend can't be instantiated (e.g. "pygame._sdl2" isn't     |
+# | available), the game falls back to the software backend.            |
+#  \------------------------------------------------------------------/
+render_backend = None
+if arguments.render_backend == "texture":
+    try:
+        render_backend = TextureBackend(cmndef.base_game_size, arguments.fullscreen_mode)
+    except RENDERER_ERRORS as error:
+        print(f"The texture render backend is not available ({error}): falling back to the software backend")
+
+if render_backend == None:
+    render_backend = SoftwareBackend(cmndef.base_game_size, arguments.fullscreen_mode)
+
+#  /------------------------------------------------------------------\
+# | QUALITY GOVERNOR => It measures the time spent on each frame, and   |
+# | lowers the quality of the frames (one tier at a time) when they     |
+# | take too long, raising it again when there's enough headroom.       |
+#  \------------------------------------------------------------------/
+quality_governor = QualityGovernor(None if arguments.quality_tier == "auto" else QualityTier[arguments.quality_tier.upper()])
+render_backend.set_low_resolution(quality_governor.uses_low_resolution())
+
+# The images which have (eventually) been loaded before the display
+# was initialized get converted to the display's pixel format
+# (and so do the sprite tables shared by the entities)
+assets.convert_loaded_images()
+sprite_registry.reload_sprite_tables()
+
+startup_report.mark("Display initialized")
+
+#  /-------------------------------------------------------------------\
+# | BACKGROUND LOADING OF THE IMAGES => The images needed by the first  |
+# | frames (the "waiting for players" screen) get scheduled first, so   |
+# | that they get decoded in parallel while the main thread builds the  |
+# | scenario; all the other images (HUD, players' sprites, "game over"  |
+# | screen...) get decoded while the game waits for the players.        |
+#  \-------------------------------------------------------------------/
+assets_preloader = AssetsPreloader()
+assets_preloader.preload_images(["hud/waiting_for_players.png",
+                                 "hud/waiting_for_players_shadow.png",
+                                 "game_scenario/global_shadow.png",
+                                 "game_scenario/lights_and_ambience.png",
+                                 "logo_redux.png"]
+                                + StaticLayer.LOWER_SCENARIO_ELEMENTS
+                                + StaticLayer.UPPER_SCENARIO_ELEMENTS
+                                + [path for path, _ in sprite_registry.SPRITE_TABLES_DEFINITIONS["pogo_tile"]]
+                                + [path for path, _ in sprite_registry.SPRITE_TABLES_DEFINITIONS["board_border"]])
+assets_preloader.preload_folders()
+
+# The strings of the timer get rendered in background too
+assets_preloader.submit(numeric_renderer.precompute_timer_strings, cmndef.MAX_TIME)
+
+# [GAME PHASE DISPLAYED BY THE FRAMES]
+# (the game phase itself is held by the simulation, and it reaches the
+# render stage through the snapshots)
+displayed_phase = GamePhase.PLAYER_SPAWNING
 
 #  /-----------------------------\
 # | "WAITING FOR PLAYERS" SURFACE |
 #  \-----------------------------/
-wait_players_surface = pygame.image.load(os.path.join(cmndef.assets_path, "hud/waiting_for_players.png")).convert_alpha()
-wait_players_shadow = pygame.image.load(os.path.join(cmndef.assets_path, "hud/waiting_for_players_shadow.png")).convert_alpha()
+wait_players_surface = assets.load_image("hud/waiting_for_players.png")
+wait_players_shadow = assets.load_image("hud/waiting_for_players_shadow.png")
 
 #  /----------------------------------------------\
 # | SURFACES OF THE VARIOUS GAME SCENARIO ELEMENTS |
 #  \----------------------------------------------/
-underneath_the_board = pygame.image.load(os.path.join(cmndef.assets_path, "game_scenario/underneath_the_board.png"))
-background_surface = pygame.image.load(os.path.join(cmndef.assets_path, "game_scenario/background.png"))
-board_shadows = pygame.image.load(os.path.join(cmndef.assets_path, "game_scenario/board_shadows.png")).convert_alpha()
-global_shadow = pygame.image.load(os.path.join(cmndef.assets_path, "game_scenario/global_shadow.png")).convert_alpha()
-board_upper_light = pygame.image.load(os.path.join(cmndef.assets_path, "game_scenario/board_upper_light.png")).convert_alpha()
-shadows_under_the_board = pygame.image.load(os.path.join(cmndef.assets_path, "game_scenario/shadows_under_the_board.png")).convert_alpha()
-lights_and_ambience = pygame.image.load(os.path.join(cmndef.assets_path, "game_scenario/lights_and_ambience.png")).convert_alpha()
-
-# Apparently, when the "game_surface" gets
-# resized, the reference to the resized
-# surface has to be assigned to yet
-# another surface
-fullscreen_surface = None
-
-# The players get instantiated
-players = []    # Initially, there are no players instantiated:
-                # each player will get spawned if a board gets
-                # connected to the game
-
-# Generating a "stopping event" for the player spawning thread
-player_spawning_stop_event = threading.Event()
-
-# Starting the players spawning thread
-player_spawning_thread = spwpl.start_players_detecting_thread(players, player_spawning_stop_event)
+# [N.B.]: The scenario elements which never change during a match (the background,
+# the board's shadows, lights and borders) are pre-composed by the "StaticLayer"
+# object, which gets instantiated together with the "pogo board".
+global_shadow = assets.load_image("game_scenario/global_shadow.png")
+lights_and_ambience = assets.load_image("game_scenario/lights_and_ambience.png")
+
+# The global shadows and the global lights get rendered on top of everything
+# (but the HUD): they get merged into a single premultiplied overlay, so that
+# they get blended on the game surface with a single pass
+global_overlays = OverlayCompositor([(global_shadow, (0,0)), (lights_and_ambience, (0,0))], cmndef.base_game_size)
+
+# The elements drawn on top of the board (power ups, players and HUD) are held
+# by the "render list": each of them gets registered with its layer, and it only
+# gets updated (and its area marked as dirty) when it actually changes
+render_list = RenderList()
+
+# The off-screen layers which have to be composed again before a frame gets
+# drawn (board, scorers' panels, timer) get composed in parallel
+layer_compositor = LayerCompositor(parallel=not arguments.serial_composition)
+render_list.update("wait_players_shadow", RenderLayer.WAITING_FOR_PLAYERS, wait_players_shadow, (0,0), 0)
+render_list.update("wait_players_surface", RenderLayer.WAITING_FOR_PLAYERS, wait_players_surface, (0,0), 1)
+
+#  /------------------------------------------------------------------\
+# | SIMULATION => The state of the game (players, logic of the board,   |
+# | power ups, timer) is held by the simulation, which advances it by   |
+# | ticks of fixed duration and hands immutable snapshots of the ticks  |
+# | to the render stage (the rest of the game loop). The ticks due at   |
+# | each frame get simulated by the pipeline on another thread, one     |
+# | frame ahead of the render stage.                                    |
+#  \------------------------------------------------------------------/
+# [N.B.]: The pogo board is centered where the default "8x8" board (starting from the
+# "(9,5)" tile on the 26x15 grid) is
+board_grid_position = cmndef.get_board_grid_position(arguments.board_size)
+try:
+    simulation = GameSimulation(arguments.board_size, board_grid_position, arguments.tick_rate, arguments.players)
+except ValueError as error:
+    argument_parser.error(str(error))     # There are more players than the board can hold
+simulation_pipeline = SimulationPipeline(simulation, FixedTimestep(arguments.tick_rate), pipelined=not arguments.serial_simulation)
+
+#  /------------------------------------------------------------------\
+# | IDLE THROTTLE => While waiting for the players, after the game over |
+# | and while the window is minimized or unfocused, the frames only get |
+# | drawn when something visible changes, and the simulation and the    |
+# | game loop slow down (until an input or a controller wakes them up)  |
+#  \------------------------------------------------------------------/
+idle_throttle = IdleThrottle(arguments.tick_rate, enabled=not arguments.no_idle_throttle)
+
+# Snapshot of the latest frame (initially, the state before the first tick)
+snapshot = simulation.snapshot
 
 # "Clock" object to ensure the game loop gets played every 1/60th of a second
 # (The game gets capped at 60FPS)
 clock = pygame.time.Clock()
 
-pygame.display.set_caption("LED-A-Gogo (APC Project - A.A. 2024/2025)")
+icon_surface = assets.load_image("logo_redux.png")
+render_backend.set_caption("LED-A-Gogo (APC Project - A.A. 2024/2025)", icon_surface)
 
-icon_surface = pygame.image.load(os.path.join(cmndef.assets_path, "logo_redux.png")).convert_alpha()
-pygame.display.set_icon(icon_surface)
+# The pogo board which gets drawn is the one of the render stage: it has got the same
+# dimensions as the board of the simulation, and its tiles get acquired as in the
+# matrix of tile owners of each snapshot
+pogo_board = PogoBoard(arguments.board_size, board_grid_position)
 
-# An "8x8" pogo board gets instantiated
-# starting from the "(9,5)" tile on the
-# 26x15 grid
-pogo_board = PogoBoard((8,8), (9,5))
+# The static elements of the game scenario get composed
+# just once (the layer gets rebuilt only when the
+# display mode changes), then the board composes its
+# tiles on top of them in its own cached surface
+static_layer = StaticLayer(pogo_board)
+pogo_board.attach_static_layer(static_layer)
 
 # Game loop running state
 running = True
@@ -89,289 +235,214 @@ fullscreen = False
 # Scaled state
 scaled = False
 
-# Game termination state
-game_termination = False
-
-# Game phase change
-phase_change = False
+# "True" once the first frame has been pushed to the display
+first_frame_presented = False
 
 #  /-----------------------------------------\
 # | SURFACES FOR THE HUD ELEMENTS WHICH GET   |
 # | SHOWN WHEN THE GAME SESSION IS TERMINATED |
 #  \-----------------------------------------/
-game_over_surface = pygame.image.load(os.path.join(cmndef.assets_path, "hud/game_over/game_over.png")).convert_alpha()
-game_over_shadow = pygame.image.load(os.path.join(cmndef.assets_path, "hud/game_over/shadows/game_over.png")).convert_alpha()
-winning_player_surface = [pygame.image.load(os.path.join(cmndef.assets_path, f"hud/game_over/p{i+1}_won.png")).convert_alpha() for i in range(4)]
-winning_player_shadows = [pygame.image.load(os.path.join(cmndef.assets_path, f"hud/game_over/shadows/p{i+1}_won.png")).convert_alpha() for i in range(4)]
+# [N.B.]: They aren't needed before the game session starts, so they get
+# retrieved (already preloaded in background) when the game phase changes
+game_over_surface = None
+game_over_shadow = None
+winning_player_surface = None
+winning_player_shadows = None
+
+# Area of the game surface actually covered by the "game over" HUD elements
+game_over_rect = None
 
 
 #  /----------------------------------------------------------------\
 # | SURFACE FOR THE "TIME LEFT" HUD ELEMENT WITH THE RELATIVE SHADOW |
 #  \----------------------------------------------------------------/
-time_left_surface = pygame.image.load(os.path.join(cmndef.assets_path, "hud/time_left.png")).convert_alpha()
-time_left_shadow = pygame.image.load(os.path.join(cmndef.assets_path, "hud/time_left_shadow.png")).convert_alpha()
-
-
-# This will get used to update the timer
-start_time = pygame.time.get_ticks()
+# (retrieved when the game phase changes too)
+time_left_surface = None
+time_left_shadow = None
 
 # The timer surface is - initially - transparent
 timer_surface =  pygame.Surface((120, 40), pygame.SRCALPHA)
+timer_displayed_time = None     # Time displayed by the timer surface
+
+# The scorers (the HUD elements of the players) get instantiated when the game
+# session starts => they're indexed by the ID of the player they belong to
+scorers = {}
 
-# List of "PowerUp" objects
-# which are currently present
-# on the map
-power_ups = []
+# Keys of the power ups which are currently in the render list
+displayed_power_up_keys = set()
 
-# Second in which the most
-# recent power up was appended
-# to the list
-most_recent_power_up_sec = 0
+# Index of the current frame
+frame_idx = 0
 
-# These are the objects with
-# which every player will collide
-global_colliders = []
-global_colliders += pogo_board.board_borders['side_tiles'][Direction.UP.value]
-global_colliders += pogo_board.board_borders['side_tiles'][Direction.RIGHT.value]
-global_colliders += pogo_board.board_borders['side_tiles'][Direction.DOWN.value]
-global_colliders += pogo_board.board_borders['side_tiles'][Direction.LEFT.value]
+# The CPU usage gets measured from the first frame on
+cpu_usage_report.start()
 
 #  /---------\
 # | GAME LOOP |
 #  \---------/
 while running:
+    # The time spent on the frame gets measured (for the quality governor)
+    frame_start_time = time.perf_counter()
+
+    # The game loop becomes idle (or wakes up) depending on the latest frame,
+    # and the ticks which follow get simulated at the proper tick rate
+    idle_throttle.update(snapshot)
+    simulation_pipeline.set_tick_rate(idle_throttle.get_tick_rate())
+
+    # The snapshots of the latest ticks get retrieved (the simulation of
+    # the ticks of the following frame starts while this one gets drawn)
+    previous_snapshot, snapshot, alpha = simulation_pipeline.next_frame()
+
     #  /------------------------------------\
     # | VARIOUS CHECKS WHICH HAVE TO BE DONE |
-    # | FOR STARTING THE PROPER GAME PHASE   |
+    # | FOR SHOWING THE PROPER GAME PHASE    |
     #  \------------------------------------/
-    if game_phase == GamePhase.PLAYER_SPAWNING:
-        # As soon as all the players have
-        # spawned, the game starts        
-        if len(players) == spwpl.MAX_PLAYERS_NUM:
-            phase_change = True
-
-        # If the phase has changed, prepare for the
-        # next game phase by terminating and joining 
-        # the player spawning thread 
-        if phase_change:
-            for player in players:
-                other_players = [p for p in players if p != player] if len(players) > 1 else []
-                player.blocking_colliders = global_colliders + other_players
-            player_spawning_stop_event.set()
-            player_spawning_thread.join()
-            game_phase = GamePhase.GAME_SESSION
-
-    # Rendering of the game scenario backgrond
-    playing_surface.blit(background_surface,(0,0))
-
-    # Rendering the shadows underneath the board
-    playing_surface.blit(shadows_under_the_board,(0,0))
-
-    # Rendering of the "underneath part" of the board
-    playing_surface.blit(underneath_the_board,(0,0))
-
-    # Rendering of the "pogo" tiles matrix
-    for tile_row in pogo_board.pogo_tiles:
-        for tile in tile_row:
-            playing_surface.blit(tile.surface, tile.screen_position)
-            #pygame.draw.rect(playing_surface, (255,0,0), tile.hitbox) # -> [FOR DEBUGGING PURPOSES]
-
-    # [Rendering of the "pogo board" border]
-    # Rendering of the side tiles
-    for tile_row in pogo_board.board_borders['side_tiles']:
-        for side_tile in tile_row:
-            playing_surface.blit(side_tile.surface, side_tile.screen_position)
-            #pygame.draw.rect(playing_surface, (255,0,0), side_tile.hitbox) # -> [FOR DEBUGGING PURPOSES]
-
-    # Rendering of the angle blocks
-    for angle_block in pogo_board.board_borders['angle_blocks']:
-        playing_surface.blit(angle_block.surface, angle_block.screen_position)
-        
-    # Rendering of the board shadows
-    playing_surface.blit(board_shadows,(0,0))
-
-    # Rendering the board's upper light
-    playing_surface.blit(board_upper_light,(0,0))
-
-    # The playing surface gets blitted on the
-    # global game surface.
-    game_surface.blit(playing_surface,(0,0))
+    if snapshot.game_phase != displayed_phase:
+        displayed_phase = snapshot.game_phase
+
+        # The HUD elements of the game session get retrieved (they've
+        # been decoded in background while waiting for the players)
+        game_over_surface = assets.load_image("hud/game_over/game_over.png")
+        game_over_shadow = assets.load_image("hud/game_over/shadows/game_over.png")
+        winning_player_surface = [assets.load_image(f"hud/game_over/p{i+1}_won.png") for i in range(sprite_registry.PLAYER_LOOKS_NUM)]
+        winning_player_shadows = [assets.load_image(f"hud/game_over/shadows/p{i+1}_won.png") for i in range(sprite_registry.PLAYER_LOOKS_NUM)]
+        game_over_rect = game_over_shadow.get_bounding_rect().unionall([shadow.get_bounding_rect() for shadow in winning_player_shadows])
+
+        time_left_surface = assets.load_image("hud/time_left.png")
+        time_left_shadow = assets.load_image("hud/time_left_shadow.png")
+
+        scorers = {player.player_id: PlayerScorer(player) for player in snapshot.players if PlayerScorer.has_screen_position(player.player_id)}
+
+        # The "waiting for players" HUD element gets replaced by the "time left" one
+        render_list.remove("wait_players_shadow")
+        render_list.remove("wait_players_surface")
+        render_list.update("time_left_shadow", RenderLayer.TIMER, time_left_shadow, (230,-10), 0)
+        render_list.update("time_left_surface", RenderLayer.TIMER, time_left_surface, (230,-10), 1)
+
+        # The HUD changes completely when the game session
+        # starts, so the whole frame has to be pushed
+        render_backend.request_full_update()
 
     # Event detection in the game loop
-    for event in pygame.event.get():
+    for event in idle_throttle.get_events():
+        # The idle throttle keeps track of the window's state and of the inputs
+        idle_throttle.handle_event(event)
+
         if event.type == pygame.QUIT:
             running = False
 
+        # If the window's content has been lost (e.g. the window has been
+        # covered or restored), the whole frame has to be pushed again
+        elif event.type == pygame.WINDOWEXPOSED:
+            render_backend.request_full_update()
+
         # Detection of a single key pressing 
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_F11:
-                if(fullscreen):
-                    if(scaled):
-                        screen = pygame.display.set_mode(cmndef.base_game_size,pygame.SCALED)
-                    else:
-                        screen = pygame.display.set_mode(cmndef.base_game_size)
-                else:
-                    screen = pygame.display.set_mode(cmndef.fullscreen_game_size,pygame.FULLSCREEN)
                 fullscreen = not fullscreen
+
+                # If the display mode change has (possibly) changed the pixel format,
+                # the static layer and the global overlays get converted to the new
+                # pixel format (and the board surface gets composed again on top of it)
+                if render_backend.set_display_mode(fullscreen, scaled):
+                    static_layer.build()
+                    pogo_board.redraw_surface()
+                    global_overlays.build()
+                render_backend.request_full_update()
+                idle_throttle.request_redraw()
                 #fullscreen, game_surface, screen = scrsz.toggle_fullscreen(fullscreen,scaled,game_surface,screen)
 
             elif event.key == pygame.K_F10:
                 if(not fullscreen):
-                    if(scaled):
-                        screen = pygame.display.set_mode(cmndef.base_game_size) 
-                    else:
-                        screen = pygame.display.set_mode(cmndef.base_game_size,pygame.SCALED)
                     scaled = not scaled
-                #scaled, game_surface, screen = scrsz.toggle_scaled_2x(fullscreen, scaled, game_surface, screen)
 
+                    # If the display mode change has (possibly) changed the pixel format,
+                    # the static layer and the global overlays get converted to the new
+                    # pixel format (and the board surface gets composed again on top of it)
+                    if render_backend.set_display_mode(fullscreen, scaled):
+                        static_layer.build()
+                        pogo_board.redraw_surface()
+                        global_overlays.build()
+                    render_backend.request_full_update()
+                    idle_throttle.request_redraw()
+                #scaled, game_surface, screen = scrsz.toggle_scaled_2x(fullscreen, scaled, game_surface, screen)
 
-    #  /------------------------------------------------------\
-    # | PLAYER CONTROL SYSTEM (MOVEMENT, POWER UP, COLLISIONS) |
-    #  \------------------------------------------------------/
-    # It's only active during the "game session" phase
-    if game_phase == GamePhase.GAME_SESSION:
-        #  /------------------------\
-        # | POWER UP/SPEED UP SYSTEM |
-        #  \------------------------/
-        for player in players:
-            if player.has_power_up:
-                # If the player has pressed the USER BUTTON
-                # (a "HspeedPgo" message has arrived), the
-                # power up gets used
-                if(player.speed_msg[0] != None):
-                    player.speed_msg[0] = None
-                    player.has_power_up = False    # The power up has been consumed
-                    player.is_powered_up = True    # The player is now "powered up"
-                    player.power_up_duration = player.initial_power_up_duration
-                    player.power_up_activation_time = elapsed_time_sec
-
-
-        #  /---------------\
-        # | MOVEMENT SYSTEM |
-        #  \---------------/
-        if(not game_termination):
-            for player in players:
-                player.last_position_update = player.gyro_buffer
-                if not player.is_powered_up:
-                    player.last_position_update = (player.last_position_update[0]*7.5, - player.last_position_update[1]*7.5)
-                else:
-                    player.last_position_update = (player.last_position_update[0]*15, - player.last_position_update[1]*15)
-                player.change_direction(cmndef.determine_direction(player.last_position_update))
-                player.update_position(player.last_position_update)
-
-
-        #  /----------------\
-        # | COLLISION SYSTEM |
-        #  \----------------/
-        # If the movement has caused the current player to collide,
-        # the position update gets reverted before the actual blitting.
-        # By doing so, the player's hitbox won't get stuck into other
-        # player's (or entity's) hitboxes.
-        for player in players:            
-            # [CHECK COLLISIONS]
-            if(player.check_collisions(player.blocking_colliders)):
-                # If a player collides with at least one
-                # collider, its latest movement gets "reverted"
-                player.update_position((player.last_position_update[0] * -1,
-                                        player.last_position_update[1] * -1))
-
-    #  /----------------------------------------------------------------\
-    # | CHECK IF THE "CHANGE TILE ACQUISITION" EVENT HAS TO BE TRIGGERED |
-    #  \----------------------------------------------------------------/
-    for player in players:
-        for i in range(len(pogo_board.pogo_tiles)):
-            for j in range(len(pogo_board.pogo_tiles[0])):
-                # [If the player collides with the tile's hitbox]
-                if(player.check_collisions([pogo_board.pogo_tiles[i][j]])):
-                    # Change the "player_id" for the tile
-                    pogo_board.pogo_tiles[i][j].change_acquisition(player.player_id)
-
-                    # Update the status of the board: the "i,j" element of the "player_id - 1" matrix
-                    # of the status will be set to "1", the same element of the two remaining matrices
-                    # will be set to "0"
-                    for z in range(1, len(players)+1):
-                        if z == player.player_id:
-                            pogo_board.status[z-1][i][j] = 1
-                        else:
-                            pogo_board.status[z-1][i][j] = 0
-                    
-                    # Check if a rectangle has been closed
-                    closed_rectangle = find_smallest_rectangle(pogo_board.status[player.player_id - 1],(3,3))
-
-                    # If the player has closed a rectangle
-                    if(closed_rectangle[0] != (-1,-1)):
-                        # [PRINT FOR DEBUGGING PURPOSES]
-                        #print(f"Player {players[current_player].player_id} closed a {closed_rectangle[1]}x{closed_rectangle[2]} rectangle at the following path: {closed_rectangle[3]}")
-
-                        # The player's score gets updated with the rectangle's area
-                        player.update_score_and_leds(closed_rectangle[1]*closed_rectangle[2])
-
-                        # [PRINT FOR DEBUGGING PURPOSES]
-                        #print(f"Player {players[current_player].player_id}'s current score is {players[current_player].score}")
-
-                        # [THE TILES CORRESPONDING TO THE CLOSED RECTANGLE GET "RESET"-TED]
-                        for tile_coordinates in closed_rectangle[3]:
-                            pogo_board.pogo_tiles[tile_coordinates[0]][tile_coordinates[1]].change_acquisition(0)
-                            pogo_board.status[player.player_id - 1][tile_coordinates[0]][tile_coordinates[1]] = 0
-
-
-    #  /---------------------------\
-    # | POWER UP ACQUISITION SYSTEM |
-    #  \---------------------------/
-    # It's only active during the "game session" phase
-    if game_phase == GamePhase.GAME_SESSION:
-        # Decrement the validity of each currently instantiated power
-        # up + Removing the powerUPs whose validity has expired
-        for power_up in power_ups:
-            for player in players:
-                if(power_up.check_collisions([player])):
-                    if(power_up.validity > 0):
-                        #print(f"Player {player.player_id} has acquired a power up") # [FOR DEBUGGING PURPOSES]
-                        power_up.validity = 0                                       # Once the power up has been
-                                                                                    # acquired, its validity expires
-                        
-                        # [Thus, the power up gets removed from the
-                        #  list of power ups positioned on the board]
-                        if(power_up in power_ups):
-                            power_ups.remove(power_up)
-
-                        # Whichever branch removed the power up, the "has_power_up"
-                        # attribute of the player gets set to "True".
-                        player.has_power_up = True
-                        player.power_up_instantiation_time = elapsed_time_sec
-                        
-                        # The surface for the "power up" slot has to be computed as soon as the
-                        # player acquires this power up, so that it can be blitted later in
-                        # this very game loop iteration
-                        player.scorer.compute_power_up_surface()
-                else:
-                    power_up.validity = power_up.initial_validity - (elapsed_time_sec - power_up.instantiation_time)
-                    if(power_up.validity == 0):
-                        if(power_up in power_ups):                                  # The item is removed only if it hasn't
-                            power_ups.remove(power_up)                              # been already removed in the meanwhile
-
-
-        # [For each player, if they already possess a power up, its validity gets decreased every second]
-        for player in players:
-            if player.has_power_up:
-                player.power_up_validity = player.power_up_initial_validity - (elapsed_time_sec - player.power_up_instantiation_time)
-                if(player.power_up_validity == 0):
-                    player.has_power_up = False
-            
-            #If the player is currently powered up, the power up "duration" also gets decreased
-            if player.is_powered_up:
-                player.power_up_duration = player.initial_power_up_duration - (elapsed_time_sec - player.power_up_activation_time)
-                if(player.power_up_duration == 0):
-                    player.is_powered_up = False
-                
-
-        #  /--------------------------------------------\
-        # | BLITTING EVERY ACTIVE POWER UP ON THE SCREEN |
-        #  \--------------------------------------------/
-        for power_up in power_ups:
-            game_surface.blit(power_up.surface, power_up.screen_position)
-            # All of the power ups get blitted underneath the players
-
+    # The players get drawn between their positions in the two latest ticks
+    player_positions = get_interpolated_positions(previous_snapshot, snapshot, alpha)
+
+    #  /-------------------------------------------------------------------\
+    # | IF NOTHING VISIBLE HAS CHANGED SINCE THE LATEST FRAME DRAWN (or the |
+    # | window can't be seen), THE FRAME DOESN'T GET DRAWN => the elements  |
+    # | of the render stage will catch up with the snapshot of the next     |
+    # | frame which gets drawn                                              |
+    #  \-------------------------------------------------------------------/
+    if not idle_throttle.needs_frame((snapshot._replace(tick=None), player_positions)):
+        idle_throttle.wait_next_frame(clock, quality_governor.get_frame_rate())
+        cpu_usage_report.record_frame(idle_throttle.state_label, False)
+        continue
+
+    #  /------------------------------------------------------------------\
+    # | THE SNAPSHOT GETS APPLIED TO THE ELEMENTS OF THE RENDER STAGE =>   |
+    # | only the elements which have changed since the previous snapshot   |
+    # | get updated (and their areas marked as dirty)                      |
+    #  \------------------------------------------------------------------/
+    # The tiles whose acquisition has changed get marked as "to be redrawn"
+    pogo_board.apply_tile_owners(snapshot.tile_owners)
+
+    # The power ups which have been spawned get added to the render list, and
+    # the ones which have been acquired (or whose validity has expired) get removed
+    # (they're only drawn during the "game session" phase, as the HUD)
+    power_up_keys = set()
+    if displayed_phase == GamePhase.GAME_SESSION:
+        for power_up in snapshot.power_ups:
+            power_up_keys.add(power_up.key)
+            if power_up.key not in displayed_power_up_keys:
+                render_list.update(power_up.key, RenderLayer.POWER_UPS, power_up.surface, power_up.screen_position)
+    for power_up_key in displayed_power_up_keys - power_up_keys:
+        render_list.remove(power_up_key)
+    displayed_power_up_keys = power_up_keys
+
+    # The scorers get the snapshots of their players
+    for player in snapshot.players:
+        if player.player_id in scorers:
+            scorers[player.player_id].update_player(player)
+
+    #  /-------------------------------------------------------------------\
+    # | COMPOSITION OF THE OFF-SCREEN LAYERS => Only the layers which have   |
+    # | changed get composed again, in parallel: each "lane" is a group of   |
+    # | layers which share their sprites, so it gets composed by one thread  |
+    #  \-------------------------------------------------------------------/
+    # [HUD LANE] => The scorers' panels and "power up" slots (they all share
+    # the graphics and the font of the HUD) => with a reduced quality, they
+    # only get composed once every few frames
+    hud_lane = []
+    for scorer in scorers.values():
+        if scorer.is_outdated():
+            if quality_governor.allows_hud_redraw(frame_idx):
+                hud_lane += [scorer.compute_surface, scorer.compute_power_up_surface]
+            else:
+                idle_throttle.request_redraw()  # The panel will be composed by a following frame
+
+    # [BOARD LANE] => The surfaces for the board's tiles get updated (only the
+    # tiles whose acquisition has changed get redrawn on the board's surface,
+    # and only their areas will be pushed to the display)
+    board_lane = [pogo_board.compute_surfaces] if len(pogo_board.dirty_tiles) > 0 else []
+
+    # [TIMER LANE] => The timer surface only changes (at most) once a second
+    timer_lane = [partial(cmndef.update_timer_surface, snapshot.time_left)] if snapshot.time_left != timer_displayed_time else []
+
+    _, board_results, timer_results = layer_compositor.compose([hud_lane, board_lane, timer_lane])
+
+    for redrawn_rects in board_results:
+        render_backend.add_rects(redrawn_rects)
+
+    if len(timer_results) > 0:
+        timer_surface = timer_results[0]
+        timer_displayed_time = snapshot.time_left
+
+    # Rendering of the game scenario and of the "pogo" tiles matrix (the static
+    # elements - background, borders, shadows and lights - and the tiles)
+    render_backend.draw_board(pogo_board)
 
     #  /-----------------------------------------------------------------------------\
     # | Blitting the player(s) on the game surface (not on the playing surface, given | 
@@ -379,119 +450,97 @@ while running:
     #  \-----------------------------------------------------------------------------/
     # The order in which the players get blitted is ascending with the "Y" screen
     # coordinate (if a player has got a bigger "Y" screen coordinate, said player is
-    # positioned closer to the camera).
-    sorted_players = sorted(players, key=lambda p: p.screen_position[1])
-    for i in range(len(players)):
-        #pygame.draw.rect(game_surface, (255,0,0), sorted_players[i].hitbox) # -> [FOR DEBUGGING PURPOSES]
-        game_surface.blit(sorted_players[i].surface,
-                          sorted_players[i].screen_position)
-
-    # Rendering the global shadows
-    game_surface.blit(global_shadow,(0,0))
-
-    # Rendering the global lights and ambience
-    game_surface.blit(lights_and_ambience,(0,0))
+    # positioned closer to the camera): it's the sort key of the players' layer, which
+    # only gets sorted again when a player moves.
+    # [N.B.]: The players get drawn between their positions in the two latest
+    # ticks, so that they move smoothly whatever the tick rate is.
+    for player, position in zip(snapshot.players, player_positions):
+        render_list.update(("player", player.player_id), RenderLayer.PLAYERS, player.surface, position, position[1])
+
+    # All of the power ups get blitted underneath the players
+    render_list.draw(render_backend, RenderList.WORLD_LAYERS)
+
+    # Rendering the global shadows and the global lights and ambience
+    # (unless the quality has been lowered)
+    if quality_governor.draws_global_overlays():
+        render_backend.draw_overlays(global_overlays)
     
     #  /------------\
     # | HUD BLITTING |
     #  \------------/
     # It's only active during the "game session" phase
-    if game_phase == GamePhase.GAME_SESSION:
+    if displayed_phase == GamePhase.GAME_SESSION:
         # [THE HUD GETS BLITTED ON TOP OF EVERYTHING]
-        for i in range(len(players)):
-            # Blitting the "power up" slot shadow, if the player indexed by "i" does have one
-            if players[i].has_power_up:
-                game_surface.blit(players[i].scorer.__class__.POWER_UP_SLOT_BASE_SHADOW, players[i].scorer.power_up_screen_position)
-            
-            # Blitting the PlayerScorer element of the HUD
-            game_surface.blit(players[i].scorer.surface, players[i].scorer.screen_position)
-
-            # Blitting the "power up" slot surface, if the player indexed by "i" does have one
-            if players[i].has_power_up:
-                game_surface.blit(players[i].scorer.power_up_surface, players[i].scorer.power_up_screen_position)
-
-        game_surface.blit(time_left_shadow,(230,-10))
-        game_surface.blit(time_left_surface,(230,-10))
-        game_surface.blit(timer_surface, (222,20))
-
-        if(game_termination):
-            game_surface.blit(game_over_shadow)
-            game_surface.blit(game_over_surface)
-
-            # The "winning surface" associated with the player
-            # with the highest score gets blitted on the game_surface.
-            game_surface.blit(winning_player_shadows[sorted(players, key=lambda p: p.score)[-1].player_id - 1])
-            game_surface.blit(winning_player_surface[sorted(players, key=lambda p: p.score)[-1].player_id - 1])
-    else:
-        #  /----------------------------------------------------------------------------------------------\
-        # | IF THE GAME IS IN THE "PLAYER_SPAWNING" PHASE, WHAT GETS BLITTED ARE THE "WAITING FOR PLAYERS" |
-        # | HUD ELEMENT ON THE TOP HALF OF THE SCREEN AND THE "PLAYER READY" UNDER THE PLAYERS' SPRITES    |
-        #  \----------------------------------------------------------------------------------------------/
-        game_surface.blit(wait_players_shadow)
-        game_surface.blit(wait_players_surface)
-        
-
-    if(fullscreen):
-        fullscreen_surface = pygame.transform.scale(game_surface, cmndef.fullscreen_game_size)
-        screen.blit(fullscreen_surface, (0,0))
-    else:
-        screen.blit(game_surface,(0,0))
-
-    pygame.display.flip()
-
-    # The players surfaces get updated
-    for i in range(len(players)):
-        players[i].compute_surface()
-        players[i].scorer.compute_surface()
-        players[i].scorer.compute_power_up_surface()
-
-    # The surfaces for the
-    # board's tiles get updated
-    pogo_board.compute_surfaces()
-
-    # The game gets terminated as soon as a
-    # player reaches the highest score
-    if any(players[i].score == cmndef.MAX_SCORE for i in range(len(players))):
-        game_termination = True
-
-    #  /--------------------------------------------------\
-    # | Calculating the time (in seconds) that has elapsed |
-    # | between the first game loop and the current one    |
-    #  \--------------------------------------------------/
-    elapsed_time_sec = (pygame.time.get_ticks() - start_time) // 1000
-
-    if not game_termination:
-        # This gets used to calculate the time left
-        # for the game session to get terminated.
-        time_left = cmndef.MAX_TIME - elapsed_time_sec
-
-        # If a multiple of 15 seconds has passed, a power 
-        # up gets added in a random place on the board. 
-        # [N.B]:
-        #   The final "and" in the condition guarantees that a new power up does not get added at each game
-        #   loop which has the same "divide-able by 15" elapsed time count (if "elapsed_time_sec == 15", for
-        #   example, the last condition makes it so the power up gets added just only at the first game loop
-        #   in which "elapsed_time_sec == 15").
-        if(elapsed_time_sec != 0 and elapsed_time_sec % 15 == 0 and elapsed_time_sec != most_recent_power_up_sec):
-            most_recent_power_up_sec = elapsed_time_sec
-            power_ups.append(PowerUp((random.randint(0,7) + 9, random.randint(0,7) + 5), most_recent_power_up_sec))
-            # [FOR DEBUGGING PURPOSES]
-            #print(f"New power up added at second {elapsed_time_sec}, at position ({power_ups[-1].grid_position[0]},{power_ups[-1].grid_position[1]})")
-
-        if(time_left == 0):
-            game_termination = True
-            power_ups = []  # When there's no time left, all of the "PowerUp" objects
-                            # get removed from the list (this way, they won't be
-                            # blitted on the board in the following game loops)
-
-
-    timer_surface = cmndef.update_timer_surface(time_left)
-
-    # Wait for 60 ticks
-    clock.tick(60)
+        for scorer in scorers.values():
+            # The "power up" slot (with its shadow) is shown if the player does have a power up
+            if scorer.player_ref.has_power_up:
+                render_list.update((scorer, "power_up_shadow"), RenderLayer.POWER_UP_SLOT_SHADOWS,
+                                   scorer.__class__.POWER_UP_SLOT_BASE_SHADOW, scorer.power_up_screen_position)
+                render_list.update((scorer, "power_up"), RenderLayer.POWER_UP_SLOTS,
+                                   scorer.power_up_surface, scorer.power_up_screen_position, state=scorer.power_up_surface_state)
+            else:
+                render_list.remove((scorer, "power_up_shadow"))
+                render_list.remove((scorer, "power_up"))
+
+            # The PlayerScorer element of the HUD
+            render_list.update((scorer, "scorer"), RenderLayer.SCORERS,
+                               scorer.surface, scorer.screen_position, state=scorer.surface_state)
+
+        render_list.update("timer", RenderLayer.TIMER, timer_surface, (222,20), 2, timer_displayed_time)
+
+        if(snapshot.game_termination):
+            # The "winning surface" associated with the player with the highest score
+            # gets blitted on top of the "game over" element (the area which can change
+            # is the one actually covered by the "game over" HUD elements) => it's the
+            # one of the look of said player
+            winning_player_idx = sprite_registry.get_player_look(snapshot.winning_player_idx + 1) - 1
+            render_list.update("game_over_shadow", RenderLayer.GAME_OVER, game_over_shadow, (0,0), 0, rect=game_over_rect)
+            render_list.update("game_over_surface", RenderLayer.GAME_OVER, game_over_surface, (0,0), 1, rect=game_over_rect)
+            render_list.update("winning_player_shadow", RenderLayer.GAME_OVER, winning_player_shadows[winning_player_idx], (0,0), 2, rect=game_over_rect)
+            render_list.update("winning_player_surface", RenderLayer.GAME_OVER, winning_player_surface[winning_player_idx], (0,0), 3, rect=game_over_rect)
+
+    #  /----------------------------------------------------------------------------------------------\
+    # | IF THE GAME IS IN THE "PLAYER_SPAWNING" PHASE, WHAT GETS BLITTED ARE THE "WAITING FOR PLAYERS" |
+    # | HUD ELEMENT ON THE TOP HALF OF THE SCREEN AND THE "PLAYER READY" UNDER THE PLAYERS' SPRITES    |
+    #  \----------------------------------------------------------------------------------------------/
+    # (the "waiting for players" element is in the render list until the game session starts)
+    render_list.draw(render_backend, RenderList.HUD_LAYERS)
+
+    # Only the areas covered by the elements which have changed are dirty
+    render_backend.add_rects(render_list.pop_dirty_rects())
+
+
+    # The frame gets pushed to the display (the software backend only pushes
+    # the areas which have changed, scaled to the display's size if the game
+    # is in fullscreen mode)
+    render_backend.present()
+
+    if not first_frame_presented:
+        first_frame_presented = True
+        startup_report.mark("First frame")
+
+    # If the quality tier has changed, the display gets reopened (if the resolution
+    # has changed the pixel format, the surfaces composed in said format get built
+    # again) and the whole frame has to be pushed
+    if quality_governor.record_frame((time.perf_counter() - frame_start_time) * 1000):
+        if render_backend.set_low_resolution(quality_governor.uses_low_resolution()):
+            static_layer.build()
+            pogo_board.redraw_surface()
+            global_overlays.build()
+        render_backend.request_full_update()
+        idle_throttle.request_redraw()
+
+    frame_idx += 1
+
+    # Wait for 60 ticks (30 with the lowest quality tier, 10 while idle)
+    idle_throttle.wait_next_frame(clock, quality_governor.get_frame_rate())
+    cpu_usage_report.record_frame(idle_throttle.state_label, True)
+
+# The simulation gets stopped (the tick which is being simulated gets completed first)
+simulation_pipeline.shutdown()
 
 # [The connections with the BT modules get closed]
-for player in players:
+for player in simulation.players:
     sercom.turn_led_on(0,player.controller_serial_port)
     player.receiver_stop_event.set()    # To stop the reading thread operations
     player.receiver_thread.join()                                    
@@ -501,5 +550,30 @@ for player in players:
                                                                      
     sercom.close_connection(player.controller_serial_port)
 
+# The threads of the layer compositor get stopped
+layer_compositor.shutdown()
+
+# The background loading gets stopped (if it hasn't ended yet)
+preloading_ended = assets_preloader.is_done()
+assets_preloader.shutdown()
+
+# [FOR DEBUGGING PURPOSES] => Report on the images which have been loaded during the game
+if arguments.assets_report:
+    print(assets.get_report())
+
+# [FOR DEBUGGING PURPOSES] => Report on the startup times
+if arguments.startup_report:
+    if preloading_ended:
+        startup_report.mark("Background loading ended", assets_preloader.end_time)
+    print(startup_report.get_report())
+
+# [FOR DEBUGGING PURPOSES] => Report on the quality tiers
+if arguments.quality_report:
+    print(quality_governor.get_report())
+
+# [FOR DEBUGGING PURPOSES] => Report on the CPU usage in each state of the game
+if arguments.cpu_report:
+    print(cpu_usage_report.get_report())
+
 # The game gets closed
 pygame.quit()
\ No newline at end of file
@@ -0,0 +1,231 @@
+'''
+[ASSETS MANAGER]:
+This module loads the images of the game from the "assets" folder. Each image
+gets decoded just once: every following request for the same path returns the
+very same (shared) surface, so the objects which use the same sprite (e.g. the
+64 tiles of the board, or the 36 borders) don't hold separate copies of it.
+
+Each surface gets converted to the pixel format of the display ("convert_alpha"
+for the images with per-pixel alpha, "convert" for the opaque ones), so that
+blitting it doesn't require any pixel format conversion. The images which get
+loaded before "pygame.display.set_mode" has been called can't be converted yet:
+they get converted by "convert_loaded_images", which has to be called as soon
+as the display has been initialized.
+
+The images get built - whenever possible - from the "assets bundle" (see the
+"assets_bundle" module), which contains their raw pixel data, so that they don't
+have to be decoded from their PNG: the PNG only gets decoded when the bundle is
+missing, or when the image has changed after the bundle has been written.
+
+ /----------------------------------------------------------------------\
+| [N.B.]: The surfaces are SHARED, so they must not be modified by the   |
+| callers (e.g. with "set_alpha"): a caller who needs a modified version |
+| of an image has to work on a copy of it.                               |
+ \----------------------------------------------------------------------/
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+import os
+import threading
+from modules import assets_bundle
+
+# [ASSETS PATH] => Absolute path of the "assets" folder (the same as "common_definitions.assets_path":
+# it gets computed here too, so that this module doesn't depend on the other modules of the game)
+ASSETS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+# [CACHES]
+LOADED_SURFACES = {}        # "relative path" -> surface
+ROTATED_SURFACES = {}       # ("relative path", angle) -> rotated surface
+UNCONVERTED_PATHS = set()   # Paths of the surfaces loaded before the display was initialized
+LOADING_EVENTS = {}         # "relative path" -> event which gets set when the image has been decoded
+
+# [STATISTICS] => "relative path" -> number of times the image has been requested/decoded
+# from its PNG/built from the assets bundle
+REQUESTS_COUNT = {}
+DECODES_COUNT = {}
+BUNDLE_LOADS_COUNT = {}
+
+# [ASSETS BUNDLE] => It gets opened the first time an image gets loaded
+# ("BUNDLE_ENABLED" can be set to "False" to always decode the PNGs)
+BUNDLE_ENABLED = True
+BUNDLE = None
+BUNDLE_CHECKED = False
+
+# Lock to access the caches (the players - and their sprites - get instantiated
+# by the "players detecting" thread, and the images get preloaded in background)
+assets_lock = threading.RLock()
+
+
+# [Function to convert a surface to the pixel format of the display => without a display
+#  surface (the "texture" render backend draws on a window of its own), it's returned as it is]
+def convert_to_display_format(surface):
+    if pygame.display.get_surface() == None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+# [Function to retrieve the assets bundle => "None" if it's missing or not valid]
+def get_bundle():
+    global BUNDLE, BUNDLE_CHECKED
+
+    with assets_lock:
+        if not BUNDLE_CHECKED:
+            BUNDLE_CHECKED = True
+            try:
+                BUNDLE = assets_bundle.AssetsBundle(assets_bundle.BUNDLE_PATH, ASSETS_PATH)
+            except (OSError, ValueError):
+                BUNDLE = None
+        return BUNDLE
+
+
+# [Function to build the surface of an image (from the bundle or from its PNG)]
+def decode_image(relative_path):
+    '''
+    [RETURN]:
+        "surface"      : the surface of the image (not converted)
+        "from_bundle"  : "True" if the surface has been built from the bundle
+    '''
+    # The surface gets built from the bundle (if the image in the
+    # bundle is up to date), otherwise the PNG gets decoded
+    bundle = get_bundle() if BUNDLE_ENABLED else None
+    if bundle != None:
+        surface = bundle.get_surface(relative_path)
+        if surface != None:
+            return surface, True
+
+    return pygame.image.load(os.path.join(ASSETS_PATH, relative_path)), False
+
+
+# [Function to retrieve the (shared) surface of an image]
+def load_image(relative_path):
+    '''
+    [PARAMETERS]:
+        "relative_path" : path of the image, relative to the "assets" folder
+
+    [RETURN]:
+        "surface" : the surface of the image (converted to the display's
+                    pixel format, if the display has been initialized)
+
+    The image gets decoded OUTSIDE of the lock, so that several threads
+    (e.g. the threads of the "AssetsPreloader") can decode different images
+    at the same time: a thread which requests an image which is already being
+    decoded by another thread waits for it, instead of decoding it again.
+    '''
+    with assets_lock:
+        REQUESTS_COUNT[relative_path] = REQUESTS_COUNT.get(relative_path, 0) + 1
+
+        surface = LOADED_SURFACES.get(relative_path)
+        if surface != None:
+            return surface
+
+        loading_event = LOADING_EVENTS.get(relative_path)
+        if loading_event == None:
+            LOADING_EVENTS[relative_path] = threading.Event()
+
+    # [The image is being decoded by another thread]
+    if loading_event != None:
+        loading_event.wait()
+        with assets_lock:
+            REQUESTS_COUNT[relative_path] -= 1      # The request gets counted (again) by the retry
+        return load_image(relative_path)            # If the other thread has failed, the decoding gets retried
+
+    try:
+        surface, from_bundle = decode_image(relative_path)
+        is_converted = pygame.display.get_surface() != None
+        if is_converted:
+            surface = convert_to_display_format(surface)
+
+        with assets_lock:
+            # The display might have been initialized in the meanwhile
+            # (after "convert_loaded_images" had already been called)
+            if not is_converted and pygame.display.get_surface() != None:
+                surface = convert_to_display_format(surface)
+            elif not is_converted:
+                UNCONVERTED_PATHS.add(relative_path)
+
+            if from_bundle:
+                BUNDLE_LOADS_COUNT[relative_path] = BUNDLE_LOADS_COUNT.get(relative_path, 0) + 1
+            else:
+                DECODES_COUNT[relative_path] = DECODES_COUNT.get(relative_path, 0) + 1
+
+            LOADED_SURFACES[relative_path] = surface
+    finally:
+        with assets_lock:
+            LOADING_EVENTS.pop(relative_path).set()
+
+    return surface
+
+
+# [Function to retrieve the (shared) rotated variant of an image]
+def load_rotated_image(relative_path, angle):
+    '''
+    [PARAMETERS]:
+        "relative_path" : path of the image, relative to the "assets" folder
+        "angle"         : rotation (in degrees, counterclockwise) of the image
+    '''
+    surface = load_image(relative_path)
+
+    with assets_lock:
+        rotated_surface = ROTATED_SURFACES.get((relative_path, angle))
+        if rotated_surface == None:
+            rotated_surface = pygame.transform.rotate(LOADED_SURFACES.get(relative_path, surface), angle)
+            ROTATED_SURFACES[(relative_path, angle)] = rotated_surface
+
+        return rotated_surface
+
+
+# [Function to convert the surfaces which have been loaded before the display was initialized]
+def convert_loaded_images():
+    '''
+    It has to be called right after "pygame.display.set_mode": the surfaces
+    handed out before this call are NOT updated, so the images which get loaded
+    before the display gets initialized should be requested again afterwards.
+    '''
+    with assets_lock:
+        for relative_path in UNCONVERTED_PATHS:
+            LOADED_SURFACES[relative_path] = convert_to_display_format(LOADED_SURFACES[relative_path])
+
+            # The rotated variants get computed again from the converted surface
+            for (rotated_path, angle) in list(ROTATED_SURFACES):
+                if rotated_path == relative_path:
+                    ROTATED_SURFACES[(rotated_path, angle)] = pygame.transform.rotate(LOADED_SURFACES[relative_path], angle)
+
+        UNCONVERTED_PATHS.clear()
+
+
+# [Function to compute the number of bytes held by a surface]
+def get_surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+# [Function which returns a report on the loaded images]
+def get_report():
+    '''
+    [RETURN]:
+        "report" : string with - for each image - the number of times it has
+                   been requested, decoded and built from the bundle, and the
+                   bytes held by its surface
+    '''
+    with assets_lock:
+        lines = ["[ASSETS REPORT]:",
+                 f"{'IMAGE':<56}{'REQUESTS':>10}{'DECODES':>10}{'BUNDLED':>10}{'BYTES':>12}"]
+
+        total_bytes = 0
+        for relative_path in sorted(LOADED_SURFACES):
+            surface_bytes = get_surface_bytes(LOADED_SURFACES[relative_path])
+            total_bytes += surface_bytes
+            lines.append(f"{relative_path:<56}{REQUESTS_COUNT.get(relative_path, 0):>10}{DECODES_COUNT.get(relative_path, 0):>10}"
+                         f"{BUNDLE_LOADS_COUNT.get(relative_path, 0):>10}{surface_bytes:>12}")
+
+        rotated_bytes = sum(get_surface_bytes(surface) for surface in ROTATED_SURFACES.values())
+        total_bytes += rotated_bytes
+
+        lines.append(f"Rotated variants: {len(ROTATED_SURFACES)} ({rotated_bytes} bytes)")
+        lines.append(f"Images: {len(LOADED_SURFACES)} - Requests: {sum(REQUESTS_COUNT.values())} - "
+                     f"Decodes: {sum(DECODES_COUNT.values())} - Built from the bundle: {sum(BUNDLE_LOADS_COUNT.values())} - "
+                     f"Bytes held: {total_bytes}")
+
+        return "\n".join(lines)
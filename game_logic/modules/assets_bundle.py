@@ -0,0 +1,187 @@
+'''
+[ASSETS BUNDLE]:
+This module packs all of the images of the "assets" folder into a single file
+(the "bundle"), which contains the RAW pixel data of each image - already in
+the pixel layout of the display surface - together with an index. The game
+memory-maps the bundle and builds the surfaces with "pygame.image.frombuffer",
+so that no PNG has to be decoded at startup.
+
+ /-------------\
+| BUNDLE FORMAT |
+ \-------------/
+    1) The "magic" bytes (which identify the file and the version of the format)
+    2) The offset and the length of the index (8 bytes each, little endian)
+    3) The pixel data of the images (each block aligned to "DATA_ALIGNMENT" bytes)
+    4) The index (JSON): for each image (identified by its path relative to the
+       "assets" folder) the offset of its pixel data, its size, its pixel format,
+       and the size, the modification time and the SHA-1 of the source PNG
+
+The images with per-pixel alpha get stored as "BGRA" (the layout of the display
+surface on little endian machines, so converting them is a plain copy), the
+opaque images as "RGBX" (so that the surface built from them doesn't get
+flagged as "SRCALPHA").
+
+An image is "stale" when its PNG has changed after the bundle has been written:
+the size and the modification time get checked first, and the SHA-1 only gets
+computed when they don't match (e.g. the file has just been checked out again
+without changes). Stale images get loaded from their PNG by the assets manager.
+
+ /----\
+| PACK |
+ \----/
+The bundle gets written (again) by running this module from the "game_logic" folder:
+
+    python -m modules.assets_bundle
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+import os
+import mmap
+import json
+import hashlib
+
+# [BUNDLE CONSTANTS]
+BUNDLE_MAGIC = b"LEDAGOGO-BUNDLE1"
+HEADER_SIZE = len(BUNDLE_MAGIC) + 16
+DATA_ALIGNMENT = 64
+
+# [BUNDLE PATH] => The bundle gets written next to the "assets" folder
+BUNDLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets.bundle")
+
+
+# [Function which computes the SHA-1 of a file]
+def compute_file_hash(file_path):
+    with open(file_path, "rb") as source_file:
+        return hashlib.sha1(source_file.read()).hexdigest()
+
+
+class AssetsBundle():
+    # [Class constructor]
+    def __init__(self, bundle_path, assets_path):
+        '''
+        [PARAMETERS]:
+        "self"        : reference to the current object
+        "bundle_path" : path of the bundle file
+        "assets_path" : path of the "assets" folder (the source PNGs get
+                        checked to find out whether the bundle is stale)
+
+        It raises "ValueError" if the file isn't a valid bundle, and
+        "OSError" if the file can't be opened.
+        '''
+        self.assets_path = assets_path
+
+        with open(bundle_path, "rb") as bundle_file:
+            # The mapping stays valid after the file gets closed; it's a "copy
+            # on write" mapping, so the surfaces built on it can be written
+            # without modifying the file (and without raising any error)
+            self.mapping = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        if self.mapping[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            self.mapping.close()
+            raise ValueError(f"{bundle_path} is not a valid assets bundle")
+
+        index_offset = int.from_bytes(self.mapping[len(BUNDLE_MAGIC):len(BUNDLE_MAGIC) + 8], "little")
+        index_length = int.from_bytes(self.mapping[len(BUNDLE_MAGIC) + 8:HEADER_SIZE], "little")
+        self.index = json.loads(self.mapping[index_offset:index_offset + index_length].decode("utf-8"))
+
+
+    # [Method which checks whether the pixel data of an image is up to date with its PNG]
+    def is_fresh(self, relative_path):
+        entry = self.index.get(relative_path)
+        if entry == None:
+            return False
+
+        try:
+            file_stats = os.stat(os.path.join(self.assets_path, relative_path))
+        except OSError:
+            return False
+
+        if file_stats.st_size != entry["file_size"]:
+            return False
+        if file_stats.st_mtime_ns == entry["mtime_ns"]:
+            return True
+
+        # Same size, but different modification time => the content gets compared
+        return compute_file_hash(os.path.join(self.assets_path, relative_path)) == entry["sha1"]
+
+
+    # [Method which builds the surface of an image from the bundle]
+    def get_surface(self, relative_path):
+        '''
+        [RETURN]:
+        "surface" : the surface of the image (built on the mapped pixel data),
+                    or "None" if the image isn't in the bundle or it's stale
+        '''
+        if not self.is_fresh(relative_path):
+            return None
+
+        entry = self.index[relative_path]
+        data_length = entry["width"] * entry["height"] * 4
+        pixel_data = memoryview(self.mapping)[entry["offset"]:entry["offset"] + data_length]
+
+        return pygame.image.frombuffer(pixel_data, (entry["width"], entry["height"]), entry["format"])
+
+
+# [Function which writes the bundle with all the images of the "assets" folder]
+def pack_assets(assets_path, bundle_path):
+    '''
+    [PARAMETERS]:
+        "assets_path" : path of the "assets" folder
+        "bundle_path" : path of the bundle to be written
+
+    [RETURN]:
+        "index" : the index of the written bundle
+    '''
+    relative_paths = []
+    for folder, _, file_names in os.walk(assets_path):
+        for file_name in file_names:
+            if file_name.lower().endswith(".png"):
+                relative_paths.append(os.path.relpath(os.path.join(folder, file_name), assets_path).replace(os.sep, "/"))
+    relative_paths.sort()
+
+    # The bundle gets written on a temporary file first, so that a
+    # running game never maps a half-written bundle
+    index = {}
+    temporary_path = bundle_path + ".tmp"
+    with open(temporary_path, "wb") as bundle_file:
+        bundle_file.write(b"\x00" * HEADER_SIZE)     # The header gets written at the end
+
+        for relative_path in relative_paths:
+            source_path = os.path.join(assets_path, relative_path)
+            file_stats = os.stat(source_path)
+            surface = pygame.image.load(source_path)
+
+            pixel_format = "BGRA" if surface.get_flags() & pygame.SRCALPHA else "RGBX"
+
+            bundle_file.write(b"\x00" * (-bundle_file.tell() % DATA_ALIGNMENT))
+            index[relative_path] = {"offset"   : bundle_file.tell(),
+                                    "width"    : surface.get_width(),
+                                    "height"   : surface.get_height(),
+                                    "format"   : pixel_format,
+                                    "file_size": file_stats.st_size,
+                                    "mtime_ns" : file_stats.st_mtime_ns,
+                                    "sha1"     : compute_file_hash(source_path)}
+            bundle_file.write(pygame.image.tobytes(surface, pixel_format))
+
+        index_bytes = json.dumps(index).encode("utf-8")
+        index_offset = bundle_file.tell()
+        bundle_file.write(index_bytes)
+
+        bundle_file.seek(0)
+        bundle_file.write(BUNDLE_MAGIC)
+        bundle_file.write(index_offset.to_bytes(8, "little"))
+        bundle_file.write(len(index_bytes).to_bytes(8, "little"))
+    os.replace(temporary_path, bundle_path)
+
+    return index
+
+
+#  /----\
+# | PACK |
+#  \----/
+if __name__ == "__main__":
+    from modules import assets
+
+    written_index = pack_assets(assets.ASSETS_PATH, BUNDLE_PATH)
+    print(f"[ASSETS BUNDLE]: {len(written_index)} images packed in {BUNDLE_PATH} ({os.path.getsize(BUNDLE_PATH)} bytes)")
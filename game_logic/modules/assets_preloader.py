@@ -0,0 +1,129 @@
+'''
+[ASSETS PRELOADER]:
+This class loads the images of the game in background, with a pool of threads,
+so that the main thread only has to wait for the images it needs to show the
+first frames (the "waiting for players" screen): everything else (the HUD, the
+digits, the sprites of every player, the "game over" screen...) gets decoded
+while the game is waiting for the players to connect.
+
+The images get loaded through the assets manager, so the preloaded surfaces are
+the very same (shared) surfaces which get returned when the game requests them:
+a request for an image which is still being decoded waits for its decoding to
+end, instead of decoding it again.
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from modules import assets
+
+
+class AssetsPreloader():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Folders (relative to the "assets" folder) whose images get preloaded]
+    PRELOADED_FOLDERS = ["game_scenario", "tiles", "players", "hud"]
+
+    # [Maximum number of threads of the pool]
+    MAX_WORKERS = 4
+
+    # [Class constructor]
+    def __init__(self, max_workers=None):
+        '''
+        [PARAMETERS]:
+        "self"        : reference to the current object
+        "max_workers" : number of threads of the pool (if "None", it depends
+                        on the number of CPUs, up to "MAX_WORKERS")
+        '''
+        if max_workers == None:
+            max_workers = min(AssetsPreloader.MAX_WORKERS, os.cpu_count() or 1)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assets_preloader")
+
+        self.pending_tasks = 0
+        self.tasks_lock = threading.Lock()
+        self.done_event = threading.Event()
+        self.done_event.set()           # No tasks have been submitted yet
+
+        self.scheduled_paths = set()    # Images which have already been scheduled
+        self.end_time = None            # "time.perf_counter()" at which the last task has ended
+        self.failed_paths = []          # Images which couldn't be loaded (they'll be loaded - and
+                                        # the error will be raised - when the game requests them)
+
+
+    # [Method to schedule a function to be executed by the pool]
+    def submit(self, function, *args):
+        with self.tasks_lock:
+            self.pending_tasks += 1
+            self.done_event.clear()
+
+        future = self.executor.submit(function, *args)
+        future.add_done_callback(self.task_done)
+        return future
+
+
+    # [Callback which gets called when a task of the pool ends]
+    def task_done(self, future):
+        with self.tasks_lock:
+            self.pending_tasks -= 1
+            if self.pending_tasks == 0:
+                self.end_time = time.perf_counter()
+                self.done_event.set()
+
+
+    # [Method to schedule the loading of a list of images]
+    def preload_images(self, relative_paths):
+        '''
+        [PARAMETERS]:
+        "relative_paths" : paths of the images (relative to the "assets" folder):
+                           they get loaded in the same order as the list
+        '''
+        for relative_path in relative_paths:
+            if relative_path not in self.scheduled_paths:
+                self.scheduled_paths.add(relative_path)
+                self.submit(self.preload_image, relative_path)
+
+
+    # [Method to schedule the loading of all the images of the "PRELOADED_FOLDERS"]
+    def preload_folders(self):
+        relative_paths = []
+        for folder in AssetsPreloader.PRELOADED_FOLDERS:
+            for subfolder, _, file_names in os.walk(os.path.join(assets.ASSETS_PATH, folder)):
+                for file_name in sorted(file_names):
+                    if file_name.lower().endswith(".png"):
+                        relative_paths.append(os.path.relpath(os.path.join(subfolder, file_name), assets.ASSETS_PATH).replace(os.sep, "/"))
+
+        # The images which have already been loaded (or scheduled) don't get scheduled
+        self.preload_images([relative_path for relative_path in relative_paths if relative_path not in assets.LOADED_SURFACES])
+
+
+    # [Method executed by the pool to load a single image]
+    def preload_image(self, relative_path):
+        try:
+            assets.load_image(relative_path)
+
+            # The preloading isn't an actual request of the game
+            with assets.assets_lock:
+                assets.REQUESTS_COUNT[relative_path] -= 1
+        except (OSError, ValueError, pygame.error):
+            self.failed_paths.append(relative_path)
+
+
+    # [Method which returns "True" if all the scheduled tasks have ended]
+    def is_done(self):
+        return self.done_event.is_set()
+
+
+    # [Method to wait for all the scheduled tasks to end]
+    def wait(self, timeout=None):
+        return self.done_event.wait(timeout)
+
+
+    # [Method to stop the threads of the pool (the tasks which haven't started yet get cancelled)]
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
@@ -0,0 +1,56 @@
+'''
+[CPU USAGE REPORT]:
+This module measures the CPU time used by the game (by all of its threads:
+the game loop, the simulation, the compositors, the serial communication...)
+in each of the states of the game loop (waiting for players, game session,
+game over, window minimized or unfocused, idle or not), together with the
+time spent in said states and the number of frames drawn in them.
+
+The CPU usage is the ratio between the CPU time and the time elapsed: "100%"
+means a whole core has been kept busy.
+'''
+
+# [IMPORT OF LIBRARIES]
+import time
+
+# [STATES] => For each state (in the order in which they've been entered):
+# elapsed time (in seconds), CPU time (in seconds), frames, frames drawn
+STATES = {}
+
+# Elapsed time and CPU time of the previous record
+PREVIOUS_TIMES = [time.perf_counter(), time.process_time()]
+
+
+# [Function to start the measurements (e.g. right before the game loop, so that the startup doesn't get counted)]
+def start():
+    PREVIOUS_TIMES[:] = [time.perf_counter(), time.process_time()]
+
+
+# [Function to record a frame (the time elapsed since the previous record gets assigned to the given state)]
+def record_frame(state_label, frame_drawn):
+    '''
+    [PARAMETERS]:
+        "state_label" : description of the state of the game loop during the frame
+        "frame_drawn" : "True" if the frame has been drawn (and pushed to the display)
+    '''
+    current_times = [time.perf_counter(), time.process_time()]
+
+    state = STATES.setdefault(state_label, [0.0, 0.0, 0, 0])
+    state[0] += current_times[0] - PREVIOUS_TIMES[0]
+    state[1] += current_times[1] - PREVIOUS_TIMES[1]
+    state[2] += 1
+    state[3] += 1 if frame_drawn else 0
+
+    PREVIOUS_TIMES[:] = current_times
+
+
+# [Function which returns the report on the CPU usage in each state]
+def get_report():
+    lines = ["[CPU USAGE REPORT]:",
+             f"{'STATE':<32}{'TIME (s)':>10}{'CPU (s)':>10}{'CPU (%)':>10}{'FRAMES':>10}{'DRAWN':>10}"]
+
+    for state_label, (elapsed_time, cpu_time, frames_num, drawn_frames_num) in STATES.items():
+        lines.append(f"{state_label:<32}{elapsed_time:>10.1f}{cpu_time:>10.1f}{cpu_time / max(elapsed_time, 1e-9) * 100:>10.1f}"
+                     f"{frames_num:>10}{drawn_frames_num:>10}")
+
+    return "\n".join(lines)
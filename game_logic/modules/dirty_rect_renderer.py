@@ -0,0 +1,177 @@
+'''
+[DIRTY RECT RENDERER]:
+This class collects - at every game loop iteration - the areas of the game
+surface which have changed since the previous frame (the "dirty rects"), and
+pushes to the display just those areas instead of the whole frame.
+
+The dirty rects can be added directly (e.g. the tiles which have been redrawn
+on the board surface) or computed by "tracking" an element of the frame: the
+renderer remembers the rect and the "state" with which each tracked element
+has been drawn in the previous frame, and when one of them changes, both the
+old rect and the new rect get marked as dirty. An element which stops being
+tracked (e.g. a power up which has been removed) gets its last rect marked
+as dirty too.
+
+When the dirty area exceeds a threshold (or a full update has been requested,
+because the display mode or the game phase has changed), the whole frame gets
+pushed to the display with a single "pygame.display.flip()".
+
+The rects are always expressed in "game surface" coordinates: when the display
+surface is bigger than the game surface (fullscreen), they get scaled to the
+display size before being pushed. The scaling never allocates a new surface:
+each dirty rect gets scaled straight into the corresponding area of the display
+surface (a subsurface of it). When the display size is an integer multiple of
+the game surface's size (e.g. 1280x720 => 2x), the scaled rects are exact, so
+the result is the same as scaling the whole frame.
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+from math import floor, ceil
+
+
+class DirtyRectRenderer():
+    # [Class constructor]
+    def __init__(self, base_size, full_update_threshold=0.4):
+        '''
+        [PARAMETERS]:
+        "self"                  : reference to the current object
+        "base_size"             : 2-elements tuple with the size of the game surface
+        "full_update_threshold" : portion of the game surface's area beyond which
+                                  the whole frame gets pushed to the display
+        '''
+        self.base_rect = pygame.Rect((0,0), base_size)
+        self.full_update_threshold = full_update_threshold
+
+        self.dirty_rects = []           # Dirty rects collected in the current frame
+        self.full_update = True         # The first frame always gets fully pushed
+
+        # [Tracked elements]: each key is associated with the
+        # "(rect, state)" couple it has been drawn with
+        self.tracked_elements = {}
+        self.tracked_this_frame = set()
+
+
+    # [Method to mark an area of the game surface as dirty]
+    def add_rect(self, rect):
+        rect = self.base_rect.clip(rect)
+        if rect.width > 0 and rect.height > 0:
+            self.dirty_rects.append(rect)
+
+
+    # [Method to mark several areas of the game surface as dirty]
+    def add_rects(self, rects):
+        for rect in rects:
+            self.add_rect(rect)
+
+
+    # [Method to request the whole frame to be pushed to the display]
+    def request_full_update(self):
+        self.full_update = True
+
+
+    # [Method to track an element which gets drawn on the game surface]
+    def track(self, key, rect, state):
+        '''
+        [PARAMETERS]:
+        "key"   : any hashable object which identifies the element
+        "rect"  : the area of the game surface the element gets drawn on
+        "state" : any value which changes when the element looks different
+                  (e.g. the element's surface, or the value it displays)
+        '''
+        rect = pygame.Rect(rect)
+        self.tracked_this_frame.add(key)
+
+        previous = self.tracked_elements.get(key)
+        if previous == None:
+            self.add_rect(rect)
+        elif previous[0] != rect or previous[1] != state:
+            self.add_rect(previous[0])
+            self.add_rect(rect)
+
+        self.tracked_elements[key] = (rect, state)
+
+
+    # [Method to push the frame (or the dirty parts of it) to the display]
+    def present(self, game_surface, screen):
+        '''
+        [PARAMETERS]:
+        "game_surface" : the surface on which the frame has been rendered
+        "screen"       : the display surface
+        '''
+        # The elements which haven't been drawn in this
+        # frame leave a dirty area behind them
+        for key in list(self.tracked_elements):
+            if key not in self.tracked_this_frame:
+                self.add_rect(self.tracked_elements.pop(key)[0])
+        self.tracked_this_frame = set()
+
+        dirty_rects = self.merge_rects(self.dirty_rects)
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+
+        if self.full_update or dirty_area > self.full_update_threshold * self.base_rect.width * self.base_rect.height:
+            if screen.get_size() == self.base_rect.size:
+                screen.blit(game_surface, (0,0))
+            else:
+                self.scale_into(game_surface, screen)
+            pygame.display.flip()
+        elif len(dirty_rects) > 0:
+            display_rects = [self.present_rect(game_surface, screen, rect) for rect in dirty_rects]
+            pygame.display.update(display_rects)
+
+        self.dirty_rects = []
+        self.full_update = False
+
+
+    # [Method to copy a single dirty rect from the game surface to the display
+    #  surface => it returns the corresponding rect on the display surface]
+    def present_rect(self, game_surface, screen, rect):
+        if screen.get_size() == self.base_rect.size:
+            screen.blit(game_surface, rect.topleft, rect)
+            return rect
+
+        display_rect = self.to_display_rect(rect, screen.get_size())
+        self.scale_into(game_surface.subsurface(rect), screen.subsurface(display_rect))
+        return display_rect
+
+
+    # [Static method to scale a surface into a destination surface (without allocating
+    #  the scaled surface, as long as the two surfaces have the same pixel format)]
+    @staticmethod
+    def scale_into(source, destination):
+        if source.get_bitsize() == destination.get_bitsize() and source.get_masks() == destination.get_masks():
+            pygame.transform.scale(source, destination.get_size(), destination)
+        else:
+            destination.blit(pygame.transform.scale(source, destination.get_size()), (0,0))
+
+
+    # [Method to convert a rect of the game surface to the
+    #  corresponding rect of a display of size "display_size"]
+    def to_display_rect(self, rect, display_size):
+        x_scale = display_size[0] / self.base_rect.width
+        y_scale = display_size[1] / self.base_rect.height
+
+        # The rect gets rounded "outwards", so that no
+        # pixel of the scaled area gets left behind
+        left = floor(rect.left * x_scale)
+        top = floor(rect.top * y_scale)
+        return pygame.Rect(left, top, ceil(rect.right * x_scale) - left, ceil(rect.bottom * y_scale) - top)
+
+
+    # [Static method to merge the overlapping rects of a list]
+    @staticmethod
+    def merge_rects(rects):
+        '''
+        Overlapping rects get replaced by their union, so that the
+        same pixels don't get pushed to the display more than once
+        (and the dirty area doesn't get counted more than once).
+        '''
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            overlapping_idx = rect.collidelist(merged)
+            while overlapping_idx != -1:
+                rect.union_ip(merged.pop(overlapping_idx))
+                overlapping_idx = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
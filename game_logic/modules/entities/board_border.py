@@ -16,9 +16,7 @@ Such an entity can be:
 
 # [IMPORTS OF LIBRARIES]
 from modules.entities.entity import Entity
-from modules.scripts import common_definitions as cmndef
-import pygame
-import os
+from modules import sprite_registry
 from modules.enumerations.border_type import BorderType     # Enumeration for the two different
                                                             # types of board border.
 
@@ -27,6 +25,8 @@ from modules.enumerations.direction import Direction        # Enumeration for th
 
 
 class BoardBorder(Entity):
+    __slots__ = ("border_type", "positioning")
+
     #  /----------------\
     # | STATIC CONSTANTS |
     #  \----------------/
@@ -42,6 +42,12 @@ class BoardBorder(Entity):
     HITBOX_X_OFFSET = 0
     HITBOX_Y_OFFSET = 0
 
+    # [INDEXES OF THE SPRITES IN THE
+    #  "board_border" SPRITE TABLE]
+    SIDE_TILE_SPRITE_IDX = 0
+    ROTATED_SIDE_TILE_SPRITE_IDX = 1
+    ANGLE_BLOCK_SPRITE_IDX = 2
+
     #  /-------\
     # | METHODS |
     #  \-------/
@@ -70,7 +76,11 @@ class BoardBorder(Entity):
         self.positioning = positioning
 
         # The constructor of the upper class gets called
-        super().__init__(grid_position, surface=self.compute_surface(), hitbox_size=self.compute_hitbox_size())
+        super().__init__(grid_position,
+                         sprite_table=sprite_registry.get_sprite_table("board_border"),
+                         sprite_idx=BoardBorder.SIDE_TILE_SPRITE_IDX,
+                         hitbox_size=self.compute_hitbox_size())
+        self.compute_surface()
 
         # The screen position gets updated on the basis of what kind of "boarder tile"
         # the current object represents => [I THINK THIS IS KIND OF A "WORKAROUND", BUT IT WILL PROBABLY
@@ -102,13 +112,14 @@ class BoardBorder(Entity):
             THE SURFACE OF THE OBJECT GETS DETERMINED JUST ONCE WHEN THE OBJECT GETS INSTANTIATED]
         '''
         if(self.border_type == BorderType.SIDE_TILE):
-            surface = pygame.image.load(os.path.join(cmndef.assets_path,"tiles/border_tiles/grey_side.png"))
             # Evaluate whether the surface has to be rotated or not
+            # (the rotated variant is shared by all the side tiles too)
             if(self.positioning == Direction.UP or self.positioning == Direction.DOWN):
-                surface = pygame.transform.rotate(surface, 90)
-            return surface
+                self.sprite_idx = BoardBorder.ROTATED_SIDE_TILE_SPRITE_IDX
+            else:
+                self.sprite_idx = BoardBorder.SIDE_TILE_SPRITE_IDX
         elif(self.border_type == BorderType.ANGLE_BLOCK):
-            return pygame.image.load(os.path.join(cmndef.assets_path,"tiles/border_tiles/grey_angle.png"))
+            self.sprite_idx = BoardBorder.ANGLE_BLOCK_SPRITE_IDX
 
 
     # [Method to compute the hitbox's size accordingly to the BorderType]
@@ -11,6 +11,15 @@ from abc import ABC, abstractmethod     # "Entity" is an abstract class, so it h
                                         # inherit from the "ABC" class.
 
 class Entity(ABC):
+    #  /-----------------------------------------------------------------\
+    # | [SLOTS]: the entities don't have a per-instance "__dict__" (every   |
+    # | specialized class declares its own attributes in its "__slots__"). |
+    # | The sprites aren't held by the entity: it only keeps a reference    |
+    # | to the (shared) sprite table of its type and the index of its       |
+    # | current sprite in said table (see "modules.sprite_registry").       |
+    #  \-----------------------------------------------------------------/
+    __slots__ = ("grid_position", "screen_position", "sprite_table", "sprite_idx", "hitbox")
+
     #  /----------------\
     # | STATIC CONSTANTS |
     #  \----------------/
@@ -27,12 +36,13 @@ class Entity(ABC):
     HITBOX_Y_OFFSET = 0
 
     # [Class constructor]
-    def __init__(self, grid_position, surface, hitbox_size):
+    def __init__(self, grid_position, sprite_table, sprite_idx, hitbox_size):
         '''
         [PARAMETERS]:
         "self"          : reference to the current object.
         "grid_position" : 2-elements tuple which indicates the position of the entity on the grid
-        "surface"       : the surface representing the entity on screen
+        "sprite_table"  : the (shared) list of surfaces which can represent the entity on screen
+        "sprite_idx"    : index - in the sprite table - of the surface representing the entity
         "hitbox_size"   : 2-elements tuple which indicates the size of the entity's hitbox                 
         '''
         self.grid_position = grid_position
@@ -43,11 +53,17 @@ class Entity(ABC):
                                                                      self.__class__.GRID_X_OFFSET,
                                                                      self.__class__.GRID_Y_OFFSET)
 
-        self.surface = surface
+        self.sprite_table = sprite_table
+        self.sprite_idx = sprite_idx
         self.hitbox = pygame.Rect(self.screen_position[0] + self.__class__.HITBOX_X_OFFSET,
                                   self.screen_position[1] + self.__class__.HITBOX_Y_OFFSET,
                                   hitbox_size[0], hitbox_size[1])
 
+    # [Property which returns the surface currently representing the entity]
+    @property
+    def surface(self):
+        return self.sprite_table[self.sprite_idx]
+
     # [Method to compute the entity surface at each game loop]
     @abstractmethod
     def compute_surface(self):
@@ -58,7 +74,7 @@ class Entity(ABC):
         It gets called for every entity at every iteration of
         the game loop, and its purpose is to determine which
         will be the entity's surface which will blitted in
-        the next loop.
+        the next loop (by updating the "sprite_idx" attribute).
         '''
         pass    # No implementation
 
@@ -78,8 +94,11 @@ class Entity(ABC):
         At the moment, I've chosen to let this method be NOT
         an abstract method: if the need arises for the specialized
         classes to process 
+
+        [N.B.]: It tests every collider of the list (until the first collision):
+        the simulation finds the colliders near the entity with a "SpatialHash".
         '''
-        collision_detected = False
         for elem in colliders_list:
-            collision_detected = collision_detected or self.hitbox.colliderect(elem.hitbox)
-        return collision_detected
\ No newline at end of file
+            if self.hitbox.colliderect(elem.hitbox):
+                return True
+        return False
\ No newline at end of file
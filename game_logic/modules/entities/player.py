@@ -1,23 +1,29 @@
 '''
 [PLAYER CLASS]:
 This class models the player.
-There can be up to 4 different players on the screen.
+There are usually 4 different players on the screen (but there can be more).
 '''
 
 # [IMPORTS OF LIBRARIES]
 from modules.entities.entity import Entity
-from modules.scripts import common_definitions as cmndef
-import pygame
-import os
+from modules import sprite_registry
+from modules import idle_throttle
 from modules.enumerations.direction import Direction                                # Enumeration for the four directions
 from modules.enumerations.game_phase import GamePhase
-from modules.player_scorer import PlayerScorer
 from modules.scripts.serial_communication import serial_communication as sercom     # For serial communication
 import queue
 import threading
 import time
 
 class Player(Entity):
+    __slots__ = ("score", "player_id", "current_anim_idx", "current_anim_slowdown_idx", "direction",
+                 "active_leds_num", "controller_serial_port",
+                 "has_power_up", "power_up_initial_validity", "power_up_validity",
+                 "power_up_validity_event",
+                 "is_powered_up", "power_up_duration", "power_up_duration_event",
+                 "gyro_msgs", "speed_msg", "gyro_buffer", "buffer_lock", "receiver_stop_event",
+                 "receiver_thread", "dequeueing_thread", "spatial_hash", "last_position_update")
+
     #  /----------------\
     # | STATIC CONSTANTS |
     #  \----------------/
@@ -45,9 +51,6 @@ class Player(Entity):
     SCORE_THRESHOLDS = [50, 150, 300, 500,       # When the player's score exceeds a threshold,
                        750, 1100, 1500, 1950]   # the corresponding LED gets turned on.
 
-    # [Starting positions on the grid for each player]
-    STARTING_POSITIONS = [(10,6), (15,6), (10,11), (15,11)]
-
     #  /-------\
     # | METHODS |
     #  \-------/
@@ -56,7 +59,7 @@ class Player(Entity):
         '''
         [PARAMETERS]:
         "self"      : reference to the current object.
-        "player_id" : it can be "1", "2", "3" or "4"
+        "player_id" : it goes from "1" up to the number of players of the match
         
         The here undocumented parameters are
         documented in the upper "Entity" class.
@@ -71,16 +74,15 @@ class Player(Entity):
         self.current_anim_slowdown_idx = 0  # This attribute specifies how many game loops
                                             # has the current animation frame been played for
 
-        self.animation_matrix = self.compute_animation_matrix(player_id)
         self.direction = Direction.DOWN     # The current direction of the player
 
         # Number of "Active LEDs" - this is the number of LEDs which have
         # been turned on by increasing the score during the game session. 
         self.active_leds_num = 0            # Initially, no LEDs are turned on
 
-        # Instantiation of the scorer (the reference to the current "Player"
-        # object gets passed as a parameter of the "PlayerScorer" constructor)
-        self.scorer = PlayerScorer(self)
+        # [N.B.]: The scorer (the HUD element of the player) isn't held by the player:
+        # it belongs to the render stage, which composes it from the snapshots of
+        # the player (see "modules.game_state")
 
         #  /---------------------------------------------------------------\
         # | [N.B.] - A number - and NOT a mask - is used to indicate the    |
@@ -97,14 +99,17 @@ class Player(Entity):
         # The player does not initially hold a "power up"
         self.has_power_up = False
         self.power_up_initial_validity = 15
-        self.power_up_validity = self.power_up_initial_validity
-        self.power_up_acquisition_time = 0  # Initially 0, it gets updated when the power up gets acquired
+        self.power_up_validity = self.power_up_initial_validity     # Seconds left to use the power up (it
+                                                                    # gets displayed by the scorer)
+        self.power_up_validity_event = None     # Next second of the countdown of the validity
+                                                # (scheduled by the simulation when the power up
+                                                # gets acquired)
         
         # State of the player with regards to the "power up"
         self.is_powered_up = False
-        self.initial_power_up_duration = 5
-        self.power_up_duration = self.initial_power_up_duration
-        self.power_up_activation_time = 0   # Initially 0, it gets updated when the power activates a power up
+        self.power_up_duration = 5000           # Duration (in ms) of the "speed up"
+        self.power_up_duration_event = None     # End of the "speed up" (scheduled by the simulation
+                                                # when the power up gets used)
 
         # Queues of messages coming from the board
         self.gyro_msgs = queue.Queue(maxsize=64)
@@ -126,65 +131,53 @@ class Player(Entity):
         # Dequeueing thread
         self.dequeueing_thread = self.start_dequeueing_thread()
 
-        # Blocking colliders => List of collidable objects which block the player movement when it collides with them
-        self.blocking_colliders = None      # It will be dynamically determined at the termination of the "player spawning" phase
+        # Spatial hash of the objects which block the player movement when it collides with them (see
+        # "SpatialHash") => the player gets inserted in it at the termination of the "player spawning"
+        # phase, and it updates its cells in the spatial hash whenever it moves
+        self.spatial_hash = None
 
         # Last position update => This 2-elements tuple gets used at each game loop to modify the
         # position of the player and to "revert the player's position in the collisions' handling system
         self.last_position_update = (0,0)   # It is initially zero
 
-        # The constructor of the upper class gets called
-        super().__init__(grid_position, surface=self.animation_matrix[Direction.UP.value][0], hitbox_size=(22,22))
+        # The constructor of the upper class gets called => the sprite table of the player
+        # contains the frames of animation for each direction (it's shared by all the
+        # "Player" objects with the same look)
+        super().__init__(grid_position,
+                         sprite_table=sprite_registry.get_sprite_table(f"player_{sprite_registry.get_player_look(player_id)}"),
+                         sprite_idx=Player.get_sprite_idx(Direction.UP, 0),
+                         hitbox_size=(22,22))
 
 
-    # [Method to compute the matrix whose rows are vectors
-    #  containing the surfaces which represent the frames
-    #  of animation in a specific direction].
-    def compute_animation_matrix(self,player_id):
+    # [Static method which returns the index - in the sprite table of the
+    #  player - of the animation frame "frame_idx" in a specific direction]
+    @staticmethod
+    def get_sprite_idx(direction, frame_idx):
         '''
         [PARAMETERS]:
-        "player_id"        : it will be used to select the animation frames which
-                             are correctly related to the player with said ID
-
-        [RETURN]:
-        "animation_matrix" : each row of said matrix contains the three surfaces
-                             associated with the animation frames in a specific direction
+        "direction" : element of the "Direction" enumeration
+        "frame_idx" : index of the animation frame ("0", "1" or "2")
         '''
-        # [ROW 0] => UP
-        up_direction = [pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/back_animation/back_1.png")),
-                        pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/back_animation/back_2.png")),
-                        pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/back_animation/back_3.png"))]
-
-        # [ROW 1] => RIGHT
-        right_direction = [pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/right_side_animation/right_side_1.png")),
-                           pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/right_side_animation/right_side_2.png")),
-                           pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/right_side_animation/right_side_3.png"))]
-
-        # [ROW 2] => DOWN
-        down_direction = [pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/frontal_animation/frontal_1.png")),
-                          pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/frontal_animation/frontal_2.png")),
-                          pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/frontal_animation/frontal_3.png"))]
-        
-        # [ROW 3] => LEFT
-        left_direction = [pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/left_side_animation/left_side_1.png")),
-                          pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/left_side_animation/left_side_2.png")),
-                          pygame.image.load(os.path.join(cmndef.assets_path,f"players/player_{player_id}/left_side_animation/left_side_3.png"))]
-        
-        return [up_direction, right_direction, down_direction, left_direction]
+        return direction.value * sprite_registry.PLAYER_ANIMATION_FRAMES_NUM + frame_idx
 
 
     # [Method to compute the entity surface at each game loop]
-    def compute_surface(self):
+    def compute_surface(self, tick_scale=1):
+        '''
+        [PARAMETERS]:
+        "tick_scale" : duration of the tick, relatively to a 1/60th of a second
+                       tick (the animation keeps the same pace at any tick rate)
+        '''
         # The surface gets computed before the update
-        self.surface = self.animation_matrix[self.direction.value][Player.ANIMATION_FRAMES_SEQUENCE[self.current_anim_idx]]
+        self.sprite_idx = Player.get_sprite_idx(self.direction, Player.ANIMATION_FRAMES_SEQUENCE[self.current_anim_idx])
 
         # The player animation only gets changed every "ANIMATION_SLOWDOWN_CONSTANT/60"th of a second
-        if(self.current_anim_slowdown_idx == Player.ANIMATION_SLOWDOWN_CONSTANT):
-            self.current_anim_slowdown_idx = 0
+        if(self.current_anim_slowdown_idx >= Player.ANIMATION_SLOWDOWN_CONSTANT):
+            self.current_anim_slowdown_idx -= Player.ANIMATION_SLOWDOWN_CONSTANT
             self.current_anim_idx = (self.current_anim_idx + 1) % len(Player.ANIMATION_FRAMES_SEQUENCE)
 
-        # At each game loop iteration, the slowdown index gets increased
-        self.current_anim_slowdown_idx += 1
+        # At each tick, the slowdown index gets increased (by the duration of the tick)
+        self.current_anim_slowdown_idx += tick_scale
 
 
     # [Method to change the player direction]
@@ -215,6 +208,10 @@ class Player(Entity):
         self.hitbox.x = self.screen_position[0] + Player.HITBOX_X_OFFSET
         self.hitbox.y = self.screen_position[1] + Player.HITBOX_Y_OFFSET
 
+        # The spatial hash has to know the cells the hitbox is in
+        if self.spatial_hash != None:
+            self.spatial_hash.update(self)
+
 
     # [Method to update the score and the active LEDs number]
     def update_score_and_leds(self, points_to_sum):
@@ -261,6 +258,9 @@ class Player(Entity):
                 # the main thread can read it
                 with self.buffer_lock:
                     self.gyro_buffer = msg
+
+                # If the reading moves the player, the game loop wakes up (if it's idle)
+                idle_throttle.wake_on_gyro_reading(msg)
             except queue.Empty:
                 pass  # If the queue is empty, the buffer won't be updated
 
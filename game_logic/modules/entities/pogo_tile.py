@@ -4,14 +4,15 @@ This class models the tiles on the "pogo board"
 '''
 
 # [IMPORT OF LIBRARIES]
+from array import array
 from modules.entities.entity import Entity
-from modules.scripts import common_definitions as cmndef
-import os
-import pygame
+from modules import sprite_registry
 
 
 # "pogoTile" class: each object of this class represents a pogo tile
 class PogoTile(Entity):
+    __slots__ = ("owners", "owner_idx", "board_ref", "board_idxs", "is_dirty")
+
     #  /----------------\
     # | STATIC CONSTANTS |
     #  \----------------/
@@ -28,36 +29,57 @@ class PogoTile(Entity):
     HITBOX_Y_OFFSET = 31
 
     # [Class constructor]
-    def __init__(self, grid_position):
+    def __init__(self, grid_position, board_ref=None, board_idxs=None):
         '''
         [PARAMETERS]:
+        "board_ref"  : reference to the "PogoBoard" object the tile belongs to
+                       (it gets notified when the tile has to be redrawn)
+        "board_idxs" : 2-elements tuple with the indexes of the tile in the
+                       matrix of tiles of the board
+
         The here undocumented parameters are
         documented in the upper "Entity" class.
         '''
 
-        # "surface_vector" is the vector which contains the four
-        # different surfaces which can be attributed to the
-        # current tile object.
-        self.surface_vector = [pygame.image.load(os.path.join(cmndef.assets_path, "tiles/pogo_tiles/empty_tile.png")),
-                               pygame.image.load(os.path.join(cmndef.assets_path, "tiles/pogo_tiles/p1_tile.png")),
-                               pygame.image.load(os.path.join(cmndef.assets_path, "tiles/pogo_tiles/p2_tile.png")),
-                               pygame.image.load(os.path.join(cmndef.assets_path, "tiles/pogo_tiles/p3_tile.png")),
-                               pygame.image.load(os.path.join(cmndef.assets_path, "tiles/pogo_tiles/p4_tile.png"))]
-
         #  /--------------------------------------------------------------------\
         # | ID of the player who acquired this cell of the "pogo board".         | 
-        # | It can be "0" (the cell is free) or "1, 2, 3, 4", which are          |
+        # | It can be "0" (the cell is free) or "1, 2, 3, 4..." which are        |
         # | the proper values of the "player_id" attribute of the "Player" class |
+        # | => it's stored in the owner grid of the board (see "PogoBoard"), so  |
+        # | that the tile and the board can't disagree on it.                    |
         #  \--------------------------------------------------------------------/
-        self.player_id = 0      # The cell is initially free
+        if board_ref != None:
+            self.owners = board_ref.owners
+            self.owner_idx = board_idxs[0] * board_ref.board_dimensions[1] + board_idxs[1]
+        else:
+            self.owners = array("B", [0])   # A tile without a board stores its own owner
+            self.owner_idx = 0
+
+        self.board_ref = board_ref
+        self.board_idxs = board_idxs
+
+        # "True" when the acquisition of the tile has changed, but the
+        # tile hasn't been redrawn on the board's surface yet
+        self.is_dirty = False
 
-        # The constructor of the upper class gets called
-        super().__init__(grid_position, surface=self.surface_vector[0], hitbox_size=(2,2))
+        # The constructor of the upper class gets called => the sprite table of the
+        # tiles contains the five surfaces which can be attributed to a tile (it's
+        # shared by all the tiles, and it's indexed by the ID of the player)
+        super().__init__(grid_position,
+                         sprite_table=sprite_registry.get_sprite_table("pogo_tile"),
+                         sprite_idx=0,
+                         hitbox_size=(2,2))
+
+
+    # [ID of the player who acquired the tile (read from the owner grid)]
+    @property
+    def player_id(self):
+        return self.owners[self.owner_idx]
 
 
     # [Method to compute the entity surface at each game loop]
     def compute_surface(self):
-        self.surface = self.surface_vector[self.player_id]
+        self.sprite_idx = sprite_registry.get_player_look(self.player_id)
     
     # [Method to change the player id relative to
     #  the player who has acquired the tile]
@@ -65,4 +87,11 @@ class PogoTile(Entity):
         # It's a simple method, but I deemed it cleaner
         # to set this information via a method, rather than
         # accessing the object's attribute directly
-        self.player_id = player_id
\ No newline at end of file
+        if player_id == self.player_id:
+            return      # Nothing changes, so the tile doesn't have to be redrawn
+
+        self.owners[self.owner_idx] = player_id
+
+        # The board gets notified that (only) this tile has to be redrawn
+        if self.board_ref != None:
+            self.board_ref.mark_tile_dirty(self)
@@ -5,13 +5,13 @@ the map at regular time intervals and at random positions on the board.
 '''
 
 # [IMPORT OF LIBRARIES]
-from modules.scripts import common_definitions as cmndef
 from modules.entities.entity import Entity
-import pygame
-import os
+from modules import sprite_registry
 
 
 class PowerUp(Entity):
+    __slots__ = ("instantiation_time", "validity", "expiry_event")
+
     #  /----------------\
     # | STATIC CONSTANTS |
     #  \----------------/
@@ -28,25 +28,25 @@ class PowerUp(Entity):
     HITBOX_Y_OFFSET = 14
 
     # [Class constructor]
-    def __init__(self, grid_position, instantiation_time, initial_validity=7):
+    def __init__(self, grid_position, instantiation_time, validity=7000):
         self.grid_position = grid_position
         
-        self.instantiation_time = instantiation_time    # The second at which the
-                                                        # power up gets instantiated
+        self.instantiation_time = instantiation_time    # The time (in ms) of the game clock
+                                                        # at which the power up gets instantiated
 
-        # Validity (in seconds) of the power up.
-        self.initial_validity = initial_validity          
-        self.validity = self.initial_validity           # After this time elapses, the power up
-                                                        # gets removed from the board.
+        # Validity (in ms) of the power up => after this time elapses, the power up
+        # gets removed from the board (its value is now predetermined at "7" seconds,
+        # but it could be changed if we deem it too short or too long).
+        self.validity = validity
 
-        # "validity" is the attribute which gets updated at every second
-        # "initial_validity" is the constant initial value of said
-        # attribute (its value is now predetermined at "7", but it could
-        # be changed if we deem it too short or too long).
+        # The expiry of the power up gets scheduled by the simulation (and it gets
+        # cancelled if a player acquires the power up before it expires)
+        self.expiry_event = None
 
         # The constructor of the upper class gets called
         super().__init__(grid_position,
-                         surface=pygame.image.load(os.path.join(cmndef.assets_path,"tiles/power_up_tile_shining.png")),
+                         sprite_table=sprite_registry.get_sprite_table("power_up"),
+                         sprite_idx=0,
                          hitbox_size=(2,2))
 
 
@@ -0,0 +1,10 @@
+from enum import Enum
+
+# [N.B.]: The tiers are cumulative => each tier also applies the
+# reductions of the tiers with lower values
+class QualityTier(Enum):
+    FULL = 0                    # Everything gets drawn
+    NO_GLOBAL_OVERLAYS = 1      # The global shadows and lights don't get drawn
+    REDUCED_HUD_REDRAWS = 2     # The scorers' panels (with the LEDs' glows) get composed less often
+    LOW_RESOLUTION = 3          # The frames get pushed at the base resolution (and scaled by SDL)
+    REDUCED_FRAME_RATE = 4      # The frame rate gets halved (the simulation isn't affected)
@@ -0,0 +1,12 @@
+from enum import Enum
+
+# [N.B.]: The layers get drawn in ascending order of their values
+class RenderLayer(Enum):
+    POWER_UPS = 0
+    PLAYERS = 1
+    POWER_UP_SLOT_SHADOWS = 2
+    SCORERS = 3
+    POWER_UP_SLOTS = 4
+    TIMER = 5
+    GAME_OVER = 6
+    WAITING_FOR_PLAYERS = 7
\ No newline at end of file
@@ -0,0 +1,146 @@
+'''
+[EVENT SCHEDULER]:
+This class schedules the callbacks which have to be called once, at a given
+time of the game clock (the time simulated by the ticks, in milliseconds): the
+spawning of the power ups, their expiry, the countdown of the power up held by
+a player and the end of the "speed up" of a player.
+
+The events are kept in a heap ordered by their due time (the events due at the
+same time keep the order in which they've been scheduled), so each tick only
+looks at the top of the heap: the cost of a tick depends on how many events are
+due, not on how many are waiting (e.g. the power ups on the board, whose expiry
+doesn't have to be checked at every tick anymore).
+
+A scheduled event can be cancelled (e.g. the expiry of a power up which has been
+acquired): it stays in the heap, but it gets discarded - without calling its
+callback - once it's due.
+'''
+
+# [IMPORT OF LIBRARIES]
+import heapq
+
+
+#  /--------------------------------------------------------------------\
+# | SCHEDULED EVENT => Handle returned by "EventScheduler.schedule" (it   |
+# | can be passed to "EventScheduler.cancel").                           |
+#  \--------------------------------------------------------------------/
+class ScheduledEvent():
+    __slots__ = ("due_time", "callback", "args", "is_cancelled")
+
+    # [Class constructor]
+    def __init__(self, due_time, callback, args):
+        self.due_time = due_time        # Time (in ms) of the game clock at which the callback gets called
+        self.callback = callback
+        self.args = args
+        self.is_cancelled = False
+
+
+class EventScheduler():
+    # [Class constructor]
+    def __init__(self):
+        # [HEAP] => "(due_time, sequence_num, event)" tuples (the sequence number
+        # breaks the ties between the events due at the same time)
+        self.heap = []
+        self.sequence_num = 0
+
+
+    # [Method to schedule a callback]
+    def schedule(self, due_time, callback, *args):
+        '''
+        [PARAMETERS]:
+        "self"     : reference to the current object
+        "due_time" : time (in ms) of the game clock at which "callback" gets called
+        "callback" : function called (once) with "args" when the event is due
+
+        [RETURN]:
+        "event" : the "ScheduledEvent" (to cancel it)
+        '''
+        event = ScheduledEvent(due_time, callback, args)
+        heapq.heappush(self.heap, (due_time, self.sequence_num, event))
+        self.sequence_num += 1
+        return event
+
+
+    # [Method to cancel a scheduled event (nothing happens if it has already been called)]
+    def cancel(self, event):
+        if event != None:
+            event.is_cancelled = True
+
+
+    # [Method which calls the callbacks of the events due by the current time of the game clock]
+    def run_due_events(self, current_time):
+        '''
+        [PARAMETERS]:
+        "current_time" : time (in ms) of the game clock
+
+        [RETURN]:
+        "called_events_num" : number of callbacks which have been called
+
+        The callbacks can schedule new events: if they are already due as well,
+        they get called before returning.
+        '''
+        heap = self.heap
+        called_events_num = 0
+
+        while len(heap) > 0 and heap[0][0] <= current_time:
+            event = heapq.heappop(heap)[2]
+            if event.is_cancelled:
+                continue
+
+            # The event can't be called (or cancelled) again
+            event.is_cancelled = True
+            event.callback(*event.args)
+            called_events_num += 1
+
+        return called_events_num
+
+
+    # [Method which returns the number of events in the heap (including the cancelled ones which aren't due yet)]
+    def get_pending_events_num(self):
+        return len(self.heap)
+
+
+    # [Method to remove all the events]
+    def clear(self):
+        self.heap = []
+
+
+#  /----\
+# | TEST |
+#  \----/
+if __name__ == "__main__":
+    # [TEST]: the callbacks get called once, in the order of their due times (and
+    # of their scheduling, at the same due time), except for the cancelled ones
+    import random
+
+    random.seed(0)
+    scheduler = EventScheduler()
+    called = []
+
+    expected = []
+    events = []
+    for sequence_num in range(2000):
+        due_time = random.randint(0, 500) * 10 + random.choice([0, 0.5])
+        events.append(scheduler.schedule(due_time, lambda *args: called.append(args), due_time, sequence_num))
+        expected.append((due_time, sequence_num))
+
+    for event in random.sample(events, 500):
+        scheduler.cancel(event)
+        expected.remove(event.args)
+
+    # The game clock advances by ticks of "1000/60" ms, and a callback schedules another event
+    # due right away (which gets called in the same tick)
+    scheduler.schedule(2500, lambda: scheduler.schedule(2500, called.append, (2500, "rescheduled")))
+    expected.sort()
+    expected.insert(sum(1 for due_time, _ in expected if due_time <= 2500), (2500, "rescheduled"))
+
+    tick = 0
+    while scheduler.get_pending_events_num() > 0:
+        tick += 1
+        scheduler.run_due_events(tick * 1000 / 60)
+
+    if called != expected:
+        print("[FAILED]: the callbacks haven't been called once each, in the order of their due times")
+        raise SystemExit(1)
+
+    print(f"[PASSED]: {len(called)} callbacks called once each, in the order of their due times")
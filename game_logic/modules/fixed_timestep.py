@@ -0,0 +1,109 @@
+'''
+[FIXED TIMESTEP]:
+This class decouples the rate of the simulation from the rate of the frames:
+the simulation always advances by ticks of the same duration ("1 / tick_rate"
+seconds), and at every frame the accumulator tells how many ticks are due for
+the time which has actually elapsed since the previous frame.
+
+This way the game plays the same way whatever the frame rate is: if a frame
+takes longer than expected, the following one simulates more ticks to catch
+up (up to "max_ticks_per_frame": beyond that, the excess time gets dropped and
+the game slows down, instead of simulating more and more ticks per frame),
+and on a faster machine the game doesn't run faster.
+
+The time left in the accumulator (less than a tick) gets returned as the
+"interpolation factor" ("alpha"): the render stage draws the sprites between
+the positions of the two latest ticks, so their movement stays smooth even
+when the tick rate and the frame rate differ.
+'''
+
+# [IMPORT OF LIBRARIES]
+import time
+
+
+class FixedTimestep():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Default number of ticks per second]
+    DEFAULT_TICK_RATE = 60
+
+    # [Default maximum number of ticks simulated in a single frame]
+    MAX_TICKS_PER_FRAME = 5
+
+    # [Class constructor]
+    def __init__(self, tick_rate=DEFAULT_TICK_RATE, max_ticks_per_frame=MAX_TICKS_PER_FRAME):
+        '''
+        [PARAMETERS]:
+        "self"                : reference to the current object
+        "tick_rate"           : number of ticks simulated per second
+        "max_ticks_per_frame" : maximum number of ticks simulated to catch up
+                                in a single frame
+        '''
+        self.tick_rate = tick_rate
+        self.tick_duration = 1000 / tick_rate   # Duration of a tick (in ms)
+        self.max_ticks_per_frame = max_ticks_per_frame
+
+        # Time (in ms) which hasn't been simulated yet
+        self.accumulator = 0
+
+        # Time (in ms) of the previous call of the "advance" method
+        self.previous_time = None
+
+        # Total time (in ms) which has been dropped because of the cap on the ticks
+        self.dropped_time = 0
+
+
+    # [Method which returns the number of ticks due at the current frame]
+    def advance(self, current_time=None):
+        '''
+        [PARAMETERS]:
+        "current_time" : current time (in ms) => if "None", it gets read from
+                         the performance counter
+
+        [RETURN]:
+        "ticks_num" : number of ticks which have to be simulated (at most
+                      "max_ticks_per_frame")
+        '''
+        if current_time == None:
+            current_time = time.perf_counter() * 1000
+
+        # At the first frame, no time has elapsed yet
+        if self.previous_time != None:
+            self.accumulator += current_time - self.previous_time
+        self.previous_time = current_time
+
+        ticks_num = int(self.accumulator // self.tick_duration)
+
+        # The ticks beyond the cap get dropped (with the time they represent)
+        if ticks_num > self.max_ticks_per_frame:
+            self.dropped_time += (ticks_num - self.max_ticks_per_frame) * self.tick_duration
+            ticks_num = self.max_ticks_per_frame
+
+        self.accumulator -= ticks_num * self.tick_duration
+        self.accumulator = min(self.accumulator, self.tick_duration)
+        return ticks_num
+
+
+    # [Method to change the number of ticks per second (from the next frame on)]
+    def set_tick_rate(self, tick_rate):
+        '''
+        [PARAMETERS]:
+        "tick_rate" : number of ticks simulated per second
+
+        The time left in the accumulator is kept (it's less than a tick of
+        the new duration, if the new tick rate is lower).
+        '''
+        self.tick_rate = tick_rate
+        self.tick_duration = 1000 / tick_rate
+        self.accumulator = min(self.accumulator, self.tick_duration)
+
+
+    # [Method which returns the interpolation factor between the two latest ticks]
+    def get_alpha(self):
+        '''
+        [RETURN]:
+        "alpha" : portion (between "0" and "1") of a tick which has elapsed
+                  since the latest simulated tick
+        '''
+        return min(self.accumulator / self.tick_duration, 1.0)
@@ -0,0 +1,19 @@
+'''
+[GAME EVENTS]:
+This module defines the events which the simulation emits when something
+discrete happens during a tick (e.g. a tile changes owner), so that the logic
+which depends on it (e.g. the detection of the closed rectangles) only runs
+when it actually happens, instead of at every tick.
+'''
+
+# [IMPORT OF LIBRARIES]
+from collections import namedtuple
+
+
+#  /--------------------------------------------------------------------\
+# | TILE CAPTURED => A player has acquired a tile which belonged to      |
+# | another player (or to nobody).                                       |
+#  \--------------------------------------------------------------------/
+# "player" : the "Player" object who has captured the tile
+# "cell"   : 2-elements tuple with the indexes (i,j) of the tile in the board
+TileCaptured = namedtuple("TileCaptured", ["player", "cell"])
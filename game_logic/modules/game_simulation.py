@@ -0,0 +1,595 @@
+'''
+[GAME SIMULATION]:
+This class holds the state of the game (the players, the logic of the pogo
+board, the power ups, the timer...) and advances it by one tick at a time:
+the spawning of the players, the movement, the collisions, the acquisition of
+the tiles (with the closure of the rectangles), the power ups and the timer.
+
+The ticks have a fixed duration ("1 / tick_rate" seconds): the speeds of the
+players (tuned at "REFERENCE_TICK_RATE" ticks per second) get scaled to the
+duration of a tick, and the timers count the time simulated by the ticks (not
+the time elapsed on the machine), so the game plays the same way whatever the
+tick rate and the frame rate are (see "modules.fixed_timestep").
+
+After the ticks of a frame, it takes immutable snapshots of the state (see
+"modules.game_state"), which is all the render stage gets to see: this way,
+the ticks can be simulated (by the "SimulationPipeline") while the snapshots
+of the previous ones are being drawn, without the frame ever showing objects
+which have only been partially updated.
+'''
+
+# [IMPORT OF LIBRARIES]
+import random
+import threading
+from collections import deque
+from modules.scripts import common_definitions as cmndef
+from modules.entities.power_up import PowerUp
+from modules.pogo_board import PogoBoard
+from modules.game_state import GameSnapshot, PlayerSnapshot, PowerUpSnapshot
+from modules.game_events import TileCaptured
+from modules.spatial_hash import SpatialHash
+from modules.event_scheduler import EventScheduler
+from modules.enumerations.direction import Direction
+from modules.enumerations.game_phase import GamePhase
+from modules.scripts.rectangle_closure import RectangleClosure
+from modules.scripts.serial_communication import spawn_players as spwpl
+
+
+class GameSimulation():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Number of ticks per second at which the speeds below have been tuned]
+    REFERENCE_TICK_RATE = 60
+
+    # [Speeds of the players (pixels per reference tick, for a unitary gyroscope reading)]
+    PLAYER_SPEED = 7.5
+    POWERED_UP_PLAYER_SPEED = 15
+
+    # [Interval (in ms) between the spawns of the power ups]
+    POWER_UP_SPAWN_INTERVAL = 15000
+
+    # [Step (in ms) of the countdown of the validity of the power up held by a player]
+    POWER_UP_COUNTDOWN_STEP = 1000
+
+    # [Class constructor]
+    def __init__(self, board_dimensions, grid_position, tick_rate=REFERENCE_TICK_RATE, players_num=spwpl.MAX_PLAYERS_NUM,
+                 detects_players=True):
+        '''
+        [PARAMETERS]:
+        "self"             : reference to the current object
+        "board_dimensions" : dimensions of the pogo board (see "PogoBoard")
+        "grid_position"    : grid position of the pogo board (see "PogoBoard")
+        "tick_rate"        : number of ticks simulated per second
+        "players_num"      : number of players of the match (the game session starts
+                             as soon as all of them have spawned)
+        "detects_players"  : if "False", the thread which detects the controllers on the
+                             serial ports doesn't get started (the tests and the benchmarks
+                             append the players to "players" themselves)
+        '''
+        # Duration of a tick (in ms), and ratio between said duration and
+        # the duration of a reference tick (the movements get scaled by it)
+        self.tick_rate = tick_rate
+        self.tick_duration = 1000 / tick_rate
+        self.tick_scale = GameSimulation.REFERENCE_TICK_RATE / tick_rate
+
+        # [GAME PHASE]
+        # 0 -> Player spawning phase
+        # 1 -> Game session
+        self.game_phase = GamePhase.PLAYER_SPAWNING     # Before the game session can start, the players have
+                                                        # to spawn first (which happens by connecting with the
+                                                        # several STM32F3DISCOVERY boards).
+
+        # The pogo board of the simulation only holds the logic of the board (the
+        # acquisition of the tiles in the owner grid): the render stage
+        # draws its own board, from the tile owners held by the snapshots
+        self.pogo_board = PogoBoard(board_dimensions, grid_position)
+
+        # The closed rectangles (at least 3x3) get found on the bitboards of the players
+        self.rectangle_closure = RectangleClosure(board_dimensions, (3,3))
+
+        # "TileCaptured" events emitted by the current tick, which haven't been handled yet
+        self.tile_captured_events = deque()
+
+        # Matrix of the owners of the tiles held by the snapshots => it only gets
+        # taken again (by "take_snapshot") after a tile has changed owner
+        self.tile_owners = None
+
+        # The players start on the board, spread from its corners (it raises a
+        # "ValueError" if there are more players than the board can hold)
+        self.players_num = players_num
+        self.starting_positions = self.pogo_board.get_starting_positions(players_num)
+
+        # The players get instantiated
+        self.players = []   # Initially, there are no players instantiated:
+                            # each player will get spawned if a board gets
+                            # connected to the game
+
+        # Generating a "stopping event" for the player spawning thread
+        self.player_spawning_stop_event = threading.Event()
+
+        # Starting the players spawning thread
+        self.player_spawning_thread = None
+        if detects_players:
+            self.player_spawning_thread = spwpl.start_players_detecting_thread(self.players, self.player_spawning_stop_event, self.starting_positions)
+
+        # Game termination state
+        self.game_termination = False
+
+        # Number of ticks simulated so far
+        self.tick = 0
+
+        # Time (in ms) simulated by the ticks so far => it gets used to update the timer
+        self.simulated_time = 0
+
+        # Tick and simulated time at which the tick rate has been set (the time
+        # simulated since then gets computed from the number of ticks, so that
+        # it doesn't accumulate rounding errors)
+        self.tick_rate_start_tick = 0
+        self.tick_rate_start_time = 0
+
+        # Time (in seconds) elapsed since the start of the game
+        self.elapsed_time_sec = 0
+
+        # Time left (in seconds) for the game session
+        # to get terminated => it gets displayed by the timer
+        self.time_left = cmndef.MAX_TIME
+
+        # List of "PowerUp" objects
+        # which are currently present
+        # on the map
+        self.power_ups = []
+
+        # The same power ups, indexed by the cells of the grid their hitboxes are in
+        # => the power ups acquired by a player are the ones found in the cells of
+        # the hitbox of the player (see "SpatialHash")
+        self.power_ups_hash = SpatialHash(cmndef.GRID_CELL_SIZE)
+
+        # The spawns of the power ups, their expiry, the countdowns of the power ups held by
+        # the players and the ends of the "speed ups" are events scheduled on the time
+        # simulated by the ticks => each tick only calls the callbacks of the events which
+        # are due (see "EventScheduler"), instead of checking every timer. The first spawn
+        # gets scheduled once the game session starts.
+        self.event_scheduler = EventScheduler()
+
+        # These are the objects with which every player will collide (the side tiles
+        # of the borders and - once the game session starts - the other players),
+        # indexed by the cells of the grid their hitboxes are in => the collisions of
+        # a player only get tested with the colliders near the player
+        self.colliders_hash = SpatialHash(cmndef.GRID_CELL_SIZE)
+        for direction in [Direction.UP, Direction.RIGHT, Direction.DOWN, Direction.LEFT]:
+            for side_tile in self.pogo_board.board_borders['side_tiles'][direction.value]:
+                self.colliders_hash.insert(side_tile)
+
+        # Snapshots of the two latest ticks (the render stage
+        # interpolates the positions of the sprites between them)
+        self.snapshot = self.take_snapshot()
+        self.previous_snapshot = self.snapshot
+
+
+    # [Method to simulate the ticks due at a frame]
+    def advance(self, ticks_num):
+        '''
+        [PARAMETERS]:
+        "ticks_num" : number of ticks to simulate (it can be "0", if the frame
+                      comes before the end of the next tick)
+
+        [RETURN]:
+        "previous_snapshot" : the "GameSnapshot" of the second-to-last tick
+        "snapshot"          : the "GameSnapshot" of the latest tick
+
+        Only the snapshots of the two latest ticks get taken.
+        '''
+        if ticks_num > 0:
+            for _ in range(ticks_num - 1):
+                self.step()
+            self.previous_snapshot = self.take_snapshot() if ticks_num > 1 else self.snapshot
+
+            self.step()
+            self.snapshot = self.take_snapshot()
+
+        return self.previous_snapshot, self.snapshot
+
+
+    # [Method to change the number of ticks simulated per second (from the next tick on)]
+    def set_tick_rate(self, tick_rate):
+        '''
+        [PARAMETERS]:
+        "tick_rate" : number of ticks simulated per second
+
+        The time simulated so far doesn't change: the following ticks just
+        have a different duration (and the movements get scaled accordingly).
+        '''
+        self.tick_rate_start_tick = self.tick
+        self.tick_rate_start_time = self.simulated_time
+
+        self.tick_rate = tick_rate
+        self.tick_duration = 1000 / tick_rate
+        self.tick_scale = GameSimulation.REFERENCE_TICK_RATE / tick_rate
+
+
+    # [Method to simulate a tick of the game]
+    def step(self):
+        self.update_game_phase()
+
+        if self.game_phase == GamePhase.GAME_SESSION:
+            self.update_players_movement()
+
+        self.update_tiles_acquisition()
+
+        if self.game_phase == GamePhase.GAME_SESSION:
+            self.update_power_ups()
+
+        # The players' animations move forward
+        for player in self.players:
+            player.compute_surface(self.tick_scale)
+
+        self.tick += 1
+        self.simulated_time = self.tick_rate_start_time + (self.tick - self.tick_rate_start_tick) * 1000 / self.tick_rate
+        self.update_timer()
+
+
+    # [Method which checks if the proper game phase has to be started]
+    def update_game_phase(self):
+        if self.game_phase != GamePhase.PLAYER_SPAWNING:
+            return
+
+        # As soon as all the players have
+        # spawned, the game starts
+        if len(self.players) == self.players_num:
+            # The next game phase gets prepared by terminating
+            # and joining the player spawning thread (the players
+            # become colliders, and they keep their cells updated)
+            for player in self.players:
+                self.colliders_hash.insert(player)
+                player.spatial_hash = self.colliders_hash
+            self.player_spawning_stop_event.set()
+            if self.player_spawning_thread != None:
+                self.player_spawning_thread.join()
+            self.game_phase = GamePhase.GAME_SESSION
+
+            # No power up spawns while waiting for the players: the first one spawns at the
+            # next multiple of 15 seconds of the timer (which counts from the start)
+            first_spawn_time = (self.simulated_time // GameSimulation.POWER_UP_SPAWN_INTERVAL + 1) * GameSimulation.POWER_UP_SPAWN_INTERVAL
+            self.event_scheduler.schedule(first_spawn_time, self.spawn_power_up, first_spawn_time)
+
+
+    # [Method which handles the player control system (movement, power up, collisions)]
+    def update_players_movement(self):
+        #  /------------------------\
+        # | POWER UP/SPEED UP SYSTEM |
+        #  \------------------------/
+        for player in self.players:
+            if player.has_power_up:
+                # If the player has pressed the USER BUTTON
+                # (a "HspeedPgo" message has arrived), the
+                # power up gets used
+                if(player.speed_msg[0] != None):
+                    player.speed_msg[0] = None
+                    player.has_power_up = False    # The power up has been consumed
+                    self.event_scheduler.cancel(player.power_up_validity_event)
+
+                    # The player is now "powered up" (a "speed up" which was
+                    # already going on starts again from the beginning)
+                    player.is_powered_up = True
+                    self.event_scheduler.cancel(player.power_up_duration_event)
+                    player.power_up_duration_event = self.event_scheduler.schedule(self.simulated_time + player.power_up_duration,
+                                                                                   self.end_speed_up, player)
+
+        #  /---------------\
+        # | MOVEMENT SYSTEM |
+        #  \---------------/
+        if(not self.game_termination):
+            for player in self.players:
+                player.last_position_update = player.gyro_buffer
+                # The speed gets scaled to the duration of a tick
+                if not player.is_powered_up:
+                    speed = GameSimulation.PLAYER_SPEED * self.tick_scale
+                else:
+                    speed = GameSimulation.POWERED_UP_PLAYER_SPEED * self.tick_scale
+                player.last_position_update = (player.last_position_update[0]*speed, - player.last_position_update[1]*speed)
+                player.change_direction(cmndef.determine_direction(player.last_position_update))
+                player.update_position(player.last_position_update)
+
+        #  /----------------\
+        # | COLLISION SYSTEM |
+        #  \----------------/
+        # If the movement has caused the current player to collide,
+        # the position update gets reverted before the actual blitting.
+        # By doing so, the player's hitbox won't get stuck into other
+        # player's (or entity's) hitboxes.
+        for player in self.players:
+            # [CHECK COLLISIONS] => with the borders and with the other players
+            if(self.colliders_hash.collides_any(player.hitbox, player)):
+                # If a player collides with at least one
+                # collider, its latest movement gets "reverted"
+                player.update_position((player.last_position_update[0] * -1,
+                                        player.last_position_update[1] * -1))
+
+
+    # [Method which checks if the "change tile acquisition" event has to be triggered]
+    def update_tiles_acquisition(self):
+        pogo_board = self.pogo_board
+
+        for player in self.players:
+            # [For each tile whose hitbox collides with the player's hitbox] => they get
+            # computed from the position of the player, instead of testing every tile
+            for i, j in pogo_board.get_tile_idxs_under(player.hitbox):
+                # The event only gets emitted if the owner of the tile changes (a player
+                # standing on one of their own tiles doesn't capture anything)
+                if pogo_board.pogo_tiles[i][j].player_id != player.player_id:
+                    self.tile_captured_events.append(TileCaptured(player, (i, j)))
+
+            # The events get handled (in the order in which they've been emitted) before
+            # checking the next player => if the closure of a rectangle resets a tile
+            # which the next player is standing on, said player captures it right away
+            while len(self.tile_captured_events) > 0:
+                self.handle_tile_captured(self.tile_captured_events.popleft())
+
+
+    # [Method which handles the capture of a tile (acquisition and closure of the rectangles)]
+    def handle_tile_captured(self, event):
+        '''
+        [PARAMETERS]:
+        "event" : the "TileCaptured" event
+        '''
+        pogo_board = self.pogo_board
+        player = event.player
+        i, j = event.cell
+
+        # Change the "player_id" for the tile => the owner grid of the board has a single
+        # owner for each tile, so the tile gets taken away from the previous owner as well
+        pogo_board.pogo_tiles[i][j].change_acquisition(player.player_id)
+
+        # Check if a rectangle has been closed => only the rectangles whose perimeter
+        # includes the tile can have been closed (see "RectangleClosure")
+        closed_rectangle = self.rectangle_closure.find_smallest_rectangle_through(pogo_board.get_owned_mask(player.player_id), (i, j))
+
+        # If the player has closed a rectangle
+        if(closed_rectangle[0] != (-1,-1)):
+            # The player's score gets updated with the rectangle's area
+            player.update_score_and_leds(closed_rectangle[1]*closed_rectangle[2])
+
+            # [THE TILES CORRESPONDING TO THE CLOSED RECTANGLE GET "RESET"-TED]
+            pogo_board.reset_perimeter(*closed_rectangle[:3])
+
+        # The owners of the tiles have changed => the next snapshot takes them again
+        self.tile_owners = None
+
+
+    # [Method which handles the power up acquisition system]
+    def update_power_ups(self):
+        # [ACQUISITION] => Only the power ups in the cells of the hitbox of each
+        # player get checked (the first player who reaches a power up acquires it)
+        for player in self.players:
+            for power_up in self.power_ups_hash.collisions(player.hitbox):
+                # [Once the power up has been acquired, it gets removed from the
+                #  list of power ups positioned on the board (it won't expire)]
+                self.event_scheduler.cancel(power_up.expiry_event)
+                self.remove_power_up(power_up)
+
+                # The countdown of the validity of the power up held by the
+                # player (re)starts, and it decreases every second
+                player.has_power_up = True
+                player.power_up_validity = player.power_up_initial_validity
+                self.event_scheduler.cancel(player.power_up_validity_event)
+                countdown_time = self.simulated_time + GameSimulation.POWER_UP_COUNTDOWN_STEP
+                player.power_up_validity_event = self.event_scheduler.schedule(countdown_time, self.count_down_power_up_validity,
+                                                                               player, countdown_time)
+
+
+    # [Callback of the event which spawns a power up in a random place on the board (every 15 seconds)]
+    def spawn_power_up(self, spawn_time):
+        # No power up gets spawned once the game session has been terminated
+        if self.game_termination:
+            return
+
+        board_dimensions, grid_position = self.pogo_board.board_dimensions, self.pogo_board.grid_position
+        power_up = PowerUp((random.randint(0, board_dimensions[0] - 1) + grid_position[0],
+                            random.randint(0, board_dimensions[1] - 1) + grid_position[1]), spawn_time)
+        self.add_power_up(power_up)
+
+        # The power up expires after its validity (unless it gets acquired first)
+        power_up.expiry_event = self.event_scheduler.schedule(spawn_time + power_up.validity, self.remove_power_up, power_up)
+
+        # The following spawn gets scheduled from the time of this one (so
+        # the spawns don't drift with the duration of the ticks)
+        next_spawn_time = spawn_time + GameSimulation.POWER_UP_SPAWN_INTERVAL
+        self.event_scheduler.schedule(next_spawn_time, self.spawn_power_up, next_spawn_time)
+
+
+    # [Callback of the event which decreases the validity of the power up held by a player (every second)]
+    def count_down_power_up_validity(self, player, countdown_time):
+        player.power_up_validity -= 1
+        if(player.power_up_validity == 0):
+            player.has_power_up = False     # The power up hasn't been used in time
+            player.power_up_validity_event = None
+            return
+
+        countdown_time += GameSimulation.POWER_UP_COUNTDOWN_STEP
+        player.power_up_validity_event = self.event_scheduler.schedule(countdown_time, self.count_down_power_up_validity,
+                                                                       player, countdown_time)
+
+
+    # [Callback of the event which ends the "speed up" of a player]
+    def end_speed_up(self, player):
+        player.is_powered_up = False
+        player.power_up_duration_event = None
+
+
+    # [Method to position a power up on the board]
+    def add_power_up(self, power_up):
+        self.power_ups.append(power_up)
+        self.power_ups_hash.insert(power_up)
+
+
+    # [Method to remove a power up from the board]
+    def remove_power_up(self, power_up):
+        self.power_ups.remove(power_up)
+        self.power_ups_hash.remove(power_up)
+
+
+    # [Method which updates the timer, terminates the game session and calls the callbacks of the due events]
+    def update_timer(self):
+        # The game gets terminated as soon as a
+        # player reaches the highest score
+        if any(player.score == cmndef.MAX_SCORE for player in self.players):
+            self.game_termination = True
+
+        #  /------------------------------------------------------\
+        # | Calculating the time (in seconds) that has been      |
+        # | simulated between the first tick and the current one |
+        #  \------------------------------------------------------/
+        self.elapsed_time_sec = int(self.simulated_time // 1000)
+
+        if not self.game_termination:
+            # This gets used to calculate the time left
+            # for the game session to get terminated.
+            self.time_left = cmndef.MAX_TIME - self.elapsed_time_sec
+
+            if(self.time_left == 0):
+                self.game_termination = True
+                for power_up in self.power_ups:
+                    self.event_scheduler.cancel(power_up.expiry_event)
+                self.power_ups = []     # When there's no time left, all of the "PowerUp" objects
+                                        # get removed from the list (this way, they won't be
+                                        # drawn on the board in the following frames)
+                self.power_ups_hash.clear()
+
+        # The events due by the time simulated so far (spawns and expiries of the power
+        # ups, countdowns of the power ups held by the players, ends of the "speed ups")
+        self.event_scheduler.run_due_events(self.simulated_time)
+
+
+    # [Method to take the (immutable) snapshot of the current state of the game]
+    def take_snapshot(self):
+        # [N.B.]: The players get copied first, given that the spawning
+        # thread may append a new player in the meanwhile
+        players = tuple(PlayerSnapshot.of(player) for player in list(self.players))
+
+        winning_player_idx = None
+        if self.game_termination and len(players) > 0:
+            winning_player_idx = sorted(players, key=lambda p: p.score)[-1].player_id - 1
+
+        if self.tile_owners == None:
+            self.tile_owners = self.pogo_board.get_tile_owners()
+
+        return GameSnapshot(self.tick,
+                            self.game_phase,
+                            self.game_termination,
+                            self.time_left,
+                            players,
+                            tuple(PowerUpSnapshot.of(power_up) for power_up in self.power_ups),
+                            self.tile_owners,
+                            winning_player_idx)
+
+
+if __name__ == "__main__":
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The test can run headless
+
+    from modules.fixed_timestep import FixedTimestep
+    from modules.entities.player import Player
+
+    SIMULATED_TIME = 20000                              # Duration of each match (in ms)
+    FRAME_DURATIONS = {"60 FPS": [1000/60],             # Frame pacings (durations of the frames, in ms)
+                       "24 FPS": [1000/24],
+                       "jittery": [5, 40, 16, 70, 9, 33]}
+
+    # [Function which plays a match with the given frame pacing => snapshot of the last tick]
+    def play_match(frame_durations):
+        random.seed(0)
+        simulation = GameSimulation((8,8), (9,5), detects_players=False)
+
+        # Four players (without a controller)
+        for player_idx in range(4):
+            simulation.players.append(Player(simulation.starting_positions[player_idx], player_idx + 1, None))
+
+        # The gyroscope readings change with the simulated time (they don't
+        # depend on the frames), so the players go round in squares
+        def simulate_ticks(ticks_num):
+            for _ in range(ticks_num):
+                for player_idx, player in enumerate(simulation.players):
+                    direction = (simulation.tick // (40 + 10 * player_idx)) % 4
+                    player.gyro_buffer = [(0.6,0), (0,-0.6), (-0.6,0), (0,0.6)][direction]
+                simulation.advance(1)
+
+        timestep = FixedTimestep()
+        last_tick = SIMULATED_TIME * timestep.tick_rate // 1000
+        current_time, frame_idx = 0, 0
+        timestep.advance(current_time)
+        while simulation.tick < last_tick:
+            current_time += frame_durations[frame_idx % len(frame_durations)]
+            frame_idx += 1
+
+            # (the last frame doesn't go beyond the last tick)
+            simulate_ticks(min(timestep.advance(current_time), last_tick - simulation.tick))
+
+        for player in simulation.players:
+            player.receiver_stop_event.set()
+        return simulation.snapshot
+
+    snapshots = {pacing: play_match(frame_durations) for pacing, frame_durations in FRAME_DURATIONS.items()}
+    reference_snapshot = snapshots["60 FPS"]
+
+    for pacing, snapshot in snapshots.items():
+        if snapshot != reference_snapshot:
+            print(f"[FAILED]: the match played at {pacing} differs from the one played at 60 FPS")
+            raise SystemExit(1)
+
+    print(f"[PASSED]: the match plays the same way at {', '.join(FRAME_DURATIONS)} "
+          f"({reference_snapshot.tick} ticks, scores: {[player.score for player in reference_snapshot.players]})")
+
+    # [TEST]: the timer keeps counting the simulated time when the tick rate changes
+    # (2 s at 60 ticks per second, 3 s at 10 ticks per second, 1 s at 60 ticks per second)
+    simulation = GameSimulation((8,8), (9,5), detects_players=False)
+    for tick_rate, seconds in [(60, 2), (10, 3), (60, 1)]:
+        simulation.set_tick_rate(tick_rate)
+        simulation.advance(tick_rate * seconds)
+
+    if simulation.elapsed_time_sec != 6 or simulation.time_left != cmndef.MAX_TIME - 6:
+        print(f"[FAILED]: {simulation.elapsed_time_sec} s simulated instead of 6 s")
+        raise SystemExit(1)
+
+    print("[PASSED]: the timer counts the simulated time across the changes of the tick rate")
+
+    # [TEST]: no power up spawns while waiting for the players (20 s), and the first one
+    # spawns at the next multiple of 15 seconds once the game session has started
+    random.seed(0)
+    simulation = GameSimulation((8,8), (9,5), detects_players=False)
+    for _ in range(20 * simulation.tick_rate):
+        _, snapshot = simulation.advance(1)
+        if snapshot.game_phase == GamePhase.PLAYER_SPAWNING and len(snapshot.power_ups) > 0:
+            print(f"[FAILED]: a power up has spawned at tick {snapshot.tick}, while waiting for the players")
+            raise SystemExit(1)
+
+    for player_idx in range(4):
+        simulation.players.append(Player(simulation.starting_positions[player_idx], player_idx + 1, None))
+    _, snapshot = simulation.advance(10 * simulation.tick_rate)
+
+    if snapshot.game_phase != GamePhase.GAME_SESSION or [power_up.key[1] for power_up in snapshot.power_ups] != [30000]:
+        print(f"[FAILED]: power ups spawned at {[power_up.key[1] for power_up in snapshot.power_ups]} ms instead of 30000 ms")
+        raise SystemExit(1)
+
+    print("[PASSED]: the power ups only spawn during the game session")
+
+    # [TEST]: the number of tiles acquired by each player (and of the free tiles) counted
+    # over the owner grid matches the bitboard of the player (after 20 s of captures)
+    for _ in range(20 * simulation.tick_rate):
+        for player_idx, player in enumerate(simulation.players):
+            direction = (simulation.tick // (40 + 10 * player_idx)) % 4
+            player.gyro_buffer = [(0.6,0), (0,-0.6), (-0.6,0), (0,0.6)][direction]
+        simulation.advance(1)
+
+    pogo_board = simulation.pogo_board
+    for player_id in range(len(simulation.players) + 1):
+        owned_cells_num = pogo_board.count_owned_cells(player_id)
+        if owned_cells_num != pogo_board.get_owned_mask(player_id).bit_count():
+            print(f"[FAILED]: {owned_cells_num} tiles counted for the player {player_id}, "
+                  f"{pogo_board.get_owned_mask(player_id).bit_count()} in the bitboard")
+            raise SystemExit(1)
+
+    print("[PASSED]: the tiles counted over the owner grid match the bitboards of the players")
+
+    for player in simulation.players:
+        player.receiver_stop_event.set()
@@ -0,0 +1,94 @@
+'''
+[GAME STATE]:
+This module defines the immutable snapshots of the state of the game which the
+simulation produces at the end of every tick ("GameSnapshot"), and which the
+render stage consumes to draw the corresponding frame.
+
+The render stage never reads the "Player", "PowerUp" and "PogoBoard" objects of
+the simulation (which - with the pipeline - get updated by another thread while
+the frame is being drawn): everything it needs gets copied into the snapshot,
+made only of tuples and of the (shared, never modified) surfaces of the sprite
+tables.
+'''
+
+# [IMPORT OF LIBRARIES]
+from collections import namedtuple
+from modules.entities.player import Player
+
+
+#  /---------------------------------------------------------------------\
+# | SNAPSHOT OF A PLAYER => It's got the same attributes which the         |
+# | "PlayerScorer" reads from a player (so a scorer can compose its panels |
+# | straight from the snapshot), plus what's needed to draw the sprite.   |
+#  \---------------------------------------------------------------------/
+class PlayerSnapshot(namedtuple("PlayerSnapshot", ["player_id", "surface", "screen_position",
+                                                   "score", "active_leds_num",
+                                                   "has_power_up", "power_up_validity"])):
+    __slots__ = ()
+
+    # The score thresholds are read by the scorers through the class of the player
+    SCORE_THRESHOLDS = Player.SCORE_THRESHOLDS
+
+    # [Class method to take the snapshot of a player]
+    @classmethod
+    def of(cls, player):
+        return cls(player.player_id, player.surface, player.screen_position,
+                   player.score, player.active_leds_num,
+                   player.has_power_up, player.power_up_validity)
+
+
+#  /--------------------------------------------------------------------\
+# | SNAPSHOT OF A POWER UP => "key" identifies the power up (there's at   |
+# | most one power up spawned at a time, so the grid position and the    |
+# | time of the instantiation are enough) across the snapshots.          |
+#  \--------------------------------------------------------------------/
+class PowerUpSnapshot(namedtuple("PowerUpSnapshot", ["key", "surface", "screen_position"])):
+    __slots__ = ()
+
+    # [Class method to take the snapshot of a power up]
+    @classmethod
+    def of(cls, power_up):
+        return cls((power_up.grid_position, power_up.instantiation_time), power_up.surface, power_up.screen_position)
+
+
+#  /--------------------------------------------------------------------\
+# | SNAPSHOT OF THE WHOLE GAME AT THE END OF A TICK                      |
+#  \--------------------------------------------------------------------/
+# "tick"               : number of the tick which has produced the snapshot
+# "game_phase"         : element of the "GamePhase" enumeration
+# "game_termination"   : "True" once the game session has been terminated
+# "time_left"          : time (in seconds) displayed by the timer
+# "players"            : tuple of "PlayerSnapshot" (in the order of spawning)
+# "power_ups"          : tuple of "PowerUpSnapshot" of the power ups on the board
+# "tile_owners"        : tuple of rows (one for each column "i" of the board) with
+#                        the IDs of the players who have acquired the tiles
+# "winning_player_idx" : index of the player with the highest score (or "None"
+#                        while the game session hasn't been terminated)
+GameSnapshot = namedtuple("GameSnapshot", ["tick", "game_phase", "game_termination", "time_left",
+                                           "players", "power_ups", "tile_owners", "winning_player_idx"])
+
+
+# [Function which interpolates the screen positions of the players between two snapshots]
+def get_interpolated_positions(previous_snapshot, snapshot, alpha):
+    '''
+    [PARAMETERS]:
+    "previous_snapshot" : snapshot of the second-to-last tick
+    "snapshot"          : snapshot of the latest tick
+    "alpha"             : portion of a tick elapsed since the latest tick ("0"
+                          => the positions of the previous snapshot, "1" =>
+                          the positions of the latest one)
+
+    [RETURN]:
+    "positions" : tuple with the screen position of each player of "snapshot"
+                  (the players who weren't in the previous snapshot are drawn
+                  where they are in the latest one)
+    '''
+    previous_positions = {player.player_id: player.screen_position for player in previous_snapshot.players}
+
+    positions = []
+    for player in snapshot.players:
+        position = player.screen_position
+        previous_position = previous_positions.get(player.player_id, position)
+        positions.append((previous_position[0] + (position[0] - previous_position[0]) * alpha,
+                          previous_position[1] + (position[1] - previous_position[1]) * alpha))
+    return tuple(positions)
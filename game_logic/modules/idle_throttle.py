@@ -0,0 +1,252 @@
+'''
+[IDLE THROTTLE]:
+This class keeps the game from burning a whole core while nothing is going
+on: while waiting for the players, after the game session has been terminated
+and while the window can't be seen (minimized) or isn't focused, the game loop
+becomes "idle":
+
+    1) The frames only get drawn (and pushed to the display) when something
+       visible has changed (the snapshot of the game differs from the one of
+       the latest frame drawn, or the frame has to be pushed again).
+
+    2) While waiting for the players or after the game over, the simulation
+       drops to "IDLE_TICK_RATE" ticks per second (nothing moves: the players
+       can't move before the game session and after its termination), and the
+       game loop runs at "IDLE_FRAME_RATE" frames per second. During the game
+       session, the ticks keep their rate, and the game loop runs at
+       "AWAY_FRAME_RATE" frames per second (the ticks of each frame stay below
+       the cap of the "FixedTimestep", so the game doesn't slow down).
+
+    3) While the window is minimized, no frame gets drawn at all (and, while
+       it's idle and unfocused, neither does the game loop draw any frame).
+
+Instead of sleeping, the idle game loop waits for the events of pygame: any
+input (keyboard, mouse, joystick), the focus or the restoration of the window
+and the "WAKE_EVENT" (posted by the other threads through "wake", when a new
+controller gets connected or a gyroscope reading moves a player) wake it up
+immediately, and it stays awake for "WAKE_HOLD_TIME" seconds.
+'''
+
+# [IMPORT OF LIBRARIES]
+import time
+import threading
+import pygame
+from modules.enumerations.game_phase import GamePhase
+
+# [WAKE EVENT] => Event of pygame which wakes the idle game loop up
+WAKE_EVENT = pygame.event.custom_type()
+
+# [IDLE EVENT] => Set while the game loop is idle (the other threads only post
+# the "wake event" then, so that the queue of the events doesn't get flooded)
+IDLE_EVENT = threading.Event()
+
+# [Gyroscope readings (on both axes) below which the players don't wake the game loop up]
+GYRO_WAKE_THRESHOLD = 0.05
+
+
+# [Function to wake the game loop up (it can be called by any thread)]
+def wake():
+    if IDLE_EVENT.is_set():
+        IDLE_EVENT.clear()
+        try:
+            pygame.event.post(pygame.event.Event(WAKE_EVENT))
+        except pygame.error:
+            pass    # The display has already been closed
+
+
+# [Function to wake the game loop up if a gyroscope reading moves a player]
+def wake_on_gyro_reading(gyro_reading):
+    if abs(gyro_reading[0]) > GYRO_WAKE_THRESHOLD or abs(gyro_reading[1]) > GYRO_WAKE_THRESHOLD:
+        wake()
+
+
+class IdleThrottle():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Ticks per second and frames per second while waiting for the players and after the game over]
+    IDLE_TICK_RATE = 10
+    IDLE_FRAME_RATE = 10
+
+    # [Frames per second while the game session is running, with the window minimized or unfocused]
+    AWAY_FRAME_RATE = 20
+
+    # [Seconds during which the game loop stays awake after an input (or a wake event)]
+    WAKE_HOLD_TIME = 3.0
+
+    # [Events which wake the game loop up]
+    WAKING_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                     pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN,
+                     pygame.JOYBUTTONUP, pygame.JOYHATMOTION, pygame.JOYDEVICEADDED, WAKE_EVENT)
+
+    # [Class constructor]
+    def __init__(self, active_tick_rate, enabled=True):
+        '''
+        [PARAMETERS]:
+        "self"             : reference to the current object
+        "active_tick_rate" : number of ticks per second while the game loop isn't idle
+        "enabled"          : "False" to never become idle (every frame gets drawn)
+        '''
+        self.active_tick_rate = active_tick_rate
+        self.enabled = enabled
+
+        self.is_idle = False
+        self.is_waiting = False     # "True" while waiting for the players or after the game over
+
+        # State of the window
+        self.window_visible = True
+        self.window_focused = True
+
+        # Time of the latest input (the game starts awake)
+        self.wake_time = time.perf_counter()
+
+        # Start time of the current frame
+        self.frame_start_time = self.wake_time
+
+        # Description of what the game loop is doing (for the CPU usage report)
+        self.state_label = None
+
+        # Visible state of the latest frame drawn, and "True" if the next frame
+        # has to be drawn anyway (e.g. the window's content has been lost)
+        self.drawn_state = None
+        self.redraw_requested = True
+
+        # Event which has woken the game loop up (it gets handled with the following ones)
+        self.waking_event = None
+
+
+    # [Method which returns the events of pygame (starting with the one which has woken the game loop up)]
+    def get_events(self):
+        events = pygame.event.get()
+        if self.waking_event != None:
+            events.insert(0, self.waking_event)
+            self.waking_event = None
+        return events
+
+
+    # [Method to handle an event of pygame (window state and inputs)]
+    def handle_event(self, event):
+        if event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.window_visible = False
+
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSHOWN):
+            self.window_visible = True
+            self.request_redraw()
+            self.wake_time = time.perf_counter()
+
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.window_focused = False
+
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.window_focused = True
+            self.wake_time = time.perf_counter()
+
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.request_redraw()
+
+        elif event.type in IdleThrottle.WAKING_EVENTS:
+            self.wake_time = time.perf_counter()
+
+
+    # [Method to update the idle state at the start of a frame]
+    def update(self, snapshot):
+        '''
+        [PARAMETERS]:
+        "snapshot" : the "GameSnapshot" of the latest frame
+
+        [RETURN]:
+        "is_idle" : "True" if the game loop is idle
+        '''
+        self.frame_start_time = time.perf_counter()
+
+        self.is_waiting = snapshot.game_phase == GamePhase.PLAYER_SPAWNING or snapshot.game_termination
+        is_away = not self.window_visible or not self.window_focused
+        is_awake = self.frame_start_time - self.wake_time < IdleThrottle.WAKE_HOLD_TIME
+
+        self.is_idle = self.enabled and (self.is_waiting or is_away) and not is_awake
+
+        # The other threads only wake the game loop up while it's idle
+        if self.is_idle:
+            IDLE_EVENT.set()
+        else:
+            IDLE_EVENT.clear()
+
+        if not self.window_visible:
+            self.state_label = "Window minimized"
+        elif not self.window_focused:
+            self.state_label = "Window unfocused"
+        elif snapshot.game_termination:
+            self.state_label = "Game over"
+        elif snapshot.game_phase == GamePhase.PLAYER_SPAWNING:
+            self.state_label = "Waiting for players"
+        else:
+            self.state_label = "Game session"
+        self.state_label += " (idle)" if self.is_idle else ""
+
+        return self.is_idle
+
+
+    # [Method which returns the number of ticks per second of the simulation]
+    def get_tick_rate(self):
+        # [N.B.]: The tick rate only gets lowered when nothing can move (while
+        # the game session is running, the players keep their usual speed)
+        if self.is_idle and self.is_waiting:
+            return min(IdleThrottle.IDLE_TICK_RATE, self.active_tick_rate)
+        return self.active_tick_rate
+
+
+    # [Method to request the next frame to be drawn (even if nothing visible has changed)]
+    def request_redraw(self):
+        self.redraw_requested = True
+
+
+    # [Method which tells if the current frame has to be drawn]
+    def needs_frame(self, visible_state):
+        '''
+        [PARAMETERS]:
+        "visible_state" : anything (comparable) which describes what the frame
+                          shows (e.g. the snapshot and the interpolated positions)
+
+        [RETURN]:
+        "needs_frame" : "False" if the frame can be skipped
+        '''
+        if not self.enabled:
+            return True
+
+        # Nobody's looking at the window
+        if not self.window_visible or (self.is_idle and not self.window_focused):
+            return False
+
+        if not self.redraw_requested and visible_state == self.drawn_state:
+            return False
+
+        self.drawn_state = visible_state
+        self.redraw_requested = False
+        return True
+
+
+    # [Method to wait for the next frame]
+    def wait_next_frame(self, clock, frame_rate):
+        '''
+        [PARAMETERS]:
+        "clock"      : the "pygame.time.Clock" of the game loop
+        "frame_rate" : frames per second while the game loop isn't idle
+
+        While idle, the wait gets interrupted by the first event of pygame.
+        '''
+        if not self.is_idle:
+            clock.tick(frame_rate)
+            return
+
+        idle_frame_rate = IdleThrottle.IDLE_FRAME_RATE if self.is_waiting else IdleThrottle.AWAY_FRAME_RATE
+        timeout = int((self.frame_start_time + 1 / idle_frame_rate - time.perf_counter()) * 1000)
+
+        # [N.B.]: "pygame.event.wait" waits forever with a timeout of "0"
+        if timeout > 0 and not pygame.event.peek():
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                self.waking_event = event
+
+        # The clock restarts from the end of the wait
+        clock.tick()
+
@@ -0,0 +1,84 @@
+'''
+[LAYER COMPOSITOR]:
+This class composes the off-screen layers of the frame which are independent
+from one another (the board's surface, the scorers' panels, the timer...) in
+parallel, on a small pool of threads: pygame releases the GIL while it blits,
+fills and draws, so the layers actually get composed at the same time on a
+multi-core machine. The game loop waits for all of them to be composed, and
+then draws them on the frame as usual.
+
+The work is split into "lanes": each lane is a list of tasks which get executed
+one after the other (in the given order) by the same thread, while the lanes
+get executed in parallel. Two lanes MUST NOT use the same surfaces, neither as
+destinations nor as sources (SDL keeps the state of a blit in the source
+surface, so two threads blitting the same sprite would corrupt each other's
+blits): e.g. the four scorers share the graphics of the HUD, so they're
+composed by the same lane. This way, the output doesn't depend on how the
+lanes get scheduled.
+
+With "parallel" set to "False" (or when there's at most one lane with some
+work to do), the lanes get composed serially on the calling thread.
+'''
+
+# [IMPORT OF LIBRARIES]
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+class LayerCompositor():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Maximum number of threads of the pool]
+    MAX_WORKERS = 3
+
+    # [Class constructor]
+    def __init__(self, parallel=True, max_workers=None):
+        '''
+        [PARAMETERS]:
+        "self"        : reference to the current object
+        "parallel"    : "False" to compose the lanes serially (on the calling thread)
+        "max_workers" : number of threads of the pool (if "None", it depends
+                        on the number of CPUs, up to "MAX_WORKERS")
+        '''
+        if max_workers == None:
+            max_workers = min(LayerCompositor.MAX_WORKERS, os.cpu_count() or 1)
+
+        # On a single CPU there's nothing to gain from the threads
+        self.parallel = parallel and max_workers > 1
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="layer_compositor") if self.parallel else None
+
+
+    # [Method to compose the lanes and wait for all of them to be composed]
+    def compose(self, lanes):
+        '''
+        [PARAMETERS]:
+        "lanes" : list of lanes, each of them being a list of functions (without
+                  arguments) which compose the layers handled by the lane
+
+        [RETURN]:
+        "results" : for each lane, the list of the values returned by its functions
+                    (in the same order as the lanes and the functions)
+        '''
+        busy_lanes_num = sum(1 for lane in lanes if len(lane) > 0)
+        if not self.parallel or busy_lanes_num <= 1:
+            return [LayerCompositor.compose_lane(lane) for lane in lanes]
+
+        # The first lane gets composed by the calling thread
+        # while the other ones get composed by the pool
+        futures = [self.executor.submit(LayerCompositor.compose_lane, lane) if len(lane) > 0 else None for lane in lanes[1:]]
+        results = [LayerCompositor.compose_lane(lanes[0])]
+        results += [future.result() if future != None else [] for future in futures]
+        return results
+
+
+    # [Static method to execute the functions of a lane, one after the other]
+    @staticmethod
+    def compose_lane(lane):
+        return [function() for function in lane]
+
+
+    # [Method to stop the threads of the pool]
+    def shutdown(self):
+        if self.executor != None:
+            self.executor.shutdown(wait=True)
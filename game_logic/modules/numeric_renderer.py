@@ -0,0 +1,182 @@
+'''
+[NUMERIC RENDERER]:
+This module renders strings of digits (the timer, the scores, the countdown of
+the "power up" slot...) with the bitmap fonts of the HUD: each "NumericFont" is
+a set of glyphs (one surface per character, with an optional shadow), which
+all of the numeric elements of the HUD share.
+
+The rendered strings get memoized in a bounded LRU cache, so that a string which
+has already been rendered (e.g. the timer, which only changes once a second)
+doesn't get composed again: the strings of the timer (from "00:00" to "02:00")
+are few enough to be rendered all at once, in background.
+
+The fonts get instantiated the first time they're requested (by "get_timer_font"
+and "get_hud_font"), so that their glyphs can be converted to the display's
+pixel format.
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+import threading
+from collections import OrderedDict
+from modules import assets
+
+
+class NumericFont():
+    # [Class constructor]
+    def __init__(self, glyphs, advance, size, shadows=None, glyphs_offset=(0,0), advances=None, cache_size=128):
+        '''
+        [PARAMETERS]:
+        "self"          : reference to the current object
+        "glyphs"        : dictionary "character" -> surface of the glyph
+        "advance"       : distance (in pixels) between the beginning of a glyph and the next
+        "size"          : 2-elements tuple with the size of the rendered surfaces
+        "shadows"       : dictionary "character" -> surface of the glyph's shadow (or "None")
+        "glyphs_offset" : position of the glyphs relatively to the shadows
+        "advances"      : dictionary "character" -> advance, for the characters whose advance
+                          differs from "advance" (e.g. a space, which doesn't have a glyph)
+        "cache_size"    : maximum number of rendered strings kept in the cache
+        '''
+        self.glyphs = glyphs
+        self.advance = advance
+        self.size = size
+        self.shadows = shadows
+        self.glyphs_offset = glyphs_offset
+        self.advances = advances if advances != None else {}
+
+        # [LRU CACHE] => "string" -> rendered surface (the most
+        # recently used strings are at the end of the dictionary)
+        self.cache_size = cache_size
+        self.rendered_strings = OrderedDict()
+        self.cache_lock = threading.Lock()      # The strings can be rendered in background
+
+        # SDL keeps the state of a blit in the source surface, so two strings of the same
+        # font (which share the glyphs) can't be composed at the same time by two threads
+        self.compose_lock = threading.Lock()
+
+
+    # [Method which returns the position (relative to the first glyph) of each character of a string]
+    def get_glyph_positions(self, text):
+        positions = []
+        x = 0
+        for character in text:
+            positions.append(x)
+            x += self.advances.get(character, self.advance)
+        return positions
+
+
+    # [Method to blit the glyphs of a string (without shadows) directly on a surface]
+    def blit_text(self, destination, text, position):
+        '''
+        [PARAMETERS]:
+        "destination" : the surface the string gets blitted on
+        "text"        : the string (its characters without a glyph - e.g. the spaces - only advance)
+        "position"    : 2-elements tuple with the position of the first glyph
+        '''
+        destination.fblits([(self.glyphs[character], (position[0] + x, position[1]))
+                            for character, x in zip(text, self.get_glyph_positions(text))
+                            if character in self.glyphs])
+
+
+    # [Method which returns the surface of a string, with its shadows]
+    def render(self, text):
+        '''
+        [RETURN]:
+        "surface" : the (memoized) surface of the string => it's shared
+                    by all the callers, so it must not be modified
+        '''
+        with self.cache_lock:
+            surface = self.rendered_strings.get(text)
+            if surface != None:
+                self.rendered_strings.move_to_end(text)
+                return surface
+
+        with self.compose_lock:
+            surface = self.compose(text)
+
+        with self.cache_lock:
+            self.rendered_strings[text] = surface
+            if len(self.rendered_strings) > self.cache_size:
+                self.rendered_strings.popitem(last=False)     # The least recently used string gets discarded
+
+        return surface
+
+
+    # [Method to render all the strings of a list in advance]
+    def precompute(self, texts):
+        for text in texts:
+            self.render(text)
+
+
+    # [Method to compose the surface of a string]
+    def compose(self, text):
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+
+        if self.shadows == None:
+            self.blit_text(surface, text, (0,0))
+            return surface
+
+        # The shadows get blitted first, then the glyphs get composed
+        # on their own transparent surface, which gets blitted on top
+        # of the shadows (so that the shadows are underneath the glyphs)
+        positions = self.get_glyph_positions(text)
+        surface.fblits([(self.shadows[character], (x, 0))
+                        for character, x in zip(text, positions)
+                        if character in self.shadows])
+
+        glyphs_height = max(glyph.get_height() for glyph in self.glyphs.values())
+        glyphs_width = sum(self.advances.get(character, self.advance) for character in text)
+        glyphs_surface = pygame.Surface((glyphs_width, glyphs_height), pygame.SRCALPHA)
+        self.blit_text(glyphs_surface, text, (0,0))
+
+        surface.blit(glyphs_surface, self.glyphs_offset)
+        return surface
+
+
+#  /-----\
+# | FONTS |
+#  \-----/
+# [Fonts which have already been instantiated]
+FONTS = {}
+fonts_lock = threading.Lock()
+
+
+# [Function which returns the font of the timer (big digits, with shadows)]
+def get_timer_font():
+    with fonts_lock:
+        if "timer" not in FONTS:
+            glyphs = {str(i): assets.load_image(f"hud/timer_digits/timer_digit_{i}.png") for i in range(10)}
+            glyphs[":"] = assets.load_image("hud/timer_digits/colon.png")
+
+            shadows = {str(i): assets.load_image(f"hud/timer_digits/shadows/timer_digit_{i}.png") for i in range(10)}
+            shadows[":"] = assets.load_image("hud/timer_digits/shadows/colon.png")
+
+            # The cache can hold all the strings of a game session ("00:00" - "02:00")
+            FONTS["timer"] = NumericFont(glyphs, advance=24, size=(176, 100), shadows=shadows, glyphs_offset=(38,30), cache_size=128)
+        return FONTS["timer"]
+
+
+# [Function which returns the font of the HUD (the small digits of the scorers)]
+def get_hud_font():
+    with fonts_lock:
+        if "hud" not in FONTS:
+            glyphs = {str(i): assets.load_image(f"hud/digits/{i}.png") for i in range(10)}
+
+            # The space separates the two couples of digits of the "power up" countdown
+            FONTS["hud"] = NumericFont(glyphs, advance=11, size=(66, 8), advances={" ": 12})
+        return FONTS["hud"]
+
+
+# [Function which returns the string displayed by the timer]
+def get_timer_string(time_in_sec):
+    minutes, seconds = divmod(time_in_sec, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+# [Function to render all the strings of the timer in advance]
+def precompute_timer_strings(max_time):
+    '''
+    [PARAMETERS]:
+        "max_time" : maximum time (in seconds) displayed by the timer
+    '''
+    get_timer_font().precompute([get_timer_string(time_in_sec) for time_in_sec in range(max_time, -1, -1)])
@@ -0,0 +1,183 @@
+'''
+[OVERLAY COMPOSITOR]:
+This class merges a stack of transparent overlays (e.g. the full-screen shadows
+and lights which get rendered on top of the game scenario) into a single surface
+with premultiplied alpha, so that the whole stack gets blended on the destination
+surface with a single "BLEND_PREMULTIPLIED" pass instead of one pass per overlay.
+
+Blending "A" and then "B" over a destination gives the same result as blending
+"B over A" over said destination, as long as the two overlays get merged in
+premultiplied alpha (blending two transparent surfaces with the "normal" alpha
+blending would give a different result, given that the colour of the destination
+doesn't get weighted by its alpha).
+
+The merged overlay also gets split into square blocks, and each block gets cropped
+to the rect which contains its non-transparent pixels: this way, only the pixels
+which are actually covered by the overlays get blended.
+
+ /----\
+| TEST |
+ \----/
+Running this module ("python -m modules.overlay_compositor" from the "game_logic"
+folder) executes a headless "golden image" test, which compares the output of the
+compositor with the output of the overlays blitted one after the other.
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+
+
+class OverlayCompositor():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Size (in pixels) of the square blocks
+    #  the merged overlay gets split into]
+    BLOCK_SIZE = 40
+
+    # [If the cropped blocks cover at least this portion of the area
+    #  of the merged overlay, a single surface gets blitted instead]
+    SINGLE_BLIT_COVERAGE = 0.9
+
+    # [Class constructor]
+    def __init__(self, overlays, size):
+        '''
+        [PARAMETERS]:
+        "self"     : reference to the current object
+        "overlays" : list of 2-elements tuples "(surface, position)" which represent
+                     the overlays, in the order in which they have to be blended
+        "size"     : 2-elements tuple with the size of the destination surface
+        '''
+        self.overlays = overlays
+        self.size = size
+
+        # List of "(surface, position)" tuples: each surface is
+        # a (cropped) part of the merged overlay, in premultiplied alpha
+        self.pieces = []
+        self.covered_rect = pygame.Rect(0, 0, 0, 0)
+
+        self.build()
+
+
+    # [Method to (re)build the merged overlay => it has to be called
+    #  again every time the pixel format of the display changes]
+    def build(self):
+        merged_surface = OverlayCompositor.merge_premultiplied(self.overlays, self.size)
+        self.covered_rect = merged_surface.get_bounding_rect()
+
+        #  /------------------------------------------------------------\
+        # | The merged overlay gets split into blocks, and each block    |
+        # | gets cropped to its non-transparent area (completely         |
+        # | transparent blocks get discarded altogether).                |
+        #  \------------------------------------------------------------/
+        pieces = []
+        covered_area = 0
+        for x in range(self.covered_rect.left, self.covered_rect.right, OverlayCompositor.BLOCK_SIZE):
+            for y in range(self.covered_rect.top, self.covered_rect.bottom, OverlayCompositor.BLOCK_SIZE):
+                block_rect = pygame.Rect(x, y, OverlayCompositor.BLOCK_SIZE, OverlayCompositor.BLOCK_SIZE).clip(self.covered_rect)
+                cropped_rect = merged_surface.subsurface(block_rect).get_bounding_rect().move(block_rect.topleft)
+
+                if cropped_rect.width > 0 and cropped_rect.height > 0:
+                    pieces.append((merged_surface.subsurface(cropped_rect).copy(), cropped_rect.topleft))
+                    covered_area += cropped_rect.width * cropped_rect.height
+
+        # If the blocks don't save enough pixels, a single blit
+        # of the whole (cropped) merged overlay is cheaper
+        if covered_area >= OverlayCompositor.SINGLE_BLIT_COVERAGE * self.covered_rect.width * self.covered_rect.height:
+            pieces = [(merged_surface.subsurface(self.covered_rect).copy(), self.covered_rect.topleft)]
+
+        self.pieces = pieces
+
+
+    # [Method to blend the merged overlay on the destination surface]
+    def blit(self, destination):
+        destination.fblits(self.pieces, pygame.BLEND_PREMULTIPLIED)
+
+
+    # [Static method to merge a stack of overlays in premultiplied alpha]
+    @staticmethod
+    def merge_premultiplied(overlays, size):
+        '''
+        [PARAMETERS]:
+        "overlays" : list of 2-elements tuples "(surface, position)"
+        "size"     : 2-elements tuple with the size of the merged surface
+
+        [RETURN]:
+        "merged_surface" : the overlays merged into a single surface,
+                           converted to the display's pixel format
+                           (if the display has been initialized)
+        '''
+        # Without a display surface (e.g. with the "texture" render
+        # backend), the surfaces keep their own pixel format
+        is_display_set = pygame.display.get_surface() != None
+
+        merged_surface = pygame.Surface(size, pygame.SRCALPHA)
+        if is_display_set:
+            merged_surface = merged_surface.convert_alpha()
+        merged_surface.fill((0,0,0,0))
+
+        for overlay, position in overlays:
+            # (the opaque overlays - e.g. the angle blocks of the borders - need an alpha channel too)
+            overlay = overlay.convert_alpha() if is_display_set else overlay.convert(32, pygame.SRCALPHA)
+            merged_surface.blit(overlay.premul_alpha(), position, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+        return merged_surface
+
+
+# [Function which checks if the channels of two surfaces differ by at most a tolerance]
+def is_within_tolerance(surface_a, surface_b, tolerance):
+    '''
+    [RETURN]:
+    "True" if none of the RGB channels of the two surfaces differs by more than "tolerance"
+    '''
+    # |A - B| gets computed as "(A - B) + (B - A)", given that
+    # the subtractive blending clamps the negative values to 0
+    difference = surface_a.copy()
+    difference.blit(surface_b, (0,0), special_flags=pygame.BLEND_SUB)
+    reverse_difference = surface_b.copy()
+    reverse_difference.blit(surface_a, (0,0), special_flags=pygame.BLEND_SUB)
+    difference.blit(reverse_difference, (0,0), special_flags=pygame.BLEND_ADD)
+
+    within_tolerance = pygame.mask.from_threshold(difference, (0,0,0,255), (tolerance + 1, tolerance + 1, tolerance + 1, 255))
+    return within_tolerance.count() == difference.get_width() * difference.get_height()
+
+
+#  /----\
+# | TEST |
+#  \----/
+if __name__ == "__main__":
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # The test can run headless
+
+    from modules.scripts import common_definitions as cmndef
+    from modules.pogo_board import PogoBoard
+
+    TOLERANCE = 3   # Maximum difference per channel (premultiplying rounds the colours
+                    # of every merged overlay, so the rounding errors add up a little)
+
+    pygame.display.set_mode(cmndef.base_game_size)
+
+    def load_scenario_element(name):
+        return pygame.image.load(os.path.join(cmndef.assets_path, f"game_scenario/{name}.png")).convert_alpha()
+
+    # [GOLDEN IMAGE]: the background, then every overlay blitted one after the other
+    pogo_board = PogoBoard((8,8), (9,5))
+    overlays = [(side_tile.surface, side_tile.screen_position) for tile_row in pogo_board.board_borders['side_tiles'] for side_tile in tile_row]
+    overlays += [(angle_block.surface, angle_block.screen_position) for angle_block in pogo_board.board_borders['angle_blocks']]
+    overlays += [(load_scenario_element(name), (0,0)) for name in ["board_shadows", "board_upper_light", "global_shadow", "lights_and_ambience"]]
+
+    golden_image = pygame.Surface(cmndef.base_game_size).convert()
+    golden_image.blit(load_scenario_element("background"), (0,0))
+    composed_image = golden_image.copy()
+
+    for overlay, position in overlays:
+        golden_image.blit(overlay, position)
+
+    # [COMPOSED IMAGE]: the background, then the merged overlay
+    OverlayCompositor(overlays, cmndef.base_game_size).blit(composed_image)
+
+    if is_within_tolerance(golden_image, composed_image, TOLERANCE):
+        print(f"[PASSED]: the composed image matches the golden image (tolerance: {TOLERANCE})")
+    else:
+        print(f"[FAILED]: the composed image differs from the golden image by more than {TOLERANCE}")
+        raise SystemExit(1)
@@ -19,11 +19,9 @@ of the associated HUD element at every game loop iteration.
 
 # [IMPORT OF LIBRARIES]
 import pygame
-import os
-from modules.scripts import common_definitions as cmndef
-from modules.scripts.common_definitions import assets_path
-import copy     # Every "score_rect" starts as a "deepcopy" of
-                # the static "SCORE_RECT" member of the class
+from modules import assets
+from modules import numeric_renderer
+from modules import sprite_registry
 
 # LEDs offsets (relatively to the HUD graphics)
 LED_OFFSETS = [(163,28), (172,32), (176,41), (172,50), (163,54), (154,50), (150,42), (154,32)]
@@ -35,27 +33,34 @@ LED_OFFSETS = [(163,28), (172,32), (176,41), (172,50), (163,54), (154,50), (150,
 #  \-----------------------------------------------------------------------------------------------------/
 
 class PlayerScorer():
+    #  /-------------------------------------------------------------------\
+    # | [N.B.]: The surfaces among the static members of the class are      |
+    # | "None" until the first scorer gets instantiated: they get retrieved |
+    # | from the assets manager by the "load_surfaces" method, so that they |
+    # | can be converted to the display's pixel format (the display hasn't  |
+    # | been initialized yet when this module gets imported).               |
+    #  \-------------------------------------------------------------------/
     # The surface representing the slot
     # for the "speed up" power up
-    POWER_UP_SLOT_BASE_SURFACE = pygame.image.load(os.path.join(assets_path, "hud/power_up/power_up_slot.png"))
-    POWER_UP_SLOT_BASE_SHADOW = pygame.image.load(os.path.join(assets_path, "hud/power_up/power_up_slot_shadow.png"))
-    POWER_UP_SLOT_BASE_SHADOW.set_alpha(75)
-    POWER_UP_SPRITE_SURFACE = pygame.image.load(os.path.join(cmndef.assets_path,"tiles/power_up_tile_shining.png"))
+    POWER_UP_SLOT_BASE_SURFACE = None
+    POWER_UP_SLOT_BASE_SHADOW = None
+    POWER_UP_SPRITE_SURFACE = None
 
-    # Static member of the class: each of these surfaces is a digit
-    DIGITS_SURFACES = [pygame.image.load(os.path.join(assets_path, f"hud/digits/{i}.png")) for i in range(10)]
+    # [N.B.]: The digits get blitted by the "HUD font" of the numeric renderer
     SCREEN_POSITIONS = [(-5,4),(425,4),(-5,245),(425,245)]      # Screen position of the scorer associated with each
                                                                 # player. The HUD does not follow the grid-based logic
                                                                 # which is followed by the "Entity" subclasses
 
     POWER_UP_SCREEN_POSITIONS = [(44,94),(479,94),(44,207),(479,207)]     # Screen position of the "power up"/"speed up" slots
 
+    # [N.B.]: There's a scorer in each corner of the screen, so only the first four
+    # players get one (see "has_screen_position")
+
     # The base graphics for the Scorer
-    HUD_GRAPHICS = pygame.image.load(os.path.join(assets_path, "hud/hud_base.png"))
+    HUD_GRAPHICS = None
 
     # The drop shadow of the Scorer
-    DROP_SHADOW = pygame.image.load(os.path.join(assets_path, "hud/hud_drop_shadow.png"))
-    DROP_SHADOW.set_alpha(75)
+    DROP_SHADOW = None
 
     #  /----------------------------------------------------\
     # | LIST OF 2-ELEMENTS TUPLE, BOTH OF WHICH ARE SURFACES |
@@ -64,8 +69,7 @@ class PlayerScorer():
     #    resolution sprite of the player which is displayed on the left of the HUD
     #
     # 2) The second element is the surface representing the "label" relative to the player
-    PLAYER_HUD_SURFACES = [(pygame.image.load(os.path.join(assets_path, f"hud/player_hud_sprites/p{i+1}_hud_sprite.png")),
-                            pygame.image.load(os.path.join(assets_path, f"hud/player_labels/p{i+1}_label.png"))) for i in range(4)]
+    PLAYER_HUD_SURFACES = None
 
     # 6x6 rects which will be displayed when the corresponding led is turned on on the board
     LED_RECTS = [pygame.Rect(LED_OFFSETS[i][0], LED_OFFSETS[i][1], 8, 8) for i in range(8)]
@@ -82,13 +86,47 @@ class PlayerScorer():
                                                                             # greater than 3 (i % 4)
 
     # Glows for each LED
-    LED_GLOWS = [pygame.image.load(os.path.join(assets_path, f"hud/led_glows/green_glow.png")),    # The same logic explained for the
-                 pygame.image.load(os.path.join(assets_path, f"hud/led_glows/blue_glow.png")),     # colours applies for these surfaces:
-                 pygame.image.load(os.path.join(assets_path, f"hud/led_glows/red_glow.png")),      # each of them represents the "glow"
-                 pygame.image.load(os.path.join(assets_path, f"hud/led_glows/orange_glow.png"))]   # a LED emits once it is turned on
-    
+    LED_GLOWS = None
+
     # Surfaces of labels representing the "next LED to turn on"
-    LED_LABELS = [pygame.image.load(os.path.join(assets_path, f"hud/led_labels/led_{i+1}_label.png")) for i in range(8)]    
+    LED_LABELS = None
+
+    # [Class method to retrieve the surfaces among the static members of the class]
+    @classmethod
+    def load_surfaces(cls):
+        if cls.HUD_GRAPHICS != None:
+            return      # The surfaces have already been loaded
+
+        # [N.B.]: The surfaces of the assets manager are shared, so the two shadows
+        # are copied before their alpha gets modified
+        cls.POWER_UP_SLOT_BASE_SURFACE = assets.load_image("hud/power_up/power_up_slot.png")
+        cls.POWER_UP_SLOT_BASE_SHADOW = assets.load_image("hud/power_up/power_up_slot_shadow.png").copy()
+        cls.POWER_UP_SLOT_BASE_SHADOW.set_alpha(75)
+        cls.POWER_UP_SPRITE_SURFACE = assets.load_image("tiles/power_up_tile_shining.png")
+
+        cls.DROP_SHADOW = assets.load_image("hud/hud_drop_shadow.png").copy()
+        cls.DROP_SHADOW.set_alpha(75)
+
+        cls.PLAYER_HUD_SURFACES = [(assets.load_image(f"hud/player_hud_sprites/p{i+1}_hud_sprite.png"),
+                                    assets.load_image(f"hud/player_labels/p{i+1}_label.png")) for i in range(sprite_registry.PLAYER_LOOKS_NUM)]
+
+        cls.LED_GLOWS = [assets.load_image("hud/led_glows/green_glow.png"),    # The same logic explained for the
+                         assets.load_image("hud/led_glows/blue_glow.png"),     # colours applies for these surfaces:
+                         assets.load_image("hud/led_glows/red_glow.png"),      # each of them represents the "glow"
+                         assets.load_image("hud/led_glows/orange_glow.png")]   # a LED emits once it is turned on
+
+        cls.LED_LABELS = [assets.load_image(f"hud/led_labels/led_{i+1}_label.png") for i in range(8)]
+
+        # The "HUD_GRAPHICS" get loaded last, given that
+        # they're used to check if the loading has happened
+        cls.HUD_GRAPHICS = assets.load_image("hud/hud_base.png")
+
+
+    # [Static method which checks if there's a position on the screen for the scorer of a player]
+    @staticmethod
+    def has_screen_position(player_id):
+        return player_id <= len(PlayerScorer.SCREEN_POSITIONS)
+
 
     # [CLASS CONSTRUCTOR]
     def __init__(self, player_ref):
@@ -96,22 +134,68 @@ class PlayerScorer():
         [PARAMETERS]:
         "self"       : reference to the current object
         "player_ref" : reference to the player associated with the current scorer
+                       (or to the latest snapshot of said player - see the
+                       "update_player" method)
         '''
+        PlayerScorer.load_surfaces()
+
         self.player_ref = player_ref
         self.screen_position = PlayerScorer.SCREEN_POSITIONS[player_ref.player_id - 1]
         self.power_up_screen_position = PlayerScorer.POWER_UP_SCREEN_POSITIONS[player_ref.player_id - 1]
-        self.surface = None
-        self.power_up_surface = None    # The surface representing the "power up"/"speed up" slot
+
+        #  /------------------------------------------------------------------\
+        # | The two surfaces get allocated just once, and they get composed    |
+        # | again only when the state which determines how they look changes   |
+        # | (see the "get_surface_state" and "get_power_up_surface_state"      |
+        # | methods): at every other game loop iteration they're just blitted. |
+        #  \------------------------------------------------------------------/
+        self.surface = pygame.Surface((221, 118), pygame.SRCALPHA)
+        self.power_up_surface = pygame.Surface((149, 66), pygame.SRCALPHA)    # The surface representing the
+                                                                            # "power up"/"speed up" slot
+
+        # States with which the two surfaces have been composed
+        # ("None" => the surface hasn't been composed yet)
+        self.surface_state = None
+        self.power_up_surface_state = None
         self.compute_surface()
 
 
+    # [Method to update the player whose state gets shown by the scorer => the
+    #  render stage passes the snapshot of the player of every new tick, so the
+    #  scorer never reads a player which is being updated by the simulation]
+    def update_player(self, player_ref):
+        self.player_ref = player_ref
+
+
+    # [Method to retrieve the state which determines how the scorer's surface looks]
+    def get_surface_state(self):
+        return (self.player_ref.score, self.player_ref.active_leds_num)
+
+
+    # [Method to retrieve the state which determines how the "power up" slot's surface looks]
+    def get_power_up_surface_state(self):
+        return (self.player_ref.has_power_up, self.player_ref.power_up_validity)
+
+
+    # [Method which returns "True" if at least one of the two surfaces has to be composed again]
+    def is_outdated(self):
+        return (self.get_surface_state() != self.surface_state or
+                self.get_power_up_surface_state() != self.power_up_surface_state)
+
+
     # [Method to compute the entity surface at each game loop]
     def compute_surface(self):
+        # The surface only gets composed again if its state has changed
+        surface_state = self.get_surface_state()
+        if surface_state == self.surface_state:
+            return
+
         #  /-----------------------------------------------------------------\
         # | The scorer's surface is composed by multiple overlapped surfaces. |
         #  \-----------------------------------------------------------------/
-        # A transparent "base surface" gets created
-        scorer_surface = pygame.Surface((221, 118), pygame.SRCALPHA)
+        # The "base surface" gets cleared (it becomes transparent)
+        scorer_surface = self.surface
+        scorer_surface.fill((0,0,0,0))
 
         # The first surface which gets blitted on the "scorer_surface"
         # is that relative to the drop shadow.
@@ -121,7 +205,7 @@ class PlayerScorer():
         # and its X-dimension gets made proportional to
         # the difference between the currently reached
         # threshold and the next
-        score_rect = copy.deepcopy(PlayerScorer.SCORE_RECT)
+        score_rect = PlayerScorer.SCORE_RECT.copy()
     
         # "score_interval" is the difference between the current
         # threshold to exceed and the last threshold that was exceeded
@@ -180,10 +264,10 @@ class PlayerScorer():
 
         # The player's "HUD sprite" gets blitted
         # on top of the scorer surface 
-        scorer_surface.blit(PlayerScorer.PLAYER_HUD_SURFACES[self.player_ref.player_id - 1][0], (11,15))
+        scorer_surface.blit(PlayerScorer.PLAYER_HUD_SURFACES[sprite_registry.get_player_look(self.player_ref.player_id) - 1][0], (11,15))
 
         # The player's label gets blitted on top of the scorer_surface
-        scorer_surface.blit(PlayerScorer.PLAYER_HUD_SURFACES[self.player_ref.player_id - 1][1], (77,19))
+        scorer_surface.blit(PlayerScorer.PLAYER_HUD_SURFACES[sprite_registry.get_player_look(self.player_ref.player_id) - 1][1], (77,19))
 
         # The "target LED" label gets blitted on top of the scorer_surface
         if self.player_ref.active_leds_num < 8:
@@ -193,14 +277,8 @@ class PlayerScorer():
             # "next LED" label which gets displayed is the "LED 8" one.
             scorer_surface.blit(PlayerScorer.LED_LABELS[-1], (70,32))
 
-        # Score string
-        score_string = str(self.player_ref.score)
-
-        # If the score string is shorter than "6", padding is added
-        score_string = "0"*(6 - len(score_string)) + score_string
-
-        for i in range(6):
-            scorer_surface.blit(PlayerScorer.DIGITS_SURFACES[int(score_string[i])],(117 + 11*i,78))
+        # Score string (if it's shorter than "6", padding is added)
+        numeric_renderer.get_hud_font().blit_text(scorer_surface, f"{self.player_ref.score:06d}", (117,78))
 
         # The LEDs' glows get blitted on top of the final scorer's surface
         for i in range(self.player_ref.active_leds_num):
@@ -209,18 +287,23 @@ class PlayerScorer():
                                  PlayerScorer.LED_RECTS[i].y - 5))    # offset, relatively to the LED's Rect,
                                                                       # said glow is centered on the specific LED's Rect
         
-        # The final composite surface gets
-        # returned to the caller
-        self.surface = scorer_surface
+        # The state with which the surface has been composed gets stored
+        self.surface_state = surface_state
 
 
     # [Method to compute the surface of the "power up" slot in the HUD]
     def compute_power_up_surface(self):
+        # The surface only gets composed again if its state has changed
+        power_up_surface_state = self.get_power_up_surface_state()
+        if power_up_surface_state == self.power_up_surface_state:
+            return
+
         #  /--------------------------------\
         # | COMPUTING THE "POWER UP" SURFACE |
         #  \--------------------------------/
-        # A transparent "base surface" gets created
-        pu_surface = pygame.Surface((149, 66), pygame.SRCALPHA)
+        # The "base surface" gets cleared (it becomes transparent)
+        pu_surface = self.power_up_surface
+        pu_surface.fill((0,0,0,0))
 
         #  /--------------------------------------------------------------\
         # | [N.B.]: The shadow will not get blitted on the composite       |
@@ -231,15 +314,12 @@ class PlayerScorer():
         # [The slot's base surface gets blitted on the composite surface]
         pu_surface.blit(PlayerScorer.POWER_UP_SLOT_BASE_SURFACE)
 
-        # String representing the power up's validity
-        power_up_validity_str = "0"*(4 - len(str(self.player_ref.power_up_validity)))+str(self.player_ref.power_up_validity)
-        
-        # The blitting the digits of the power up's validity on the "pu_surface"
-        for i in range(4):
-            j = 0 if i == 0 or i == 1 else 12
-            pu_surface.blit(PlayerScorer.DIGITS_SURFACES[int(power_up_validity_str[i])],(50 + j + 11*i,32))
+        # String representing the power up's validity (the space
+        # separates the two couples of digits, like a "00 15" clock)
+        power_up_validity_str = f"{self.player_ref.power_up_validity:04d}"
+        numeric_renderer.get_hud_font().blit_text(pu_surface, power_up_validity_str[:2] + " " + power_up_validity_str[2:], (50,32))
         
         # The power up graphics get blitted on top on the "pu_surface"
         pu_surface.blit(PlayerScorer.POWER_UP_SPRITE_SURFACE,(14,14))
 
-        self.power_up_surface = pu_surface
\ No newline at end of file
+        self.power_up_surface_state = power_up_surface_state
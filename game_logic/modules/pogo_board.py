@@ -16,6 +16,10 @@ we'll probably stick to the "8x8" board as initially intended).
 
 
 # [IMPORT OF LIBRARIES]
+import pygame
+from array import array
+from math import ceil
+from modules.scripts import common_definitions as cmndef
 from modules.entities.pogo_tile import PogoTile
 from modules.entities.board_border import BoardBorder
 from modules.enumerations.direction import Direction
@@ -23,6 +27,16 @@ from modules.enumerations.border_type import BorderType
 
 
 class PogoBoard():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [HIGHEST ID OF A PLAYER (THE OWNER GRID HAS A BYTE PER TILE)]
+    MAX_PLAYER_ID = 255
+
+    # [TABLES TRANSLATING THE OWNER GRID INTO BINARY DIGITS
+    #  (ONE FOR EACH PLAYER ID, BUILT WHEN FIRST NEEDED)]
+    DIGITS_TABLES = {}
+
     def __init__(self, board_dimensions, grid_position):
         '''
         [PARAMETERS]:
@@ -39,19 +53,36 @@ class PogoBoard():
         self.board_dimensions = board_dimensions
         self.grid_position = grid_position
 
+        #  /-------------------------------------------------------------------\
+        # | OWNER GRID: the board's status is a single compact grid (one byte   |
+        # | per tile, the "i * columns + j" one for the "(i,j)" tile) with the  |
+        # | ID of the player who has acquired each tile ("0" if it's free).     |
+        # | The tiles read their "player_id" from it, and the per-player views  |
+        # | of the status (counts and bitboards) get derived from it on demand. |
+        #  \-------------------------------------------------------------------/
+        self.owners = array("B", bytes(board_dimensions[0] * board_dimensions[1]))
+
         # Instantiating the "pogo tiles" and the "board borders"
         self.pogo_tiles = self.instantiate_pogo_tiles()
         self.board_borders = self.instantiate_board_borders()
 
-        # Instantiating the board's status: said "status" is
-        # a data structure which consists of a list of four
-        # matrices (each matrix corresponds with one of the
-        # four players) whose dimensions are the same as the
-        # PogoBoard, and whose elements are "0" when the
-        # corresponding player hasn't acquired the corresponding
-        # tile on the board, and "1" when the corresponding player
-        # has acquired the corresponding tile on the board
-        self.status = self.instantiate_status_mats()
+        # Top-left corner and size of the hitbox of the first tile => the hitboxes
+        # of the tiles are one cell of the grid apart from each other, so the tiles
+        # which collide with a hitbox can be computed (see "get_tile_idxs_under")
+        self.tile_hitboxes_origin = self.pogo_tiles[0][0].hitbox.topleft
+        self.tile_hitbox_size = self.pogo_tiles[0][0].hitbox.size
+
+        #  /-------------------------------------------------------------------\
+        # | CACHED BOARD SURFACE: it contains the static layer and the tiles,   |
+        # | and gets updated incrementally => only the tiles whose acquisition  |
+        # | has changed (the "dirty" tiles) get redrawn before the next frame.  |
+        #  \-------------------------------------------------------------------/
+        self.surface = None         # It gets built when the static layer gets attached
+        self.static_layer = None
+        self.dirty_tiles = []
+
+        # Latest matrix of tile owners applied by "apply_tile_owners"
+        self.applied_tile_owners = None
 
 
     # [Private method to instantiate the matrix of pogo tiles]
@@ -61,7 +92,7 @@ class PogoBoard():
         for i in range(self.board_dimensions[0]):
             row = []
             for j in range(self.board_dimensions[1]):
-                row.append(PogoTile((self.grid_position[0] + i, self.grid_position[1] + j)))
+                row.append(PogoTile((self.grid_position[0] + i, self.grid_position[1] + j), self, (i, j)))
             pogo_tiles.append(row)
         
         return pogo_tiles
@@ -99,13 +130,13 @@ class PogoBoard():
 
         # [ROW 2] = "DOWN" -> Lower border
         lower_border = []
-        for i in range(8):
+        for i in range(self.board_dimensions[0]):
             lower_border.append(BoardBorder((self.grid_position[0]+i,self.grid_position[1]+self.board_dimensions[1]), BorderType.SIDE_TILE, Direction.DOWN))
         side_tiles.append(lower_border)
 
         # [ROW 3] = "LEFT" -> Left border
         left_border = []
-        for i in range(8):
+        for i in range(self.board_dimensions[1]):
             left_border.append(BoardBorder((self.grid_position[0]-1,self.grid_position[1]+i), BorderType.SIDE_TILE, Direction.LEFT))
         side_tiles.append(left_border)
 
@@ -115,25 +146,255 @@ class PogoBoard():
         return board_borders
 
 
-    # [Method to compute the surfaces for all the tiles in the board]
-    def compute_surfaces(self):
+    # [Method which returns the indexes of the tiles whose hitboxes collide with the given hitbox]
+    def get_tile_idxs_under(self, hitbox):
+        '''
+        [PARAMETERS]:
+        "hitbox" : the hitbox (Rect) of an entity (e.g. a player)
+
+        [RETURN]:
+        "tile_idxs" : list of the indexes (i,j) of the tiles whose hitboxes collide
+                      with "hitbox" (in the same order as scanning the matrix of the
+                      tiles), computed from the position of the hitbox on the grid =>
+                      it takes the same time whatever the dimensions of the board are
+        '''
+        if hitbox.width == 0 or hitbox.height == 0:
+            return []   # An empty hitbox doesn't collide with anything
+
+        # The tile "i" collides on the "X" axis if its hitbox starts before the right
+        # side of "hitbox" and ends after its left side (the same goes for "j")
+        first_i = max((hitbox.left - self.tile_hitboxes_origin[0] - self.tile_hitbox_size[0]) // cmndef.GRID_CELL_SIZE + 1, 0)
+        last_i = min(-((self.tile_hitboxes_origin[0] - hitbox.right) // cmndef.GRID_CELL_SIZE) - 1, self.board_dimensions[0] - 1)
+        first_j = max((hitbox.top - self.tile_hitboxes_origin[1] - self.tile_hitbox_size[1]) // cmndef.GRID_CELL_SIZE + 1, 0)
+        last_j = min(-((self.tile_hitboxes_origin[1] - hitbox.bottom) // cmndef.GRID_CELL_SIZE) - 1, self.board_dimensions[1] - 1)
+
+        return [(i, j) for i in range(first_i, last_i + 1) for j in range(first_j, last_j + 1)]
+
+
+    # [Method which returns the starting positions of the players on the grid]
+    def get_starting_positions(self, players_num):
+        '''
+        [PARAMETERS]:
+        "players_num" : number of players of the match
+
+        [RETURN]:
+        "starting_positions" : list of the grid positions of the players (the
+                               one of the player with ID "k" is the "k-1" element)
+
+        The first four players start on the corners of the ring of tiles which is
+        one tile inside the borders (on the 8x8 board: "(10,6)", "(15,6)", "(10,11)"
+        and "(15,11)"), the following ones get spread evenly on the remaining tiles
+        of said ring, then on the inner rings and - at last - on the outer one.
+        '''
+        columns_cnt, rows_cnt = self.board_dimensions
+
+        # The rings of tiles (from the one inside the borders), each one clockwise
+        first_inset = 1 if columns_cnt >= 3 and rows_cnt >= 3 else 0
+        rings = []
+        for inset in list(range(first_inset, (min(columns_cnt, rows_cnt) + 1) // 2)) + ([0] if first_inset == 1 else []):
+            last_i, last_j = columns_cnt - 1 - inset, rows_cnt - 1 - inset
+            ring = [(i, inset) for i in range(inset, last_i + 1)]
+            ring += [(last_i, j) for j in range(inset + 1, last_j + 1)]
+            ring += [(i, last_j) for i in range(last_i - 1, inset - 1, -1)]
+            ring += [(inset, j) for j in range(last_j - 1, inset, -1)]
+            rings.append(list(dict.fromkeys(ring)))     # A ring with a single row (or column) has repeated tiles
+
+        # [THE CORNERS OF THE FIRST RING] => top-left, top-right, bottom-left, bottom-right
+        first_i, first_j = first_inset, first_inset
+        last_i, last_j = columns_cnt - 1 - first_inset, rows_cnt - 1 - first_inset
+        tiles = list(dict.fromkeys([(first_i, first_j), (last_i, first_j), (first_i, last_j), (last_i, last_j)]))[:players_num]
+
+        # [THE OTHER TILES OF THE RINGS] => spread evenly, one ring after the other
+        for ring in rings:
+            free_tiles = [tile for tile in ring if tile not in tiles]
+            missing_tiles_num = min(players_num - len(tiles), len(free_tiles))
+            tiles += [free_tiles[k * len(free_tiles) // missing_tiles_num] for k in range(missing_tiles_num)]
+
+        if players_num > PogoBoard.MAX_PLAYER_ID:
+            raise ValueError(f"there can't be more than {PogoBoard.MAX_PLAYER_ID} players")
+        if len(tiles) < players_num:
+            raise ValueError(f"{players_num} players don't fit on a {columns_cnt}x{rows_cnt} board")
+
+        return [(self.grid_position[0] + i, self.grid_position[1] + j) for i, j in tiles]
+
+
+    # [Method to attach the static layer (background, borders, shadows
+    #  and lights) which the tiles get composed with on the board surface]
+    def attach_static_layer(self, static_layer):
+        self.static_layer = static_layer
+        self.redraw_surface()
+
+
+    # [Method to redraw the whole board surface => it only gets called when the
+    #  static layer gets attached or rebuilt (i.e. when the display mode changes)]
+    def redraw_surface(self):
+        self.surface = self.static_layer.lower_surface.copy()
+
         for tile_row in self.pogo_tiles:
             for tile in tile_row:
                 tile.compute_surface()
+                tile.is_dirty = False
+                self.surface.blit(tile.surface, tile.screen_position)
 
+        self.static_layer.blit_upper(self.surface)
+        self.dirty_tiles = []
 
-    # [Method to instantiate the three status matrices]
-    def instantiate_status_mats(self):
-        status_mats = []
 
-        for _ in range(4):
-            matrix = []
-            for _ in range(self.board_dimensions[0]):
-                row = []
-                for _ in range(self.board_dimensions[1]):
-                    row.append(0)
-                matrix.append(row)
-        
-            status_mats.append(matrix)
+    # [Method to mark a tile as "to be redrawn" => it gets called by
+    #  the tile itself when its acquisition changes]
+    def mark_tile_dirty(self, tile):
+        # A board without a static layer only holds the logic of the
+        # board (it never gets drawn), so there's nothing to redraw
+        if self.static_layer == None:
+            return
+
+        if not tile.is_dirty:
+            tile.is_dirty = True
+            self.dirty_tiles.append(tile)
+
+
+    # [Method to acquire the tiles as in the given matrix of tile owners]
+    def apply_tile_owners(self, tile_owners):
+        '''
+        [PARAMETERS]:
+        "tile_owners" : matrix (with the same dimensions as the board) of the IDs of
+                        the players who have acquired the tiles => it's the matrix
+                        held by the snapshots of the simulation
+
+        Only the tiles whose owner has changed get marked as dirty (the rows
+        which haven't changed since the last call get skipped with a single
+        comparison).
+        '''
+        if tile_owners == self.applied_tile_owners:
+            return
+
+        for i, owners_row in enumerate(tile_owners):
+            if self.applied_tile_owners != None and owners_row == self.applied_tile_owners[i]:
+                continue
+            for tile, player_id in zip(self.pogo_tiles[i], owners_row):
+                tile.change_acquisition(player_id)
+
+        self.applied_tile_owners = tile_owners
+
+
+    # [Method to compute the surfaces for the tiles whose acquisition has changed]
+    def compute_surfaces(self):
+        '''
+        Only the "dirty" tiles get recomputed and redrawn on the board
+        surface, so the cost of this method depends on the number of
+        tiles acquired since the last call (not on the size of the board).
+
+        [RETURN]:
+        "redrawn_rects" : list of the areas of the board surface which have been redrawn
+        '''
+        redrawn_rects = []
+
+        # The surfaces of all the dirty tiles get computed first, so
+        # that the neighbouring tiles are up to date when an area
+        # of the board surface gets redrawn.
+        for tile in self.dirty_tiles:
+            tile.is_dirty = False
+
+            # Both the area of the previous sprite and the area
+            # of the new one have to be redrawn
+            previous_rect = pygame.Rect(tile.screen_position, tile.surface.get_size())
+            tile.compute_surface()
+            redrawn_rects.append(previous_rect.union(pygame.Rect(tile.screen_position, tile.surface.get_size())))
+
+        if self.surface != None:
+            for tile, tile_rect in zip(self.dirty_tiles, redrawn_rects):
+                self.redraw_area(tile, tile_rect)
+
+        self.dirty_tiles = []
+        return redrawn_rects
+
+
+    # [Method to redraw an area of the board surface around a tile]
+    def redraw_area(self, tile, area):
+        '''
+        [PARAMETERS]:
+        "tile" : the tile whose sprite has changed
+        "area" : the area (Rect) of the board surface which has to be redrawn
+
+        The sprites of the tiles are bigger than the 24x24 cells of the grid
+        (the glow of an acquired tile overlaps the neighbouring tiles), so the
+        neighbouring tiles which intersect the area get redrawn too, in the
+        same order in which they get drawn by "redraw_surface".
+        '''
+        # How many cells - at most - a tile's sprite extends for
+        reach = ceil(max(area.width, area.height) / 24)
+
+        self.surface.set_clip(area)
+        self.surface.blit(self.static_layer.lower_surface, area.topleft, area)
+
+        for i in range(max(0, tile.board_idxs[0] - reach), min(self.board_dimensions[0], tile.board_idxs[0] + reach + 1)):
+            for j in range(max(0, tile.board_idxs[1] - reach), min(self.board_dimensions[1], tile.board_idxs[1] + reach + 1)):
+                neighbour = self.pogo_tiles[i][j]
+                if area.colliderect(pygame.Rect(neighbour.screen_position, neighbour.surface.get_size())):
+                    self.surface.blit(neighbour.surface, neighbour.screen_position)
+
+        self.static_layer.blit_upper(self.surface)
+        self.surface.set_clip(None)
+
+
+    # [Method which returns the number of tiles acquired by a player (counted over the owner grid, in C)]
+    def count_owned_cells(self, player_id):
+        return self.owners.count(player_id)
+
+
+    # [Method which returns the bitboard of the tiles acquired by a player]
+    def get_owned_mask(self, player_id):
+        '''
+        [PARAMETERS]:
+        "player_id" : ID of the player ("0" for the free tiles)
+
+        [RETURN]:
+        An integer whose bit "i * columns + j" is set if the player has acquired the
+        "(i,j)" tile (as the bitboards of "RectangleClosure"): the owner grid gets
+        translated into a string of binary digits in a single pass
+        '''
+        digits = self.owners.tobytes().translate(PogoBoard.get_digits_table(player_id))
+        return int(digits[::-1], 2)
+
+
+    # [Method which frees the tiles on the perimeter of a rectangle (e.g. a closed one)]
+    def reset_perimeter(self, top_left, width, height):
+        '''
+        [PARAMETERS]:
+        "top_left" : 2-elements tuple with the indexes "(i,j)" of the top-left tile
+        "width"    : number of columns of the rectangle
+        "height"   : number of rows of the rectangle
+
+        The top and bottom rows and the left and right columns of the perimeter
+        get freed with a slice assignment each on the owner grid.
+        '''
+        columns_cnt = self.board_dimensions[1]
+        top_idx = top_left[0] * columns_cnt + top_left[1]
+        bottom_idx = top_idx + (height - 1) * columns_cnt
+
+        self.owners[top_idx:top_idx + width] = array("B", bytes(width))
+        self.owners[bottom_idx:bottom_idx + width] = array("B", bytes(width))
+        self.owners[top_idx + columns_cnt:bottom_idx:columns_cnt] = array("B", bytes(height - 2))
+        self.owners[top_idx + columns_cnt + width - 1:bottom_idx:columns_cnt] = array("B", bytes(height - 2))
+
+        # The tiles got freed without "change_acquisition" => they have to be redrawn
+        if self.static_layer != None:
+            i, j = top_left
+            for y in range(height):
+                for x in range(width):
+                    if y in (0, height - 1) or x in (0, width - 1):
+                        self.mark_tile_dirty(self.pogo_tiles[i + y][j + x])
+
+
+    # [Method which returns the matrix of the owners of the tiles (as held by the snapshots)]
+    def get_tile_owners(self):
+        columns_cnt = self.board_dimensions[1]
+        return tuple(tuple(self.owners[k:k + columns_cnt]) for k in range(0, len(self.owners), columns_cnt))
+
 
-        return(status_mats)
+    # [Static method which returns the table translating the owner grid into the binary digits of a player]
+    @staticmethod
+    def get_digits_table(player_id):
+        if player_id not in PogoBoard.DIGITS_TABLES:
+            PogoBoard.DIGITS_TABLES[player_id] = bytes(ord("1") if owner == player_id else ord("0") for owner in range(256))
+        return PogoBoard.DIGITS_TABLES[player_id]
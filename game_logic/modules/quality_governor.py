@@ -0,0 +1,240 @@
+'''
+[QUALITY GOVERNOR]:
+This class adapts the quality of the frames to the machine the game runs on:
+it keeps the times spent on the latest frames (the time actually spent on the
+frame, without the time spent waiting by the clock), and it periodically
+compares a percentile of said times with the budget of a frame (1/60th of a
+second).
+
+    1) If the frames take too long (the percentile exceeds "DOWNGRADE_RATIO"
+       of the budget), the quality gets lowered by one tier (see the
+       "QualityTier" enumeration: the tiers are cumulative).
+
+    2) If there's enough headroom again (the percentile falls below
+       "UPGRADE_RATIO" of the budget), the quality gets raised by one tier.
+
+To avoid oscillating between two tiers there's a gap between the two ratios,
+and after a change the governor waits for a whole window of frames drawn
+with the new tier before evaluating them again. Moreover, if the quality has
+to be lowered again right after it has been raised (the headroom wasn't
+enough for the higher tier), the governor waits twice as long before trying
+to raise it again (up to "MAX_UPGRADE_DELAY" frames).
+
+The tier can also be pinned (e.g. from the command line): in that case, the
+frame times are still measured, but the tier never changes. Every change gets
+printed (with the measured percentile), and the report tells how long the game
+has spent in each tier, so that the hardware can be sized accordingly.
+'''
+
+# [IMPORT OF LIBRARIES]
+import time
+from collections import deque
+from modules.enumerations.quality_tier import QualityTier
+
+
+class QualityGovernor():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Target frame rate, and halved frame rate of the "REDUCED_FRAME_RATE" tier]
+    TARGET_FRAME_RATE = 60
+    REDUCED_FRAME_RATE = 30
+
+    # [Number of frames whose times get kept (the rolling window)]
+    WINDOW_FRAMES = 120
+
+    # [Percentile of the frame times compared with the budget]
+    PERCENTILE = 95
+
+    # [Ratios of the budget beyond which the quality gets lowered and below which it gets raised]
+    DOWNGRADE_RATIO = 0.9
+    UPGRADE_RATIO = 0.5
+
+    # [Number of frames between two evaluations of the window]
+    EVALUATION_INTERVAL = 30
+
+    # [Maximum number of frames to wait before raising the quality again]
+    MAX_UPGRADE_DELAY = 60 * 60
+
+    # [In the "REDUCED_HUD_REDRAWS" tier, the scorers' panels get composed once every this many frames]
+    HUD_REDRAW_INTERVAL = 6
+
+    # [Class constructor]
+    def __init__(self, pinned_tier=None):
+        '''
+        [PARAMETERS]:
+        "self"        : reference to the current object
+        "pinned_tier" : element of the "QualityTier" enumeration (the tier never
+                        changes) or "None" (the tier adapts to the frame times)
+        '''
+        self.pinned_tier = pinned_tier
+        self.tier = pinned_tier if pinned_tier != None else QualityTier.FULL
+
+        # Budget (in ms) of a frame
+        self.frame_budget = 1000 / QualityGovernor.TARGET_FRAME_RATE
+
+        # Times (in ms) of the latest frames drawn with the current tier
+        self.frame_times = deque(maxlen=QualityGovernor.WINDOW_FRAMES)
+        self.frames_num = 0
+
+        # Number of frames drawn since the latest change, minimum number of frames
+        # to wait before raising the quality, and "True" while the latest raise
+        # hasn't been confirmed by a whole window of frames yet
+        self.frames_since_change = 0
+        self.upgrade_delay = QualityGovernor.WINDOW_FRAMES
+        self.is_upgrade_on_trial = False
+
+        # Time spent (in seconds) in each tier, and time of the latest change
+        self.start_time = time.perf_counter()
+        self.tier_start_time = self.start_time
+        self.time_per_tier = {tier: 0.0 for tier in QualityTier}
+        self.changes_num = 0
+
+
+    # [Method to record the time of a frame => it returns "True" if the tier has changed]
+    def record_frame(self, frame_time):
+        '''
+        [PARAMETERS]:
+        "frame_time" : time (in ms) spent on the frame (without the waiting time)
+        '''
+        self.frame_times.append(frame_time)
+        self.frames_num += 1
+        self.frames_since_change += 1
+
+        if self.pinned_tier != None:
+            return False
+
+        # The window gets evaluated once it's full (after a change, it only
+        # contains frames drawn with the new tier) and every few frames
+        if len(self.frame_times) < QualityGovernor.WINDOW_FRAMES or self.frames_num % QualityGovernor.EVALUATION_INTERVAL != 0:
+            return False
+
+        frame_time_percentile = self.get_frame_time_percentile()
+
+        if frame_time_percentile > self.frame_budget * QualityGovernor.DOWNGRADE_RATIO and self.tier.value < len(QualityTier) - 1:
+            # If the latest raise hasn't held, the next one gets delayed
+            if self.is_upgrade_on_trial:
+                self.upgrade_delay = min(self.upgrade_delay * 2, QualityGovernor.MAX_UPGRADE_DELAY)
+            self.is_upgrade_on_trial = False
+
+            self.change_tier(QualityTier(self.tier.value + 1), frame_time_percentile)
+            return True
+
+        # A raise which has held for a whole window gets confirmed
+        if self.is_upgrade_on_trial:
+            self.is_upgrade_on_trial = False
+            self.upgrade_delay = max(self.upgrade_delay // 2, QualityGovernor.WINDOW_FRAMES)
+
+        if (frame_time_percentile < self.frame_budget * QualityGovernor.UPGRADE_RATIO and self.tier.value > 0 and
+            self.frames_since_change >= self.upgrade_delay):
+            self.is_upgrade_on_trial = True
+            self.change_tier(QualityTier(self.tier.value - 1), frame_time_percentile)
+            return True
+
+        return False
+
+
+    # [Method which returns the "PERCENTILE"-th percentile of the frame times in the window]
+    def get_frame_time_percentile(self):
+        frame_times = sorted(self.frame_times)
+        return frame_times[min(len(frame_times) - 1, len(frame_times) * QualityGovernor.PERCENTILE // 100)]
+
+
+    # [Method to change the tier (the change gets printed)]
+    def change_tier(self, tier, frame_time_percentile):
+        current_time = time.perf_counter()
+        self.time_per_tier[self.tier] += current_time - self.tier_start_time
+        self.tier_start_time = current_time
+
+        print(f"[QUALITY] {current_time - self.start_time:8.1f} s: {self.tier.name} -> {tier.name} "
+              f"(frame time p{QualityGovernor.PERCENTILE}: {frame_time_percentile:.2f} ms, budget: {self.frame_budget:.2f} ms)")
+
+        self.tier = tier
+        self.changes_num += 1
+        self.frame_times.clear()
+        self.frames_since_change = 0
+
+
+    #  /-------------------------------------------------------------\
+    # | METHODS WHICH TELL WHAT THE CURRENT TIER ALLOWS TO THE FRAMES |
+    #  \-------------------------------------------------------------/
+    # [The global shadows and lights get drawn]
+    def draws_global_overlays(self):
+        return self.tier.value < QualityTier.NO_GLOBAL_OVERLAYS.value
+
+    # [The scorers' panels can be composed at the given frame]
+    def allows_hud_redraw(self, frame_idx):
+        return self.tier.value < QualityTier.REDUCED_HUD_REDRAWS.value or frame_idx % QualityGovernor.HUD_REDRAW_INTERVAL == 0
+
+    # [The frames get pushed at the base resolution]
+    def uses_low_resolution(self):
+        return self.tier.value >= QualityTier.LOW_RESOLUTION.value
+
+    # [Frame rate at which the game loop gets capped]
+    def get_frame_rate(self):
+        if self.tier.value >= QualityTier.REDUCED_FRAME_RATE.value:
+            return QualityGovernor.REDUCED_FRAME_RATE
+        return QualityGovernor.TARGET_FRAME_RATE
+
+
+    # [Method which returns the report on the tiers (time spent in each of them)]
+    def get_report(self):
+        current_time = time.perf_counter()
+        time_per_tier = dict(self.time_per_tier)
+        time_per_tier[self.tier] += current_time - self.tier_start_time
+        total_time = max(current_time - self.start_time, 1e-9)
+
+        lines = [f"[QUALITY REPORT]: {'pinned' if self.pinned_tier != None else 'adaptive'} tier, {self.changes_num} changes",
+                 f"{'TIER':<24}{'TIME (s)':>12}{'SHARE (%)':>12}"]
+
+        for tier in QualityTier:
+            lines.append(f"{tier.name:<24}{time_per_tier[tier]:>12.1f}{time_per_tier[tier] / total_time * 100:>12.1f}")
+
+        if len(self.frame_times) > 0:
+            lines.append(f"Frame time p{QualityGovernor.PERCENTILE} (latest frames): {self.get_frame_time_percentile():.2f} ms")
+
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # [TEST]: synthetic frame times (in ms) for each tier => the quality gets lowered
+    # until the frames fit the budget, it doesn't keep oscillating when the headroom
+    # of a tier is just enough to try the higher one, and it recovers when the load drops
+    def play(governor, frame_times_per_tier, frames_num):
+        for _ in range(frames_num):
+            governor.record_frame(frame_times_per_tier[governor.tier])
+        return governor.tier
+
+    # 1) Heavy load => the governor settles on the first tier which fits the budget
+    governor = QualityGovernor()
+    heavy_load = {QualityTier.FULL: 22, QualityTier.NO_GLOBAL_OVERLAYS: 18, QualityTier.REDUCED_HUD_REDRAWS: 17,
+                  QualityTier.LOW_RESOLUTION: 12, QualityTier.REDUCED_FRAME_RATE: 10}
+    tier = play(governor, heavy_load, 3000)
+    if tier != QualityTier.LOW_RESOLUTION:
+        print(f"[FAILED]: the heavy load settles on {tier.name} instead of LOW_RESOLUTION")
+        raise SystemExit(1)
+
+    # 2) Borderline load (the frames fit with a lot of headroom without the global overlays,
+    #    but not with them) => the failed raises get delayed more and more
+    oscillating_load = {tier: 6 for tier in QualityTier}
+    oscillating_load[QualityTier.FULL] = 20
+    governor.changes_num = 0
+    play(governor, oscillating_load, 10 * 60 * 60)
+    if governor.changes_num >= 30:
+        print(f"[FAILED]: the borderline load changes the tier {governor.changes_num} times in 10 minutes (at most 29)")
+        raise SystemExit(1)
+
+    # 3) Light load => the quality gets back to the highest tier
+    light_load = {tier: 3 for tier in QualityTier}
+    tier = play(governor, light_load, 60 * 60)
+    if tier != QualityTier.FULL:
+        print(f"[FAILED]: the light load settles on {tier.name} instead of FULL")
+        raise SystemExit(1)
+
+    # 4) Pinned tier => it never changes
+    tier = play(QualityGovernor(QualityTier.NO_GLOBAL_OVERLAYS), heavy_load, 3000)
+    if tier != QualityTier.NO_GLOBAL_OVERLAYS:
+        print(f"[FAILED]: the tier pinned to NO_GLOBAL_OVERLAYS has changed to {tier.name}")
+        raise SystemExit(1)
+
+    print("[PASSED]: the quality governor adapts to the frame times")
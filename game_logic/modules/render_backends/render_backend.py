@@ -0,0 +1,112 @@
+'''
+[GENERIC RENDER BACKEND]:
+This class models the interface through which the game loop draws a frame and
+pushes it to the display, independently of how the frame actually gets built:
+
+    1) "SoftwareBackend" => the surfaces get blitted on the "game surface",
+       whose dirty areas get copied (and scaled) to the display surface.
+
+    2) "TextureBackend"  => the surfaces get uploaded (once) as SDL textures,
+       and the whole frame gets built by copying the textures with an SDL
+       renderer (on the GPU, or with the SDL software renderer as fallback).
+
+Every position and rect is expressed in "game surface" coordinates (640x360):
+the scaling to the size of the display is up to the backend.
+'''
+
+# [IMPORT OF LIBRARIES]
+from abc import ABC, abstractmethod     # "RenderBackend" is an abstract class, so it has to
+                                        # inherit from the "ABC" class.
+
+
+class RenderBackend(ABC):
+    # [Class constructor]
+    def __init__(self, base_size, fullscreen_mode="software"):
+        '''
+        [PARAMETERS]:
+        "self"            : reference to the current object
+        "base_size"       : 2-elements tuple with the size of the game surface
+        "fullscreen_mode" : "software" (the game scales the frames) or "scaled"
+                            (SDL scales the frames) => see the "--fullscreen-mode"
+                            command-line argument
+        '''
+        self.base_size = base_size
+        self.fullscreen_mode = fullscreen_mode
+
+    # [Method to (re)open the display with the requested mode]
+    @abstractmethod
+    def set_display_mode(self, fullscreen, scaled):
+        '''
+        [PARAMETERS]:
+        "fullscreen" : "True" if the game has to be shown in fullscreen
+        "scaled"     : "True" if the window has to be scaled up (ignored in fullscreen)
+
+        [RETURN]:
+        "True" if the pixel format of the display might have changed, so the
+        surfaces composed in said format (the static layer, the overlays...)
+        have to be built again
+        '''
+        pass    # No implementation
+
+    # [Method to push the frames at the base resolution (the quality governor's "LOW_RESOLUTION" tier)]
+    @abstractmethod
+    def set_low_resolution(self, low_resolution):
+        '''
+        [PARAMETERS]:
+        "low_resolution" : "True" if the frames have to be pushed to the display at
+                           the size of the game surface (and scaled by SDL), even
+                           if the game would scale them itself
+
+        [RETURN]:
+        "True" if the pixel format of the display might have changed (see the
+        "set_display_mode" method)
+        '''
+        pass    # No implementation
+
+    # [Method to set the title and the icon of the window]
+    @abstractmethod
+    def set_caption(self, title, icon_surface):
+        pass    # No implementation
+
+    # [Method to draw the pogo board (with the static elements of the game scenario)]
+    @abstractmethod
+    def draw_board(self, pogo_board):
+        pass    # No implementation
+
+    # [Method to draw a surface]
+    @abstractmethod
+    def draw(self, surface, position=(0,0)):
+        pass    # No implementation
+
+    # [Method to draw a sequence of surfaces (a layer of the "RenderList")]
+    @abstractmethod
+    def draw_sequence(self, blit_sequence, surface_states):
+        '''
+        [PARAMETERS]:
+        "blit_sequence"  : list of "(surface, position)" couples, in drawing order
+        "surface_states" : list of the states of the surfaces (any value which changes
+                           when the content of a surface changes: the surfaces which get
+                           modified in place - e.g. the scorers' panels - get uploaded
+                           again by the texture backend when their state changes)
+        '''
+        pass    # No implementation
+
+    # [Method to draw a stack of overlays merged by an "OverlayCompositor"]
+    @abstractmethod
+    def draw_overlays(self, overlay_compositor):
+        pass    # No implementation
+
+    # [Method to mark several areas of the frame as changed]
+    @abstractmethod
+    def add_rects(self, rects):
+        pass    # No implementation
+
+    # [Method to request the whole frame to be pushed to the display]
+    @abstractmethod
+    def request_full_update(self):
+        pass    # No implementation
+
+    # [Method to push the frame to the display]
+    @abstractmethod
+    def present(self):
+        pass    # No implementation
@@ -0,0 +1,115 @@
+'''
+[SOFTWARE RENDER BACKEND]:
+This backend builds each frame by blitting the surfaces on the "game surface"
+(a 640x360 surface, in the display's pixel format): only the areas which have
+changed since the previous frame get pushed to the display surface by the
+"DirtyRectRenderer" (scaled to the display's size, if the game is shown in
+fullscreen).
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+from modules.scripts import common_definitions as cmndef
+from modules.dirty_rect_renderer import DirtyRectRenderer
+from modules.render_backends.render_backend import RenderBackend
+
+
+class SoftwareBackend(RenderBackend):
+    # [Class constructor]
+    def __init__(self, base_size, fullscreen_mode="software"):
+        super().__init__(base_size, fullscreen_mode)
+
+        self.screen = pygame.display.set_mode(base_size)
+
+        # The "game_surface" is the surface on which all of the game graphics will be
+        # rendered on. It gets used in place of the "screen" Surface object, for it
+        # will be properly resized according to the window size at every game loop cycle.
+        self.game_surface = pygame.Surface(base_size)
+
+        # The "display renderer" pushes to the display only the areas of the
+        # "game_surface" which have changed since the previous frame (the whole
+        # frame gets pushed only when too much of it has changed)
+        self.display_renderer = DirtyRectRenderer(base_size)
+
+        # Display mode requested by the game loop (the display gets opened
+        # again with said mode when the resolution gets lowered or restored)
+        self.fullscreen = False
+        self.scaled = False
+        self.low_resolution = False
+
+
+    # [Method to (re)open the display with the requested mode]
+    def set_display_mode(self, fullscreen, scaled):
+        self.fullscreen = fullscreen
+        self.scaled = scaled
+
+        if fullscreen and (self.fullscreen_mode == "scaled" or self.low_resolution):
+            # The display surface keeps the size of the game surface,
+            # and SDL scales it to the size of the screen
+            self.screen = pygame.display.set_mode(self.base_size, pygame.FULLSCREEN | pygame.SCALED)
+        elif fullscreen:
+            # The frames get scaled by the "display renderer" (the fullscreen
+            # size is an integer multiple of the game surface's size)
+            self.screen = pygame.display.set_mode(cmndef.fullscreen_game_size, pygame.FULLSCREEN)
+        elif scaled:
+            self.screen = pygame.display.set_mode(self.base_size, pygame.SCALED)
+        else:
+            self.screen = pygame.display.set_mode(self.base_size)
+
+        self.display_renderer.request_full_update()
+        return True
+
+
+    # [Method to push the frames at the base resolution] => it only makes a difference
+    # in fullscreen, when the frames would be scaled by the "display renderer"
+    def set_low_resolution(self, low_resolution):
+        if low_resolution == self.low_resolution:
+            return False
+
+        self.low_resolution = low_resolution
+        if self.fullscreen and self.fullscreen_mode == "software":
+            return self.set_display_mode(self.fullscreen, self.scaled)
+        return False
+
+
+    # [Method to set the title and the icon of the window]
+    def set_caption(self, title, icon_surface):
+        pygame.display.set_caption(title)
+        pygame.display.set_icon(icon_surface)
+
+
+    # [Method to draw the pogo board] => the board's surface already contains the static
+    # elements (background, borders, shadows and lights) and the tiles, so it only takes
+    # a single full copy
+    def draw_board(self, pogo_board):
+        self.game_surface.blit(pogo_board.surface, (0,0))
+
+
+    # [Method to draw a surface]
+    def draw(self, surface, position=(0,0)):
+        self.game_surface.blit(surface, position)
+
+
+    # [Method to draw a sequence of surfaces with a single "fblits" call]
+    def draw_sequence(self, blit_sequence, surface_states):
+        self.game_surface.fblits(blit_sequence)
+
+
+    # [Method to draw a stack of overlays merged by an "OverlayCompositor"]
+    def draw_overlays(self, overlay_compositor):
+        overlay_compositor.blit(self.game_surface)
+
+
+    # [Method to mark several areas of the frame as changed]
+    def add_rects(self, rects):
+        self.display_renderer.add_rects(rects)
+
+
+    # [Method to request the whole frame to be pushed to the display]
+    def request_full_update(self):
+        self.display_renderer.request_full_update()
+
+
+    # [Method to push the frame (or the dirty parts of it) to the display]
+    def present(self):
+        self.display_renderer.present(self.game_surface, self.screen)
@@ -0,0 +1,164 @@
+'''
+[TEXTURE RENDER BACKEND]:
+This backend builds each frame with an SDL renderer ("pygame._sdl2.video"):
+every surface gets uploaded as a texture the first time it gets drawn (the
+sprites of the tiles, of the borders and of the players, the parts of the
+HUD...), and then the whole frame gets built by copying the textures, which
+the renderer scales to the size of the window.
+
+The renderer is a hardware accelerated one where available: otherwise, the
+SDL software renderer gets used (so the backend also works on the machines
+without a GPU, or with the "dummy" video driver).
+
+The window isn't opened by "pygame.display.set_mode", so there's no display
+surface: the images don't get converted to the display's pixel format (the
+textures don't depend on it).
+
+The textures are held in a "weak" dictionary (surface -> texture), so the
+texture of a surface which doesn't exist anymore (e.g. a static layer which
+has been rebuilt) gets released together with the surface. A surface which
+gets modified in place (e.g. the panel of a scorer) gets uploaded again when
+the "state" it gets drawn with changes.
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+import weakref
+from modules.scripts import common_definitions as cmndef
+from modules.render_backends.render_backend import RenderBackend
+
+# The "_sdl2" package is shipped by pygame-ce, but it isn't part of the public
+# API of pygame: if it's missing, the backend can't be instantiated
+try:
+    from pygame._sdl2 import video, sdl2
+    RENDERER_ERRORS = (pygame.error, sdl2.error)
+except ImportError:
+    video = None
+    RENDERER_ERRORS = (pygame.error,)
+
+
+class TextureBackend(RenderBackend):
+    # [Class constructor]
+    def __init__(self, base_size, fullscreen_mode="software"):
+        '''
+        [RAISES]:
+        "pygame.error" (or "pygame._sdl2.sdl2.error") if the window or the
+        renderer can't be created => the game falls back to the software backend
+        '''
+        super().__init__(base_size, fullscreen_mode)
+
+        if video == None:
+            raise pygame.error("the \"pygame._sdl2.video\" module is not available")
+
+        self.window = video.Window("", base_size)
+
+        # A hardware accelerated renderer gets requested
+        # first, then the SDL software renderer
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=1)
+            self.accelerated = True
+        except RENDERER_ERRORS:
+            try:
+                self.renderer = video.Renderer(self.window, accelerated=0)
+                self.accelerated = False
+            except RENDERER_ERRORS:
+                self.window.destroy()
+                raise
+
+        # The frames get built at the size of the game surface, and
+        # the renderer scales them to the size of the window
+        self.renderer.logical_size = base_size
+        self.renderer.draw_color = (0,0,0,255)
+        self.renderer.clear()
+
+        # [Uploaded textures] => surface -> [texture, state]
+        self.textures = weakref.WeakKeyDictionary()
+
+
+    # [Method which returns the texture of a surface (it gets uploaded the
+    #  first time the surface gets drawn, or when its "state" changes)]
+    def get_texture(self, surface, state=None):
+        entry = self.textures.get(surface)
+        if entry == None:
+            entry = [video.Texture.from_surface(self.renderer, surface), state]
+            self.textures[surface] = entry
+        elif entry[1] != state:
+            entry[0].update(surface)
+            entry[1] = state
+        return entry[0]
+
+
+    # [Method to (re)open the display with the requested mode]
+    def set_display_mode(self, fullscreen, scaled):
+        if fullscreen and self.fullscreen_mode == "scaled":
+            self.window.set_fullscreen(desktop=True)
+        elif fullscreen:
+            self.window.size = cmndef.fullscreen_game_size
+            self.window.set_fullscreen(desktop=False)
+        else:
+            self.window.set_windowed()
+            self.window.size = cmndef.fullscreen_game_size if scaled else self.base_size
+
+        # The textures don't depend on the pixel format of the display
+        return False
+
+
+    # [Method to push the frames at the base resolution] => the scaling is always
+    # left to the renderer (which draws every texture at the logical size of the
+    # game), so there's nothing to lower
+    def set_low_resolution(self, low_resolution):
+        return False
+
+
+    # [Method to set the title and the icon of the window]
+    def set_caption(self, title, icon_surface):
+        self.window.title = title
+        self.window.set_icon(icon_surface)
+
+
+    # [Method to draw the pogo board] => the static elements and the tiles get drawn
+    # in the same order in which they get composed on the board's surface (the board's
+    # surface isn't used, so the changes of the tiles don't need any upload)
+    def draw_board(self, pogo_board):
+        static_layer = pogo_board.static_layer
+        self.draw(static_layer.lower_surface)
+
+        for tile_row in pogo_board.pogo_tiles:
+            for tile in tile_row:
+                self.draw(tile.surface, tile.screen_position)
+
+        self.draw_overlays(static_layer.upper_compositor)
+
+
+    # [Method to draw a surface]
+    def draw(self, surface, position=(0,0)):
+        self.get_texture(surface).draw(dstrect=position)
+
+
+    # [Method to draw a sequence of surfaces]
+    def draw_sequence(self, blit_sequence, surface_states):
+        for (surface, position), state in zip(blit_sequence, surface_states):
+            self.get_texture(surface, state).draw(dstrect=position)
+
+
+    # [Method to draw a stack of overlays] => the overlays get drawn one after the
+    # other (the SDL software renderer doesn't support the premultiplied blending)
+    def draw_overlays(self, overlay_compositor):
+        for surface, position in overlay_compositor.overlays:
+            self.draw(surface, position)
+
+
+    # [The whole frame gets built again at every game loop
+    #  iteration, so the dirty areas don't need to be tracked]
+    def add_rects(self, rects):
+        pass
+
+
+    def request_full_update(self):
+        pass
+
+
+    # [Method to push the frame to the display]
+    def present(self):
+        self.renderer.present()
+        self.renderer.clear()
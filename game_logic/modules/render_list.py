@@ -0,0 +1,151 @@
+'''
+[RENDER LIST]:
+This class holds the elements of the frame which get drawn on top of the pogo
+board (the power ups, the players and the HUD) as a RETAINED list: each element
+gets registered once - with the layer it belongs to and a "sort key" - and then
+it only gets updated when it changes, instead of being blitted by a dedicated
+loop of the game loop.
+
+The elements of each layer are kept sorted by their sort key (e.g. the "Y"
+screen coordinate of the players, so that a player closer to the camera gets
+drawn on top of the others): a layer only gets sorted again when the sort key
+of one of its elements changes, and its "blit sequence" (the list of the
+"(surface, position)" couples of its elements) only gets rebuilt when one of
+its elements changes. Each layer gets submitted to the render backend with a
+single call (a single "Surface.fblits" with the software backend).
+
+When an element changes (or gets added/removed), the areas it covered before
+and after the change get collected as "dirty rects", so that only said areas
+get pushed to the display.
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+from modules.enumerations.render_layer import RenderLayer
+
+
+class RenderEntry():
+    # [SLOTS]: the entries of the list don't have a per-instance "__dict__"
+    __slots__ = ("layer", "surface", "position", "sort_key", "state", "rect", "insertion_idx")
+
+    # [Class constructor]
+    def __init__(self, layer, surface, position, sort_key, state, rect, insertion_idx):
+        self.layer = layer
+        self.surface = surface
+        self.position = position
+        self.sort_key = sort_key
+        self.state = state
+        self.rect = rect
+        self.insertion_idx = insertion_idx      # It breaks the ties between equal sort keys
+
+
+class RenderList():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Layers drawn BELOW the global shadows and lights]
+    WORLD_LAYERS = [RenderLayer.POWER_UPS, RenderLayer.PLAYERS]
+
+    # [Layers drawn ABOVE the global shadows and lights]
+    HUD_LAYERS = [RenderLayer.POWER_UP_SLOT_SHADOWS, RenderLayer.SCORERS, RenderLayer.POWER_UP_SLOTS,
+                  RenderLayer.TIMER, RenderLayer.GAME_OVER, RenderLayer.WAITING_FOR_PLAYERS]
+
+    # [Class constructor]
+    def __init__(self):
+        self.entries = {}       # key of the element -> "RenderEntry"
+        self.insertions_count = 0
+
+        # [LAYERS] => For each layer, its entries (in drawing order), the
+        # cached blit sequence and the states of the surfaces it contains
+        self.layers = {layer: [] for layer in RenderLayer}
+        self.blit_sequences = {layer: [] for layer in RenderLayer}
+        self.surface_states = {layer: [] for layer in RenderLayer}
+
+        self.unsorted_layers = set()    # Layers whose sort keys have changed
+        self.changed_layers = set()     # Layers whose blit sequence has to be rebuilt
+
+        self.dirty_rects = []           # Areas changed since the last "pop_dirty_rects"
+
+
+    # [Method to add an element to the list, or to update it if it's already there]
+    def update(self, key, layer, surface, position, sort_key=0, state=None, rect=None):
+        '''
+        [PARAMETERS]:
+        "key"      : any hashable object which identifies the element
+        "layer"    : the "RenderLayer" the element belongs to
+        "surface"  : the surface the element gets drawn with
+        "position" : 2-elements tuple with the position of the surface
+        "sort_key" : the elements of a layer get drawn in ascending order of their sort keys
+        "state"    : any value which changes when the content of the surface changes (for
+                     the surfaces which get modified in place - e.g. the scorers' panels)
+        "rect"     : the area covered by the element (by default, the whole surface)
+        '''
+        entry = self.entries.get(key)
+        if entry != None and entry.layer != layer:
+            self.remove(key)
+            entry = None
+
+        if entry == None:
+            rect = pygame.Rect(rect) if rect != None else pygame.Rect(position, surface.get_size())
+            entry = RenderEntry(layer, surface, position, sort_key, state, rect, self.insertions_count)
+            self.insertions_count += 1
+
+            self.entries[key] = entry
+            self.layers[layer].append(entry)
+            self.unsorted_layers.add(layer)
+            self.changed_layers.add(layer)
+            self.dirty_rects.append(rect)
+            return
+
+        # Nothing gets done for the elements which haven't changed
+        if entry.surface is not surface or entry.position != position or entry.state != state or (rect != None and entry.rect != rect):
+            self.dirty_rects.append(entry.rect)
+            entry.rect = pygame.Rect(rect) if rect != None else pygame.Rect(position, surface.get_size())
+            self.dirty_rects.append(entry.rect)
+
+            entry.surface = surface
+            entry.position = position
+            entry.state = state
+            self.changed_layers.add(layer)
+
+        if entry.sort_key != sort_key:
+            entry.sort_key = sort_key
+            self.unsorted_layers.add(layer)
+
+
+    # [Method to remove an element from the list (if it's there)]
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry != None:
+            self.layers[entry.layer].remove(entry)
+            self.changed_layers.add(entry.layer)
+            self.dirty_rects.append(entry.rect)
+
+
+    # [Method to draw some layers of the list through a render backend]
+    def draw(self, render_backend, layers):
+        '''
+        [PARAMETERS]:
+        "render_backend" : the "RenderBackend" the layers get submitted to
+        "layers"         : list of the layers to be drawn (in drawing order)
+        '''
+        for layer in layers:
+            if layer in self.unsorted_layers:
+                self.layers[layer].sort(key=lambda entry: (entry.sort_key, entry.insertion_idx))
+                self.unsorted_layers.discard(layer)
+                self.changed_layers.add(layer)
+
+            if layer in self.changed_layers:
+                self.blit_sequences[layer] = [(entry.surface, entry.position) for entry in self.layers[layer]]
+                self.surface_states[layer] = [entry.state for entry in self.layers[layer]]
+                self.changed_layers.discard(layer)
+
+            if len(self.blit_sequences[layer]) > 0:
+                render_backend.draw_sequence(self.blit_sequences[layer], self.surface_states[layer])
+
+
+    # [Method which returns (and forgets) the areas which have changed]
+    def pop_dirty_rects(self):
+        dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        return dirty_rects
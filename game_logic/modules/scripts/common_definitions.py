@@ -1,19 +1,12 @@
 # [IMPORT OF LIBRARIES]
 import os
-import pygame
-from math import floor
 from modules.enumerations.direction import Direction
+from modules import numeric_renderer
 
 # [COMMON PATHS]
 game_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Absolute path of the "game_logic" folder
 assets_path = os.path.join(game_path,"assets")                          # Absolute path of the "assets" folder
 
-# [TIMER SURFACES]
-TIMER_DIGITS_SURFACES = [pygame.image.load(os.path.join(assets_path, f"hud/timer_digits/timer_digit_{i}.png")) for i in range(10)]
-TIMER_DIGITS_SHADOWS = [pygame.image.load(os.path.join(assets_path, f"hud/timer_digits/shadows/timer_digit_{i}.png")) for i in range(10)]
-TIMER_COLON_SURFACE = pygame.image.load(os.path.join(assets_path, f"hud/timer_digits/colon.png"))
-TIMER_COLON_SHADOW = pygame.image.load(os.path.join(assets_path, f"hud/timer_digits/shadows/colon.png"))
-
 # [Base width and height for the game]
 base_game_size = (640, 360)
 
@@ -23,6 +16,14 @@ fullscreen_game_size = (1280, 720)
 # [OFFSETS FOR THE POSITIONING OF SPRITES ON THE GRID]
 grid_x_offset = 8
 
+# [SIZE (in pixels) OF THE CELLS OF THE 26x15 GRID]
+GRID_CELL_SIZE = 24
+
+# [DIMENSIONS AND GRID POSITION OF THE DEFAULT POGO BOARD]
+# (an "8x8" board starting from the "(9,5)" cell of the 26x15 grid)
+DEFAULT_BOARD_DIMENSIONS = (8, 8)
+DEFAULT_BOARD_GRID_POSITION = (9, 5)
+
 # [MAXIMUM SCORE]
 MAX_SCORE = 1950
 
@@ -40,7 +41,20 @@ def get_tile_related_screen_coords(tile_idxs, x_offset, y_offset):
     [RETURN]:
     "tile_coordinates": 2-elements tuple which represents the "on-screen" coordinates of the tile
     '''
-    return (x_offset + tile_idxs[0]*24, y_offset + tile_idxs[1]*24)
+    return (x_offset + tile_idxs[0]*GRID_CELL_SIZE, y_offset + tile_idxs[1]*GRID_CELL_SIZE)
+
+# Function which calculates the grid position of a pogo board centered where the default board is
+def get_board_grid_position(board_dimensions):
+    '''
+    [ARGUMENT]:
+    "board_dimensions": 2-elements tuple with the dimensions of the board (see "PogoBoard")
+
+    [RETURN]:
+    "grid_position": 2-elements tuple with the indexes of the top-left cell of the board
+                     in the 26x15 grid (the board can extend outside of the grid)
+    '''
+    return (DEFAULT_BOARD_GRID_POSITION[0] + (DEFAULT_BOARD_DIMENSIONS[0] - board_dimensions[0]) // 2,
+            DEFAULT_BOARD_GRID_POSITION[1] + (DEFAULT_BOARD_DIMENSIONS[1] - board_dimensions[1]) // 2)
 
 # Function which updates the timer's surface
 # (Should we define a "Timer" class? I don't think it's necessary, tbh)
@@ -49,48 +63,12 @@ def update_timer_surface(time_in_sec):
     [PARAMETER]:
         "time_in_sec" : the time which has to be displayed on the surface.
     [RETURN]:
-        "updated_surface" : the surface which has been
-                            updated in the current game loop
+        "updated_surface" : the surface of the timer => the strings of the timer
+                            get rendered (with their shadows) by the numeric
+                            renderer, which memoizes them, so the surface only
+                            gets composed once for each second displayed
     '''
-    # A transparent "base surface" gets created
-    digits_surface =  pygame.Surface((120, 40), pygame.SRCALPHA)
-
-    # The minutes get computed by dividing the
-    # seconds by 60 and applying the "floor" function
-    # (the division's result gets approximated to the
-    # immediately lower integer)
-    minutes = floor(time_in_sec/60)
-    seconds = time_in_sec - (minutes * 60)
-
-    # "String" versions of minutes and seconds
-    # (A padding gets added if necessary)
-    minutes_string = (2-len(str(minutes)))*"0" + str(minutes)
-    seconds_string = (2-len(str(seconds)))*"0" + str(seconds)
-
-    #  /--------------------------------------------------------------------------\
-    # | The surface gets constructed by blitting on the transparent "base surface" |
-    #  \--------------------------------------------------------------------------/
-    digits_surface.blit(TIMER_DIGITS_SURFACES[int(minutes_string[0])],(0,0))
-    digits_surface.blit(TIMER_DIGITS_SURFACES[int(minutes_string[1])],(24,0))
-    digits_surface.blit(TIMER_COLON_SURFACE,(48,0))
-    digits_surface.blit(TIMER_DIGITS_SURFACES[int(seconds_string[0])],(72,0))
-    digits_surface.blit(TIMER_DIGITS_SURFACES[int(seconds_string[1])],(96,0))
-
-    # A new bigger surface gets created and shadows get blitted on it
-    shadows_surface =  pygame.Surface((176, 100), pygame.SRCALPHA)
-
-    shadows_surface.blit(TIMER_DIGITS_SHADOWS[int(minutes_string[0])],(0,0))
-    shadows_surface.blit(TIMER_DIGITS_SHADOWS[int(minutes_string[1])],(24,0))
-    shadows_surface.blit(TIMER_COLON_SHADOW,(48,0))
-    shadows_surface.blit(TIMER_DIGITS_SHADOWS[int(seconds_string[0])],(72,0))
-    shadows_surface.blit(TIMER_DIGITS_SHADOWS[int(seconds_string[1])],(96,0))
-
-    # The complete shadow gets computed by blitting the digits_surface on the
-    # "shadows_surface" (so that the shadows are displayed underneath the digits)
-
-    shadows_surface.blit(digits_surface,(38,30))
-
-    return shadows_surface
+    return numeric_renderer.get_timer_font().render(numeric_renderer.get_timer_string(time_in_sec))
 
 
 # [Function to determine the direction of the 
@@ -0,0 +1,233 @@
+'''
+[RECTANGLE CLOSURE]:
+This class finds the smallest closed perimeter of a rectangle among the cells
+owned by a player, exactly as "find_smallest_rectangle" does, but on a
+"bitboard": an integer whose bit "i * columns + j" is set if the player owns
+the cell "(i,j)" of the board.
+
+For each size of rectangle (at least "minimum_size"), the mask of its perimeter
+anchored to the top-left cell of the board gets precomputed (together with the
+list of the coordinates of the perimeter): the mask of a rectangle whose top-left
+cell is "(i,j)" is the same mask shifted by "i * columns + j" bits, so testing a
+rectangle is a single "owned & mask == mask" operation.
+
+The sizes get tested in the same order as "find_smallest_rectangle" (by height,
+then by width, then by position), so the same rectangle gets returned, with the
+same "(top_left, width, height, perimeter)" tuple:
+
+    1) "find_smallest_rectangle"         => it tests every rectangle of the board.
+    2) "find_smallest_rectangle_through" => it only tests the rectangles whose
+                                            perimeter includes the given cell.
+
+The second one is what the game needs when a cell gets captured: before the
+capture, no rectangle of the player was closed (a closed rectangle gets reset
+as soon as it's found, and the captures of the other players only take cells
+away), so a rectangle closed by the capture has to include the captured cell.
+The rectangles which could include it are further narrowed down by the runs
+of owned cells through it: if it's on the top (or bottom) side of a rectangle,
+its row has to be owned for the whole width of the rectangle, and if it's on
+the left (or right) side, its column has to be owned for the whole height.
+'''
+
+
+class RectangleClosure():
+    # [Value returned when no closed rectangle has been found (as "find_smallest_rectangle" does)]
+    NOT_FOUND = ((-1, -1), 0, 0, [])
+
+    # [Class constructor]
+    def __init__(self, board_dimensions, minimum_size=(3,3)):
+        '''
+        [PARAMETERS]:
+        "self"             : reference to the current object
+        "board_dimensions" : 2-elements tuple with the number of rows and of columns
+                             of the board (as in the matrices of "find_smallest_rectangle")
+        "minimum_size"     : 2-elements tuple with the minimum height and width of the
+                             rectangles to detect
+        '''
+        self.rows_cnt, self.cols_cnt = board_dimensions
+        self.minimum_size = minimum_size
+
+        # [SHAPES] => For each "(height, width)" couple: the mask of the perimeter
+        # anchored to the top-left cell, and the coordinates of the perimeter
+        # (relative to the top-left cell, in the order of "find_smallest_rectangle")
+        self.shapes = {}
+        for height in range(minimum_size[0], self.rows_cnt + 1):
+            for width in range(minimum_size[1], self.cols_cnt + 1):
+                perimeter = []
+                perimeter.extend((0, x) for x in range(width))                      # Top
+                perimeter.extend((y, width - 1) for y in range(1, height - 1))      # Right
+                perimeter.extend((height - 1, x) for x in range(width))             # Bottom
+                perimeter.extend((y, 0) for y in range(1, height - 1))              # Left
+
+                mask = 0
+                for y, x in perimeter:
+                    mask |= 1 << (y * self.cols_cnt + x)
+                self.shapes[(height, width)] = (mask, perimeter)
+
+
+    # [Method which returns the bit of a cell in the bitboards]
+    def get_cell_bit(self, cell):
+        return 1 << (cell[0] * self.cols_cnt + cell[1])
+
+
+    # [Method which converts a matrix of "0"s and "1"s into a bitboard]
+    def to_bitboard(self, matrix):
+        owned = 0
+        for i in range(self.rows_cnt):
+            for j in range(self.cols_cnt):
+                if matrix[i][j] == 1:
+                    owned |= 1 << (i * self.cols_cnt + j)
+        return owned
+
+
+    # [Method which returns the mask of the perimeter of a rectangle]
+    def get_mask(self, top_left, width, height):
+        return self.shapes[(height, width)][0] << (top_left[0] * self.cols_cnt + top_left[1])
+
+
+    # [Method which returns the result of a closed rectangle (as "find_smallest_rectangle" does)]
+    def get_rectangle(self, top_left, width, height):
+        perimeter = [(top_left[0] + y, top_left[1] + x) for y, x in self.shapes[(height, width)][1]]
+        return top_left, width, height, perimeter
+
+
+    # [Method which finds the smallest closed rectangle among all the rectangles of the board]
+    def find_smallest_rectangle(self, owned):
+        '''
+        [PARAMETERS]:
+        "owned" : bitboard of the cells owned by the player
+
+        [RETURN]:
+        The same tuple returned by "find_smallest_rectangle" on the matrix of "owned"
+        '''
+        owned_cells_cnt = owned.bit_count()
+
+        for (height, width), (mask, _) in self.shapes.items():
+            # There aren't enough owned cells for the perimeter
+            if owned_cells_cnt < 2 * (height + width) - 4:
+                continue
+
+            for i in range(self.rows_cnt - height + 1):
+                for j in range(self.cols_cnt - width + 1):
+                    shifted_mask = mask << (i * self.cols_cnt + j)
+                    if owned & shifted_mask == shifted_mask:
+                        return self.get_rectangle((i, j), width, height)
+
+        return RectangleClosure.NOT_FOUND
+
+
+    # [Method which finds the smallest closed rectangle among the rectangles whose perimeter includes a cell]
+    def find_smallest_rectangle_through(self, owned, cell):
+        '''
+        [PARAMETERS]:
+        "owned" : bitboard of the cells owned by the player
+        "cell"  : 2-elements tuple with the coordinates "(i,j)" of the cell (e.g.
+                  the one which has just been captured)
+
+        [RETURN]:
+        The same tuple returned by "find_smallest_rectangle" on the matrix of "owned",
+        if the only closed rectangles of the matrix include "cell" (see above)
+        '''
+        cell_i, cell_j = cell
+        if not owned & self.get_cell_bit(cell):
+            return RectangleClosure.NOT_FOUND
+
+        # [RUNS OF OWNED CELLS THROUGH THE CELL] => from column "first_j" to column
+        # "last_j" of its row, and from row "first_i" to row "last_i" of its column
+        first_j, last_j = cell_j, cell_j
+        while first_j > 0 and owned & self.get_cell_bit((cell_i, first_j - 1)):
+            first_j -= 1
+        while last_j < self.cols_cnt - 1 and owned & self.get_cell_bit((cell_i, last_j + 1)):
+            last_j += 1
+
+        first_i, last_i = cell_i, cell_i
+        while first_i > 0 and owned & self.get_cell_bit((first_i - 1, cell_j)):
+            first_i -= 1
+        while last_i < self.rows_cnt - 1 and owned & self.get_cell_bit((last_i + 1, cell_j)):
+            last_i += 1
+
+        row_run = last_j - first_j + 1
+        column_run = last_i - first_i + 1
+
+        for height in range(self.minimum_size[0], self.rows_cnt + 1):
+            # If the column run is shorter than the height, the cell can only be
+            # on the top or bottom side, so the width can't exceed the row run
+            max_width = self.cols_cnt if height <= column_run else min(row_run, self.cols_cnt)
+
+            for width in range(self.minimum_size[1], max_width + 1):
+                top_lefts = set()
+
+                # [The cell is on the top or bottom side]
+                if width <= row_run:
+                    for i in (cell_i, cell_i - height + 1):
+                        if 0 <= i <= self.rows_cnt - height:
+                            for j in range(max(first_j, cell_j - width + 1), min(cell_j, last_j - width + 1) + 1):
+                                top_lefts.add((i, j))
+
+                # [The cell is on the left or right side]
+                if height <= column_run:
+                    for j in (cell_j, cell_j - width + 1):
+                        if 0 <= j <= self.cols_cnt - width:
+                            for i in range(max(first_i, cell_i - height + 1), min(cell_i, last_i - height + 1) + 1):
+                                top_lefts.add((i, j))
+
+                # The rectangles get tested in the order of "find_smallest_rectangle"
+                for top_left in sorted(top_lefts):
+                    mask = self.get_mask(top_left, width, height)
+                    if owned & mask == mask:
+                        return self.get_rectangle(top_left, width, height)
+
+        return RectangleClosure.NOT_FOUND
+
+
+#  /----\
+# | TEST |
+#  \----/
+if __name__ == "__main__":
+    # [DIFFERENTIAL TEST]: the results are compared with the ones of "find_smallest_rectangle"
+    import random
+    from modules.scripts.find_smallest_rectangle import find_smallest_rectangle
+
+    random.seed(0)
+
+    # 1) Random matrices (with different densities of owned cells) => every rectangle gets tested
+    for board_dimensions in [(8,8), (5,9), (12,7)]:
+        rectangle_closure = RectangleClosure(board_dimensions, (3,3))
+        for density in [0.3, 0.6, 0.8, 0.95]:
+            for _ in range(300):
+                matrix = [[1 if random.random() < density else 0 for _ in range(board_dimensions[1])] for _ in range(board_dimensions[0])]
+                expected = find_smallest_rectangle(matrix, (3,3))
+                if rectangle_closure.find_smallest_rectangle(rectangle_closure.to_bitboard(matrix)) != expected:
+                    print(f"[FAILED]: different rectangle found on the {board_dimensions} matrix {matrix}")
+                    raise SystemExit(1)
+
+    # 2) Random captures (as in a game: a closed rectangle gets reset right away)
+    #    => only the rectangles through the captured cell get tested
+    for board_dimensions in [(8,8), (6,10)]:
+        rectangle_closure = RectangleClosure(board_dimensions, (3,3))
+        matrix = [[0] * board_dimensions[1] for _ in range(board_dimensions[0])]
+        owned = 0
+        closures_cnt = 0
+        for _ in range(20000):
+            cell = (random.randrange(board_dimensions[0]), random.randrange(board_dimensions[1]))
+            if random.random() < 0.2:
+                # The cell gets captured by another player
+                matrix[cell[0]][cell[1]] = 0
+                owned &= ~rectangle_closure.get_cell_bit(cell)
+                continue
+
+            matrix[cell[0]][cell[1]] = 1
+            owned |= rectangle_closure.get_cell_bit(cell)
+
+            expected = find_smallest_rectangle(matrix, (3,3))
+            if rectangle_closure.find_smallest_rectangle_through(owned, cell) != expected:
+                print(f"[FAILED]: different rectangle found after capturing {cell} on the matrix {matrix}")
+                raise SystemExit(1)
+
+            if expected[0] != (-1,-1):
+                closures_cnt += 1
+                for i, j in expected[3]:
+                    matrix[i][j] = 0
+                owned &= ~rectangle_closure.get_mask(expected[0], expected[1], expected[2])
+
+    print(f"[PASSED]: the same rectangles are found by \"find_smallest_rectangle\" ({closures_cnt} closures in the last game)")
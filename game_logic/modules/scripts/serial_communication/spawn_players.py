@@ -9,22 +9,37 @@ when a new connection towards a bluetooth module is successful.
 # [IMPORT OF LIBRARIES]
 from modules.scripts.serial_communication import serial_communication as sercom
 from modules.entities.player import Player
+from modules import idle_throttle
 import serial
 import threading
 
-# [FOR DEBUGGING PURPOSES] => Highest possible number of players in a same game session
+# [DEFAULT NUMBER OF PLAYERS IN A SAME GAME SESSION] => the game session starts
+# as soon as all of them have spawned (see "GameSimulation")
 MAX_PLAYERS_NUM = 4
 
+# Seconds between two attempts to detect (and connect to) a new board => the
+# thread waits on the stop event, so it still gets stopped right away
+DETECTION_INTERVAL = 0.5
+
 # [Function which adds players to the list of
 #  players when it manages to connect to the
 #  COM ports]
-def detect_players(players_list, stop_event):
+def detect_players(players_list, stop_event, starting_positions):
+    '''
+    [PARAMETERS]:
+        "players_list"       : list of the players, which the new players get appended to
+        "stop_event"         : event which stops the thread
+        "starting_positions" : grid positions of the players (see "PogoBoard.get_starting_positions")
+                               => there can be as many players as starting positions
+    '''
+    players_num = len(starting_positions)
+
     while not stop_event.is_set():
-        # If the number of known ports is < 4,
-        # the thread tries to detect a new
-        # connected port, and eventually adds it
-        # to the ports list
-        if len(sercom.COM_PORTS) < 4:
+        # If the number of known ports is lower than
+        # the number of players, the thread tries to
+        # detect a new connected port, and eventually
+        # adds it to the ports list
+        if len(sercom.COM_PORTS) < players_num:
             new_port = sercom.detect_new_COM_port(sercom.COM_PORTS)
             if len(new_port) != 0:
                 print(f"A new port has been detected: {new_port[0]}")
@@ -32,22 +47,28 @@ def detect_players(players_list, stop_event):
         #  /-----------------------------------------------------------------------------------------------------------------\
         # | The reason the while condition has not been set as "not stop_event.is_set && len(players_list) < MAX_PLAYERS_NUM" |
         # | is the fact that in the main program, the "players detecting thread" will get terminated only when each of the    |
-        # | four players will have pressed the "USER BUTTON" to declare themselves ready to start the game session.           |
+        # | players will have pressed the "USER BUTTON" to declare themselves ready to start the game session.                |
         #  \-----------------------------------------------------------------------------------------------------------------/
         # That means, this cycle will keep on executing even if all the boards
         # have been detected (until every player is in the "ready" state).
-        if len(players_list) < MAX_PLAYERS_NUM and len(players_list) < len(sercom.COM_PORTS):
+        if len(players_list) < players_num and len(players_list) < len(sercom.COM_PORTS):
             print(f"Trying to connect to the {sercom.COM_PORTS[len(players_list)]} port")
             serial_port_object = sercom.connect_bt_module(sercom.COM_PORTS[len(players_list)], 9600, 2)
             if isinstance(serial_port_object, serial.Serial):
-                players_list.append(Player(Player.STARTING_POSITIONS[len(players_list)], len(players_list) + 1, serial_port_object))
+                players_list.append(Player(starting_positions[len(players_list)], len(players_list) + 1, serial_port_object))
+
+                # The new player has to be shown right away (even if the game loop is idle)
+                idle_throttle.wake()
+
+        # The thread doesn't spin: the ports get checked again after a while
+        stop_event.wait(DETECTION_INTERVAL)
 
 
 # [Function to spawn the thread which detects players]
-def start_players_detecting_thread(players_list, stop_event):
+def start_players_detecting_thread(players_list, stop_event, starting_positions):
     thread = threading.Thread(
         target=detect_players,
-        args=(players_list, stop_event),
+        args=(players_list, stop_event, starting_positions),
         daemon=True         # ["daemon=True"]: this means the thread 
                             # will close when the main program ends
     )
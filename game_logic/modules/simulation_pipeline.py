@@ -0,0 +1,108 @@
+'''
+[SIMULATION PIPELINE]:
+This class runs the ticks of the "GameSimulation" on a dedicated thread, one
+frame ahead of the render stage: as soon as the main thread takes the frame N
+(the snapshots of its latest ticks), the ticks due for the frame N+1 (as told
+by the "FixedTimestep" accumulator) get simulated, so that they run while the
+frame N is being drawn and pushed to the display (which stays on the main
+thread, together with the events).
+
+The pipeline is bounded to a single frame: the simulation never gets more than
+one frame ahead (the next ticks only get started once the snapshots of the
+previous ones have been taken), so the latency it adds is at most one frame.
+The snapshots are immutable, and the render stage only reads them, so the two
+stages never share any mutable state.
+
+With "pipelined" set to "False", the ticks due at each frame get simulated on
+the calling thread, right before the frame gets drawn.
+
+The tick rate can be changed between two frames (e.g. it gets lowered while
+the game is idle): the accumulator counts the ticks with the new duration
+right away, and the new rate reaches the simulation together with the ticks
+of the frame, so it never changes while a tick is being simulated.
+'''
+
+# [IMPORT OF LIBRARIES]
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SimulationPipeline():
+    # [Class constructor]
+    def __init__(self, simulation, timestep, pipelined=True):
+        '''
+        [PARAMETERS]:
+        "self"       : reference to the current object
+        "simulation" : the "GameSimulation" whose ticks get simulated
+        "timestep"   : the "FixedTimestep" which tells how many ticks are due at each frame
+        "pipelined"  : "False" to simulate the ticks on the calling thread
+        '''
+        self.simulation = simulation
+        self.timestep = timestep
+        self.pipelined = pipelined
+
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation") if pipelined else None
+
+        # Number of ticks per second of the ticks which get simulated from now on
+        self.tick_rate = simulation.tick_rate
+
+        # The first frame shows the initial state (no ticks have been simulated yet)
+        self.pending_frame = self.executor.submit(self.compute_frame, 0, 0, self.tick_rate) if pipelined else None
+
+
+    # [Method to simulate the ticks of a frame]
+    def compute_frame(self, ticks_num, alpha, tick_rate):
+        '''
+        [PARAMETERS]:
+        "ticks_num" : number of ticks to simulate
+        "alpha"     : interpolation factor of the frame (see "FixedTimestep.get_alpha")
+        "tick_rate" : number of ticks per second of said ticks
+
+        [RETURN]:
+        "frame" : 3-elements tuple with the snapshot of the second-to-last tick,
+                  the snapshot of the latest tick and the interpolation factor
+        '''
+        if tick_rate != self.simulation.tick_rate:
+            self.simulation.set_tick_rate(tick_rate)
+
+        previous_snapshot, snapshot = self.simulation.advance(ticks_num)
+        return previous_snapshot, snapshot, alpha
+
+
+    # [Method which returns the next frame to draw]
+    def next_frame(self, current_time=None):
+        '''
+        [PARAMETERS]:
+        "current_time" : current time (in ms) => if "None", it gets read by the
+                         accumulator (see "FixedTimestep.advance")
+
+        [RETURN]:
+        "frame" : the frame (see "compute_frame") => if its ticks are still
+                  being simulated, the method waits for them to be completed
+
+        Any exception raised by the simulation gets raised again here.
+        '''
+        ticks_num = self.timestep.advance(current_time)
+        alpha = self.timestep.get_alpha()
+
+        if not self.pipelined:
+            return self.compute_frame(ticks_num, alpha, self.tick_rate)
+
+        frame = self.pending_frame.result()
+
+        # The ticks of the following frame get simulated while this one gets drawn
+        self.pending_frame = self.executor.submit(self.compute_frame, ticks_num, alpha, self.tick_rate)
+        return frame
+
+
+    # [Method to change the number of ticks per second (from the next frame on)]
+    def set_tick_rate(self, tick_rate):
+        if tick_rate != self.tick_rate:
+            self.tick_rate = tick_rate
+            self.timestep.set_tick_rate(tick_rate)
+
+
+    # [Method to wait for the ticks which are being simulated and stop the thread]
+    def shutdown(self):
+        if self.executor != None:
+            self.pending_frame.cancel()
+            self.executor.shutdown(wait=True)
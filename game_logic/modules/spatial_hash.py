@@ -0,0 +1,206 @@
+'''
+[SPATIAL HASH]:
+This class is the "broad phase" of the collisions: it indexes the entities by
+the cells of the 24x24 grid (a uniform grid, stored as a dictionary, so the cells
+outside of the 26x15 grid work the same way), so that the entities which a hitbox
+could touch are the ones in the cells around said hitbox, instead of all of the
+entities.
+
+Each entity gets indexed in a single cell, the one of the top-left corner of its
+hitbox (its "anchor" cell), so that moving an entity costs - at most - removing
+it from a cell and appending it to another one. The hitbox of an entity can reach
+the cells after its anchor cell (e.g. a 22x22 hitbox covers up to 2x2 cells), so
+the query of a hitbox looks in the cells it covers, and in the ones before them
+up to the farthest "reach" of the entities which have been indexed.
+
+Two hitboxes which collide share at least one pixel, so the "narrow phase" (a
+"colliderect" test) only runs on the entities found in said cells: the cost of a
+query depends on how crowded the cells around the hitbox are, not on how many
+entities (e.g. the side tiles of the borders, which grow with the board) there
+are overall. The entities which move have to be updated after each movement
+(the players do it in "update_position").
+'''
+
+
+class SpatialHash():
+    # [Class constructor]
+    def __init__(self, cell_size):
+        '''
+        [PARAMETERS]:
+        "self"      : reference to the current object
+        "cell_size" : size (in pixels) of the cells of the grid (e.g. the size of
+                      the cells of the 26x15 grid, "cmndef.GRID_CELL_SIZE")
+        '''
+        self.cell_size = cell_size
+
+        # [CELLS] => "(x,y)" indexes of a cell -> list of the entities anchored to the cell
+        # (in the order in which they've been inserted). The cells which become empty are
+        # kept, given that the entities which move keep entering them again
+        self.cells = {}
+
+        # [ANCHORS] => entity -> "(x,y)" indexes of its anchor cell
+        self.anchors = {}
+
+        # Highest number of cells (on the "X" and "Y" axis) which the hitbox of
+        # an indexed entity can reach after its anchor cell
+        self.reach_x = 0
+        self.reach_y = 0
+
+
+    # [Method to add an entity (its hitbox gets indexed where it currently is)]
+    def insert(self, entity):
+        x, y, width, height = entity.hitbox
+        cell_size = self.cell_size
+
+        # A hitbox starting on the last pixel of its anchor cell reaches the farthest
+        self.reach_x = max(self.reach_x, (width + cell_size - 2) // cell_size)
+        self.reach_y = max(self.reach_y, (height + cell_size - 2) // cell_size)
+
+        anchor = (x // cell_size, y // cell_size)
+        self.anchors[entity] = anchor
+
+        cell = self.cells.get(anchor)
+        if cell == None:
+            self.cells[anchor] = [entity]
+        else:
+            cell.append(entity)
+
+
+    # [Method to remove an entity]
+    def remove(self, entity):
+        self.cells[self.anchors.pop(entity)].remove(entity)
+
+
+    # [Method to update the anchor cell of an entity after it has moved]
+    def update(self, entity):
+        hitbox = entity.hitbox
+        anchor = (hitbox.x // self.cell_size, hitbox.y // self.cell_size)
+
+        # Most movements don't leave the cell the entity was already anchored to
+        previous_anchor = self.anchors[entity]
+        if anchor == previous_anchor:
+            return
+
+        self.cells[previous_anchor].remove(entity)
+        self.anchors[entity] = anchor
+
+        cell = self.cells.get(anchor)
+        if cell == None:
+            self.cells[anchor] = [entity]
+        else:
+            cell.append(entity)
+
+
+    # [Method to remove all the entities]
+    def clear(self):
+        self.cells = {}
+        self.anchors = {}
+        self.reach_x = 0
+        self.reach_y = 0
+
+
+    # [Method which returns the range of the cells where the entities which could touch a hitbox are anchored]
+    def get_cells_range(self, hitbox):
+        # The right and bottom sides of a "Rect" are excluded from it
+        x, y, width, height = hitbox
+        cell_size = self.cell_size
+        return (x // cell_size - self.reach_x, y // cell_size - self.reach_y,
+                (x + width - 1) // cell_size, (y + height - 1) // cell_size)
+
+
+    # [Method which returns the entities which a hitbox could touch]
+    def query(self, hitbox):
+        '''
+        [PARAMETERS]:
+        "hitbox" : the hitbox (Rect) of the query
+
+        [RETURN]:
+        "candidates" : list of the entities anchored to the cells around "hitbox",
+                       which have to be tested with "colliderect" to know if they
+                       actually collide
+        '''
+        candidates = []
+
+        cells = self.cells
+        first_x, first_y, last_x, last_y = self.get_cells_range(hitbox)
+        for x in range(first_x, last_x + 1):
+            for y in range(first_y, last_y + 1):
+                cell = cells.get((x, y))
+                if cell:
+                    candidates += cell
+
+        return candidates
+
+
+    # [Method which checks if a hitbox collides with any of the entities (it stops at the first collision)]
+    def collides_any(self, hitbox, excluded_entity=None):
+        '''
+        [PARAMETERS]:
+        "hitbox"          : the hitbox (Rect) to test
+        "excluded_entity" : entity which doesn't get tested (e.g. the one whose
+                            hitbox is "hitbox", which always collides with itself)
+        '''
+        cells = self.cells
+        first_x, first_y, last_x, last_y = self.get_cells_range(hitbox)
+        for x in range(first_x, last_x + 1):
+            for y in range(first_y, last_y + 1):
+                cell = cells.get((x, y))
+                if not cell:
+                    continue
+
+                for entity in cell:
+                    if entity is not excluded_entity and hitbox.colliderect(entity.hitbox):
+                        return True
+
+        return False
+
+
+    # [Method which returns all the entities which collide with a hitbox]
+    def collisions(self, hitbox, excluded_entity=None):
+        return [entity for entity in self.query(hitbox)
+                if entity is not excluded_entity and hitbox.colliderect(entity.hitbox)]
+
+
+#  /----\
+# | TEST |
+#  \----/
+if __name__ == "__main__":
+    # [DIFFERENTIAL TEST]: the results are compared with the ones of testing every entity
+    import random
+    import pygame
+
+    class TestEntity():
+        def __init__(self, hitbox):
+            self.hitbox = hitbox
+
+    random.seed(0)
+    spatial_hash = SpatialHash(24)
+
+    # Entities of every size (even bigger than a cell), also outside of the 26x15 grid
+    entities = [TestEntity(pygame.Rect(random.randint(-100, 700), random.randint(-100, 400),
+                                       random.choice([2, 12, 22, 24, 25, 60]), random.choice([2, 12, 22, 24, 25, 60])))
+                for _ in range(300)]
+    for entity in entities:
+        spatial_hash.insert(entity)
+
+    for _ in range(20000):
+        entity = random.choice(entities)
+        entity.hitbox.move_ip(random.randint(-30, 30), random.randint(-30, 30))
+        spatial_hash.update(entity)
+
+        if random.random() < 0.05:
+            spatial_hash.remove(entity)
+            entities.remove(entity)
+            entity = TestEntity(pygame.Rect(random.randint(-100, 700), random.randint(-100, 400), 22, 22))
+            spatial_hash.insert(entity)
+            entities.append(entity)
+
+        hitbox = pygame.Rect(random.randint(-100, 700), random.randint(-100, 400), random.randint(0, 50), random.randint(0, 50))
+        expected = [other for other in entities if other is not entity and hitbox.colliderect(other.hitbox)]
+
+        if spatial_hash.collides_any(hitbox, entity) != (len(expected) > 0) or \
+           sorted(map(id, spatial_hash.collisions(hitbox, entity))) != sorted(map(id, expected)):
+            print(f"[FAILED]: different collisions found for {hitbox}")
+            raise SystemExit(1)
+
+    print("[PASSED]: the same collisions are found by testing every entity")
@@ -0,0 +1,121 @@
+'''
+[SPRITE REGISTRY]:
+This module holds the "sprite tables" of the entities: each table is a list of
+the (shared) surfaces which can be attributed to a certain type of entity (e.g.
+the five surfaces of a "pogo tile", or the twelve animation frames of a player).
+
+The entities don't hold any surface: each of them only keeps a reference to
+its table and the index of its current sprite in said table (the "flyweight"
+pattern), so the memory held by an entity doesn't depend on how many sprites
+it can be drawn with, and the same table is shared by all the entities of the
+same type (e.g. all of the tiles of the board, however big the board is).
+
+The tables get filled with the surfaces of the assets manager, and they get
+reloaded IN PLACE by "reload_sprite_tables" (which has to be called after
+"assets.convert_loaded_images"), so that the entities which already hold a
+reference to a table get the converted surfaces too.
+'''
+
+# [IMPORT OF LIBRARIES]
+from modules import assets
+
+#  /----------------------------------------------------------------\
+# | SPRITE TABLES DEFINITIONS => name of the table -> list of the    |
+# | "(relative path, angle)" couples of the sprites it contains (the |
+# | angle is the rotation of the image - "0" for the original image) |
+#  \----------------------------------------------------------------/
+SPRITE_TABLES_DEFINITIONS = {
+    # [POGO TILE] => The index is the ID of the player who acquired the tile ("0" if the tile is free)
+    "pogo_tile" : [("tiles/pogo_tiles/empty_tile.png", 0),
+                   ("tiles/pogo_tiles/p1_tile.png", 0),
+                   ("tiles/pogo_tiles/p2_tile.png", 0),
+                   ("tiles/pogo_tiles/p3_tile.png", 0),
+                   ("tiles/pogo_tiles/p4_tile.png", 0)],
+
+    # [BOARD BORDER] => Side tile (left/right), side tile (up/down), angle block
+    "board_border" : [("tiles/border_tiles/grey_side.png", 0),
+                      ("tiles/border_tiles/grey_side.png", 90),
+                      ("tiles/border_tiles/grey_angle.png", 0)],
+
+    # [POWER UP] => A single unchanging sprite (for now)
+    "power_up" : [("tiles/power_up_tile_shining.png", 0)],
+}
+
+# [PLAYERS] => For each direction (UP, RIGHT, DOWN, LEFT - in the same order as the
+# values of the "Direction" enumeration) the three frames of the animation, so the
+# index of a frame is "direction * 3 + frame"
+PLAYER_ANIMATIONS_FOLDERS = [("back_animation", "back"),
+                             ("right_side_animation", "right_side"),
+                             ("frontal_animation", "frontal"),
+                             ("left_side_animation", "left_side")]
+
+PLAYER_ANIMATION_FRAMES_NUM = 3
+
+# [NUMBER OF "LOOKS" OF THE PLAYERS] => each look (sprites, tiles and HUD elements)
+# has been drawn for one of the four players of a match: if there are more
+# players, the looks get reused (see "get_player_look")
+PLAYER_LOOKS_NUM = 4
+
+for player_look in range(1, PLAYER_LOOKS_NUM + 1):
+    SPRITE_TABLES_DEFINITIONS[f"player_{player_look}"] = [(f"players/player_{player_look}/{folder}/{prefix}_{frame}.png", 0)
+                                                          for folder, prefix in PLAYER_ANIMATIONS_FOLDERS
+                                                          for frame in range(1, PLAYER_ANIMATION_FRAMES_NUM + 1)]
+
+# [LOADED TABLES] => name of the table -> list of surfaces
+SPRITE_TABLES = {}
+
+
+# [Function which returns the look ("1" to "PLAYER_LOOKS_NUM") of a player]
+def get_player_look(player_id):
+    '''
+    [PARAMETERS]:
+        "player_id" : ID of the player ("0" for nobody, e.g. for a free tile)
+
+    [RETURN]:
+        "player_look" : the look of the player ("0" for nobody) => the players
+                        after the fourth one look like the first ones again
+    '''
+    if player_id == 0:
+        return 0
+    return (player_id - 1) % PLAYER_LOOKS_NUM + 1
+
+
+# [Function to load the surfaces of a table from the assets manager]
+def load_sprites(table_name):
+    return [assets.load_rotated_image(path, angle) if angle != 0 else assets.load_image(path)
+            for path, angle in SPRITE_TABLES_DEFINITIONS[table_name]]
+
+
+# [Function to retrieve the (shared) sprite table of a type of entity]
+def get_sprite_table(table_name):
+    '''
+    [PARAMETERS]:
+        "table_name" : one of the keys of "SPRITE_TABLES_DEFINITIONS"
+
+    [RETURN]:
+        "sprite_table" : the list of surfaces of the table (it's the same
+                         list object for all the callers, so it must not
+                         be modified)
+    '''
+    with assets.assets_lock:
+        sprite_table = SPRITE_TABLES.get(table_name)
+        if sprite_table != None:
+            return sprite_table
+
+    # The sprites get loaded outside of the lock (so that the images can be
+    # decoded in parallel): if two threads load the same table at the same
+    # time, the first table which gets registered is the one they share
+    sprite_table = load_sprites(table_name)
+    with assets.assets_lock:
+        return SPRITE_TABLES.setdefault(table_name, sprite_table)
+
+
+# [Function to reload the surfaces of the tables which have already been loaded]
+def reload_sprite_tables():
+    '''
+    It has to be called after "assets.convert_loaded_images": the content of
+    each table gets replaced in place, so the entities keep their references.
+    '''
+    with assets.assets_lock:
+        for table_name, sprite_table in SPRITE_TABLES.items():
+            sprite_table[:] = load_sprites(table_name)
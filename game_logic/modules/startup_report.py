@@ -0,0 +1,41 @@
+'''
+[STARTUP REPORT]:
+This module records the "milestones" of the startup of the game (the end of
+the imports, the initialization of the display, the first frame pushed to the
+display, the end of the preloading of the images...), measured from the moment
+this module gets imported: it has to be the first module imported by the game,
+so that the time spent importing the other modules gets measured too.
+'''
+
+# [IMPORT OF LIBRARIES]
+import time
+
+# [START TIME] => The moment in which this module has been imported
+START_TIME = time.perf_counter()
+
+# [MILESTONES] => List of "(label, time)" couples, in the order in which they've been reached
+MILESTONES = []
+
+
+# [Function to record a milestone]
+def mark(label, milestone_time=None):
+    '''
+    [PARAMETERS]:
+        "label"          : description of the milestone
+        "milestone_time" : the "time.perf_counter()" at which the milestone has been
+                           reached (if "None", the milestone is reached right now)
+    '''
+    MILESTONES.append((label, time.perf_counter() if milestone_time == None else milestone_time))
+
+
+# [Function which returns the report on the milestones which have been reached]
+def get_report():
+    lines = ["[STARTUP REPORT]:",
+             f"{'MILESTONE':<44}{'TIME (ms)':>12}{'DELTA (ms)':>12}"]
+
+    previous_time = START_TIME
+    for label, milestone_time in sorted(MILESTONES, key=lambda milestone: milestone[1]):
+        lines.append(f"{label:<44}{(milestone_time - START_TIME) * 1000:>12.1f}{(milestone_time - previous_time) * 1000:>12.1f}")
+        previous_time = milestone_time
+
+    return "\n".join(lines)
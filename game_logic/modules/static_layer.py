@@ -0,0 +1,105 @@
+'''
+[STATIC LAYER]:
+This class pre-composes the elements of the game scenario which never change
+during a match (the background, the shadows and the "underneath part" of the
+board, the board's borders, the board's shadows and its upper light).
+
+Said elements get blitted just once - when the layer gets built - instead of
+at every game loop iteration. Given that the "pogo tiles" are positioned in
+between those elements (the tiles get drawn above the "underneath part" of the
+board, but below the borders and the board's lights), the static elements get
+split into two surfaces:
+
+    1) The "lower surface": an opaque surface (in the display's pixel format)
+       which contains everything that gets rendered below the tiles.
+
+    2) The "upper overlay": the elements which get rendered above the tiles,
+       merged by an "OverlayCompositor" into a single premultiplied overlay
+       (cropped to the areas which actually contain visible pixels).
+
+The layer has to be rebuilt whenever the board or the display mode changes
+(the pixel format of the display surface might change together with it).
+'''
+
+# [IMPORT OF LIBRARIES]
+import pygame
+from modules import assets
+from modules.scripts import common_definitions as cmndef
+from modules.overlay_compositor import OverlayCompositor
+
+
+class StaticLayer():
+    #  /----------------\
+    # | STATIC CONSTANTS |
+    #  \----------------/
+    # [Scenario elements rendered BELOW the "pogo tiles"
+    #  (in the order in which they get blitted)]
+    LOWER_SCENARIO_ELEMENTS = ["game_scenario/background.png",
+                               "game_scenario/shadows_under_the_board.png",
+                               "game_scenario/underneath_the_board.png"]
+
+    # [Scenario elements rendered ABOVE the "pogo tiles"
+    #  (the board's borders get blitted before these)]
+    UPPER_SCENARIO_ELEMENTS = ["game_scenario/board_shadows.png",
+                               "game_scenario/board_upper_light.png"]
+
+    # [Class constructor]
+    def __init__(self, pogo_board):
+        '''
+        [PARAMETERS]:
+        "self"       : reference to the current object
+        "pogo_board" : the "PogoBoard" object whose borders get composed in the layer
+        '''
+        self.pogo_board = pogo_board
+
+        # The scenario elements get loaded from the disk just once,
+        # so that rebuilding the layer (when the display mode changes)
+        # only requires the composition of the surfaces.
+        self.lower_sources = [assets.load_image(path) for path in StaticLayer.LOWER_SCENARIO_ELEMENTS]
+        self.upper_sources = [assets.load_image(path) for path in StaticLayer.UPPER_SCENARIO_ELEMENTS]
+
+        self.lower_surface = None       # Opaque surface with the elements underneath the tiles
+        self.upper_compositor = None    # Merged overlay with the elements above the tiles
+
+        self.build()
+
+
+    # [Method to (re)build the two surfaces of the layer]
+    def build(self):
+        '''
+        It has to be called again every time the display
+        mode changes, given that the surfaces get converted
+        to the pixel format of the display surface.
+        '''
+        #  /-------------------------------------------\
+        # | LOWER SURFACE => A single opaque full copy |
+        #  \-------------------------------------------/
+        lower_surface = assets.convert_to_display_format(pygame.Surface(cmndef.base_game_size))
+        for source in self.lower_sources:
+            lower_surface.blit(source, (0,0))
+
+        #  /----------------------------------------------------------------\
+        # | UPPER OVERLAY => The elements get merged in premultiplied alpha, |
+        # | so that they get blended with a single pass (and only where      |
+        # | they actually cover the pixels of the board's surface).          |
+        #  \----------------------------------------------------------------/
+        # [The borders of the board: the side tiles, then the angle blocks]
+        upper_overlays = []
+        for tile_row in self.pogo_board.board_borders['side_tiles']:
+            for side_tile in tile_row:
+                upper_overlays.append((side_tile.surface, side_tile.screen_position))
+
+        for angle_block in self.pogo_board.board_borders['angle_blocks']:
+            upper_overlays.append((angle_block.surface, angle_block.screen_position))
+
+        # [The board's shadows and the board's upper light]
+        for source in self.upper_sources:
+            upper_overlays.append((source, (0,0)))
+
+        self.upper_compositor = OverlayCompositor(upper_overlays, cmndef.base_game_size)
+        self.lower_surface = lower_surface
+
+
+    # [Method to blit the "upper part" of the layer on the destination surface]
+    def blit_upper(self, destination):
+        self.upper_compositor.blit(destination)